@@ -1,6 +1,9 @@
 rem Install wheel package
 call pip install wheel
 
+rem Prebuild the unit and time zone dictionaries shipped with the packages
+call python .\libraries\resource-generator\matchers.py
+
 rem Go through Sub-packages
 pushd .\libraries\recognizers-text\
 call CreatePackage.cmd
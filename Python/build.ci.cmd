@@ -42,6 +42,9 @@ pip install -e .\libraries\recognizers-sequence\
 
 pip install -e .\libraries\recognizers-suite\
 
+ECHO # Prebuilding Matchers
+CALL python .\libraries\resource-generator\matchers.py
+
 ECHO # Validating PEP8 style
 call flake8 . --config=.\setup.cfg
 
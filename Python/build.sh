@@ -35,6 +35,9 @@ pip install -e ./libraries/recognizers-choice/
 echo // Installing recognizers-suite
 pip install -e ./libraries/recognizers-suite/
 
+echo // Prebuilding Matchers
+python ./libraries/resource-generator/matchers.py
+
 echo // Installing Test Dependencies
 pip install -r ./tests/requirements.txt
 
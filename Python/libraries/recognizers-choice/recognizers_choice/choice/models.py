@@ -6,6 +6,7 @@ from abc import abstractmethod
 from recognizers_text.extractor import Extractor
 from recognizers_text.model import Model, ModelResult
 from recognizers_text.parser import Parser, ParseResult
+from recognizers_text.utilities import TimeBudget
 
 
 class ChoiceModel(Model):
@@ -18,11 +19,12 @@ class ChoiceModel(Model):
         self.extractor = extractor
         self.parser = parser
 
-    def parse(self, source: str):
+    def parse(self, source: str, timeout_ms: float = None):
         result = []
 
         try:
-            extract_results = self.extractor.extract(source)
+            with TimeBudget(timeout_ms):
+                extract_results = TimeBudget.run(self.extractor.extract, source, fallback=[])
             parse_results = [self.parser.parse(e) for e in extract_results]
         except Exception:
             pass
@@ -2,7 +2,7 @@
 #  Licensed under the MIT License.
 
 from enum import IntFlag
-from typing import List
+from typing import List, Iterable
 
 from recognizers_choice.choice.extractors import BooleanExtractor
 from recognizers_choice.choice.english import EnglishBooleanExtractorConfiguration
@@ -18,10 +18,21 @@ class ChoiceOptions(IntFlag):
 def recognize_boolean(query: str,
                       culture: str,
                       options: ChoiceOptions = ChoiceOptions.NONE,
-                      fallback_to_default_culture: bool = True) -> List[ModelResult]:
+                      fallback_to_default_culture: bool = True,
+                      timeout_ms: float = None) -> List[ModelResult]:
     recognizer = ChoiceRecognizer(culture, options)
     model = recognizer.get_boolean_model(culture, fallback_to_default_culture)
-    return model.parse(query)
+    return model.parse(query, timeout_ms=timeout_ms)
+
+
+def recognize_boolean_batch(queries: Iterable[str],
+                            culture: str,
+                            options: ChoiceOptions = ChoiceOptions.NONE,
+                            fallback_to_default_culture: bool = True,
+                            timeout_ms: float = None) -> List[List[ModelResult]]:
+    recognizer = ChoiceRecognizer(culture, options)
+    model = recognizer.get_boolean_model(culture, fallback_to_default_culture)
+    return model.parse_batch(queries, timeout_ms=timeout_ms)
 
 
 class ChoiceRecognizer (Recognizer[ChoiceOptions]):
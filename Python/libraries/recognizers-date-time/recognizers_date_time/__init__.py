@@ -1,5 +1,116 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
-from .date_time import *
-from .resources import *
+from recognizers_text.lazy_imports import lazy_package
+from . import date_time
+
+# Star imports resolve these names, most of which are only imported on first access
+__all__ = [
+    'AbstractYearExtractor', 'AdjustParams', 'AgnosticNumberParserFactory', 'AgnosticNumberParserType', 'AgoLaterMode',
+    'AgoLaterUtil', 'BaseDateExtractor', 'BaseDateParser', 'BaseDateParserConfiguration', 'BaseDatePeriodExtractor',
+    'BaseDatePeriodParser', 'BaseDateTime', 'BaseDateTimeExtractor', 'BaseDateTimeParser',
+    'BaseDateTimePeriodExtractor', 'BaseDateTimePeriodParser', 'BaseDurationExtractor', 'BaseDurationParser',
+    'BaseHolidayExtractor', 'BaseHolidayParser', 'BaseHolidayParserConfiguration', 'BaseMergedExtractor',
+    'BaseMergedParser', 'BaseNumberExtractor', 'BaseNumberParser', 'BaseSetExtractor', 'BaseSetParser',
+    'BaseTimeExtractor', 'BaseTimeParser', 'BaseTimePeriodExtractor', 'BaseTimePeriodParser', 'BaseTimeZoneExtractor',
+    'BaseTimeZoneParser', 'BeginEnd', 'CJKNumberParser', 'ChineseBaseDateTimeExtractor', 'ChineseCardinalExtractor',
+    'ChineseDateExtractor', 'ChineseDateExtractorConfiguration', 'ChineseDateParser', 'ChineseDateParserConfiguration',
+    'ChineseDatePeriodExtractor', 'ChineseDatePeriodExtractorConfiguration', 'ChineseDatePeriodParser',
+    'ChineseDatePeriodParserConfiguration', 'ChineseDateTime', 'ChineseDateTimeExtractor',
+    'ChineseDateTimeExtractorConfiguration', 'ChineseDateTimeParser', 'ChineseDateTimeParserConfiguration',
+    'ChineseDateTimePeriodExtractor', 'ChineseDateTimePeriodExtractorConfiguration', 'ChineseDateTimePeriodParser',
+    'ChineseDateTimePeriodParserConfiguration', 'ChineseDurationExtractor', 'ChineseDurationExtractorConfiguration',
+    'ChineseDurationNumberWithUnitParserConfiguration', 'ChineseDurationParser', 'ChineseDurationParserConfiguration',
+    'ChineseHolidayExtractorConfiguration', 'ChineseHolidayParser', 'ChineseHolidayParserConfiguration',
+    'ChineseIntegerExtractor', 'ChineseMergedExtractor', 'ChineseMergedExtractorConfiguration', 'ChineseMergedParser',
+    'ChineseMergedParserConfiguration', 'ChineseNumberExtractor', 'ChineseNumberParserConfiguration',
+    'ChineseNumberWithUnitExtractorConfiguration', 'ChineseNumberWithUnitParserConfiguration',
+    'ChineseOrdinalExtractor', 'ChineseSetExtractor', 'ChineseSetExtractorConfiguration', 'ChineseSetParser',
+    'ChineseSetParserConfiguration', 'ChineseTimeExtractor', 'ChineseTimeParser', 'ChineseTimePeriodExtractor',
+    'ChineseTimePeriodParser', 'ChineseTimePeriodParserConfiguration', 'Constants', 'Culture', 'CultureInfo',
+    'DateContext', 'DateExtractor', 'DateExtractorConfiguration', 'DateParserConfiguration',
+    'DatePeriodExtractorConfiguration', 'DatePeriodParserConfiguration', 'DateTimeExtra', 'DateTimeExtractor',
+    'DateTimeExtractorConfiguration', 'DateTimeFormatUtil', 'DateTimeListExtractor', 'DateTimeModel',
+    'DateTimeModelResult', 'DateTimeOptions', 'DateTimeOptionsConfiguration', 'DateTimeParseResult', 'DateTimeParser',
+    'DateTimeParserConfiguration', 'DateTimePeriodExtractorConfiguration', 'DateTimePeriodParserConfiguration',
+    'DateTimeRecognizer', 'DateTimeResolutionResult', 'DateTimeUtilityConfiguration', 'DateTimeZoneExtractor',
+    'DateUtils', 'DayOfWeek', 'DefinitionLoader', 'DurationExtractorConfiguration', 'DurationParserConfiguration',
+    'DurationParsingUtil', 'DutchCardinalExtractor', 'DutchCommonDateTimeParserConfiguration',
+    'DutchDateExtractorConfiguration', 'DutchDateParserConfiguration', 'DutchDatePeriodExtractorConfiguration',
+    'DutchDatePeriodParserConfiguration', 'DutchDateTime', 'DutchDateTimeExtractorConfiguration',
+    'DutchDateTimeParserConfiguration', 'DutchDateTimePeriodExtractorConfiguration',
+    'DutchDateTimePeriodParserConfiguration', 'DutchDateTimeUtilityConfiguration',
+    'DutchDurationExtractorConfiguration', 'DutchDurationParserConfiguration', 'DutchHolidayExtractorConfiguration',
+    'DutchHolidayParserConfiguration', 'DutchIntegerExtractor', 'DutchMergedExtractorConfiguration',
+    'DutchMergedParserConfiguration', 'DutchNumberParserConfiguration', 'DutchOrdinalExtractor',
+    'DutchSetExtractorConfiguration', 'DutchSetParserConfiguration', 'DutchTimeExtractorConfiguration',
+    'DutchTimeParser', 'DutchTimeParserConfiguration', 'DutchTimePeriodExtractorConfiguration',
+    'DutchTimePeriodParserConfiguration', 'DutchTimeZoneExtractorConfiguration', 'EnglishCardinalExtractor',
+    'EnglishCommonDateTimeParserConfiguration', 'EnglishDateExtractorConfiguration', 'EnglishDateParserConfiguration',
+    'EnglishDatePeriodExtractorConfiguration', 'EnglishDatePeriodParserConfiguration', 'EnglishDateTime',
+    'EnglishDateTimeExtractorConfiguration', 'EnglishDateTimeParserConfiguration',
+    'EnglishDateTimePeriodExtractorConfiguration', 'EnglishDateTimePeriodParserConfiguration',
+    'EnglishDateTimeUtilityConfiguration', 'EnglishDurationExtractorConfiguration',
+    'EnglishDurationParserConfiguration', 'EnglishHolidayExtractorConfiguration', 'EnglishHolidayParserConfiguration',
+    'EnglishIntegerExtractor', 'EnglishMergedExtractorConfiguration', 'EnglishMergedParserConfiguration',
+    'EnglishNumberParserConfiguration', 'EnglishOrdinalExtractor', 'EnglishSetExtractorConfiguration',
+    'EnglishSetParserConfiguration', 'EnglishTimeExtractorConfiguration', 'EnglishTimeParser',
+    'EnglishTimeParserConfiguration', 'EnglishTimePeriodExtractorConfiguration', 'EnglishTimePeriodParserConfiguration',
+    'EnglishTimeZoneExtractorConfiguration', 'ExtractResult', 'Extractor', 'FrenchCardinalExtractor',
+    'FrenchCommonDateTimeParserConfiguration', 'FrenchDateExtractorConfiguration', 'FrenchDateParserConfiguration',
+    'FrenchDatePeriodExtractorConfiguration', 'FrenchDatePeriodParserConfiguration', 'FrenchDateTime',
+    'FrenchDateTimeExtractorConfiguration', 'FrenchDateTimeParserConfiguration',
+    'FrenchDateTimePeriodExtractorConfiguration', 'FrenchDateTimePeriodParserConfiguration',
+    'FrenchDateTimeUtilityConfiguration', 'FrenchDurationExtractorConfiguration', 'FrenchDurationParserConfiguration',
+    'FrenchHolidayExtractorConfiguration', 'FrenchHolidayParserConfiguration', 'FrenchIntegerExtractor',
+    'FrenchMergedExtractorConfiguration', 'FrenchMergedParserConfiguration', 'FrenchNumberParserConfiguration',
+    'FrenchOrdinalExtractor', 'FrenchSetExtractorConfiguration', 'FrenchSetParserConfiguration',
+    'FrenchTimeExtractorConfiguration', 'FrenchTimeParser', 'FrenchTimeParserConfiguration',
+    'FrenchTimePeriodExtractorConfiguration', 'FrenchTimePeriodParserConfiguration',
+    'FrenchTimeZoneExtractorConfiguration', 'GermanCommonDateTimeParserConfiguration', 'GermanDateTime',
+    'GermanMergedExtractorConfiguration', 'GermanMergedParserConfiguration', 'HolidayExtractorConfiguration',
+    'HolidayFunctions', 'HolidayParserConfiguration', 'ItalianCommonDateTimeParserConfiguration', 'ItalianDateTime',
+    'ItalianMergedExtractorConfiguration', 'ItalianMergedParserConfiguration', 'MatchResult', 'MatchStrategy',
+    'MatchedIndex', 'MatchedTimeRange', 'MatchedTimeRegex', 'MatchedTimex', 'MatchingUtil',
+    'MergedExtractorConfiguration', 'MergedParserConfiguration', 'MetaData', 'Metadata', 'Model', 'ModelResult',
+    'NumConstants', 'NumberConstants', 'NumberWithUnitExtractor', 'NumberWithUnitParser', 'NumberWithUnitTokenizer',
+    'ParseResult', 'Parser', 'PortugueseCommonDateTimeParserConfiguration', 'PortugueseDateTime',
+    'PortugueseMergedExtractorConfiguration', 'PortugueseMergedParserConfiguration', 'QueryProcessor',
+    'RangeTimexComponents', 'Recognizer', 'RegExpUtility', 'ResolutionStartEnd', 'SetExtractorConfiguration',
+    'SetParserConfiguration', 'SpanishCardinalExtractor', 'SpanishCommonDateTimeParserConfiguration',
+    'SpanishDateExtractorConfiguration', 'SpanishDateParserConfiguration', 'SpanishDatePeriodExtractorConfiguration',
+    'SpanishDatePeriodParserConfiguration', 'SpanishDateTime', 'SpanishDateTimeExtractorConfiguration',
+    'SpanishDateTimeParserConfiguration', 'SpanishDateTimePeriodExtractorConfiguration', 'SpanishDateTimePeriodParser',
+    'SpanishDateTimePeriodParserConfiguration', 'SpanishDateTimeUtilityConfiguration',
+    'SpanishDurationExtractorConfiguration', 'SpanishDurationParserConfiguration',
+    'SpanishHolidayExtractorConfiguration', 'SpanishHolidayParserConfiguration', 'SpanishIntegerExtractor',
+    'SpanishMergedExtractorConfiguration', 'SpanishMergedParserConfiguration', 'SpanishNumberParserConfiguration',
+    'SpanishOrdinalExtractor', 'SpanishSetExtractorConfiguration', 'SpanishSetParserConfiguration',
+    'SpanishTimeExtractorConfiguration', 'SpanishTimeParserConfiguration', 'SpanishTimePeriodExtractorConfiguration',
+    'SpanishTimePeriodParserConfiguration', 'SpanishTimeZoneExtractorConfiguration', 'StringMatcher',
+    'TimeExtractorConfiguration', 'TimeOfDayResolution', 'TimeParserConfiguration', 'TimePeriodExtractorConfiguration',
+    'TimePeriodParserConfiguration', 'TimePeriodType', 'TimeResolutionUtils', 'TimeResult', 'TimeType',
+    'TimeTypeConstants', 'TimeZoneDefinitions', 'TimeZoneExtractorConfiguration', 'TimeZoneResolutionResult',
+    'TimeZoneUtility', 'TimexUtil', 'Token', 'abstract_year_extractor', 'base_configs', 'base_date', 'base_date_time',
+    'base_date_time_extractor', 'base_dateperiod', 'base_datetime', 'base_datetimeperiod', 'base_duration',
+    'base_holiday', 'base_merged', 'base_set', 'base_time', 'base_timeperiod', 'base_timezone', 'chinese',
+    'chinese_date_time', 'common_configs', 'constants', 'date_extractor', 'date_extractor_config', 'date_parser',
+    'date_parser_config', 'date_period_timex_type_to_suffix', 'date_time', 'date_time_extractor',
+    'date_time_recognizer', 'dateperiod_extractor', 'dateperiod_extractor_config', 'dateperiod_parser',
+    'dateperiod_parser_config', 'datetime_extractor', 'datetime_extractor_config', 'datetime_list_extractor',
+    'datetime_parser', 'datetime_parser_config', 'datetime_zone_extractor', 'datetimeperiod_extractor',
+    'datetimeperiod_extractor_config', 'datetimeperiod_parser', 'datetimeperiod_parser_config', 'duration_extractor',
+    'duration_extractor_config', 'duration_parser', 'duration_parser_config', 'dutch', 'dutch_date_time', 'english',
+    'english_date_time', 'english_time_zone', 'extractors', 'flatten', 'french', 'french_date_time', 'german',
+    'german_date_time', 'get_tokens_from_regex', 'holiday_extractor_config', 'holiday_parser', 'holiday_parser_config',
+    'italian', 'italian_date_time', 'match_with_next_prefix', 'merge_all_tokens', 'merged_extractor',
+    'merged_extractor_config', 'merged_parser', 'merged_parser_config', 'models', 'parse_chinese_dynasty_year',
+    'parsers', 'portuguese', 'portuguese_date_time', 'recognize_datetime', 'recognize_datetime_batch', 'resources',
+    'set_extractor', 'set_extractor_config', 'set_parser', 'set_parser_config', 'spanish', 'spanish_date_time',
+    'time_extractor', 'time_extractor_config', 'time_parser', 'time_parser_config', 'timeperiod_extractor',
+    'timeperiod_extractor_config', 'timeperiod_parser', 'timeperiod_parser_config', 'timezone_extractor_config',
+    'utilities'
+]
+
+# The recognizers, resources and culture specific modules are only imported when first used
+__getattr__, __dir__ = lazy_package(__name__, ['date_time', 'resources'])
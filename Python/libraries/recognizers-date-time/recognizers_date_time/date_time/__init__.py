@@ -1,6 +1,7 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
+from recognizers_text.lazy_imports import lazy_package
 from .date_time_recognizer import *
 from .constants import *
 from .models import *
@@ -19,9 +20,117 @@ from .base_set import *
 from .base_holiday import *
 from .base_merged import *
 from .base_timezone import *
-from .english import *
-from .spanish import *
-from .chinese import *
-from .french import *
-from .portuguese import *
-from .dutch import *
+
+# Star imports resolve these names, most of which are only imported on first access
+__all__ = [
+    'AbstractYearExtractor', 'AdjustParams', 'AgnosticNumberParserFactory', 'AgnosticNumberParserType', 'AgoLaterMode',
+    'AgoLaterUtil', 'BaseDateExtractor', 'BaseDateParser', 'BaseDateParserConfiguration', 'BaseDatePeriodExtractor',
+    'BaseDatePeriodParser', 'BaseDateTime', 'BaseDateTimeExtractor', 'BaseDateTimeParser',
+    'BaseDateTimePeriodExtractor', 'BaseDateTimePeriodParser', 'BaseDurationExtractor', 'BaseDurationParser',
+    'BaseHolidayExtractor', 'BaseHolidayParser', 'BaseHolidayParserConfiguration', 'BaseMergedExtractor',
+    'BaseMergedParser', 'BaseNumberExtractor', 'BaseNumberParser', 'BaseSetExtractor', 'BaseSetParser',
+    'BaseTimeExtractor', 'BaseTimeParser', 'BaseTimePeriodExtractor', 'BaseTimePeriodParser', 'BaseTimeZoneExtractor',
+    'BaseTimeZoneParser', 'BeginEnd', 'CJKNumberParser', 'ChineseBaseDateTimeExtractor', 'ChineseCardinalExtractor',
+    'ChineseDateExtractor', 'ChineseDateExtractorConfiguration', 'ChineseDateParser', 'ChineseDateParserConfiguration',
+    'ChineseDatePeriodExtractor', 'ChineseDatePeriodExtractorConfiguration', 'ChineseDatePeriodParser',
+    'ChineseDatePeriodParserConfiguration', 'ChineseDateTime', 'ChineseDateTimeExtractor',
+    'ChineseDateTimeExtractorConfiguration', 'ChineseDateTimeParser', 'ChineseDateTimeParserConfiguration',
+    'ChineseDateTimePeriodExtractor', 'ChineseDateTimePeriodExtractorConfiguration', 'ChineseDateTimePeriodParser',
+    'ChineseDateTimePeriodParserConfiguration', 'ChineseDurationExtractor', 'ChineseDurationExtractorConfiguration',
+    'ChineseDurationNumberWithUnitParserConfiguration', 'ChineseDurationParser', 'ChineseDurationParserConfiguration',
+    'ChineseHolidayExtractorConfiguration', 'ChineseHolidayParser', 'ChineseHolidayParserConfiguration',
+    'ChineseIntegerExtractor', 'ChineseMergedExtractor', 'ChineseMergedExtractorConfiguration', 'ChineseMergedParser',
+    'ChineseMergedParserConfiguration', 'ChineseNumberExtractor', 'ChineseNumberParserConfiguration',
+    'ChineseNumberWithUnitExtractorConfiguration', 'ChineseNumberWithUnitParserConfiguration',
+    'ChineseOrdinalExtractor', 'ChineseSetExtractor', 'ChineseSetExtractorConfiguration', 'ChineseSetParser',
+    'ChineseSetParserConfiguration', 'ChineseTimeExtractor', 'ChineseTimeParser', 'ChineseTimePeriodExtractor',
+    'ChineseTimePeriodParser', 'ChineseTimePeriodParserConfiguration', 'Constants', 'Culture', 'CultureInfo',
+    'DateContext', 'DateExtractor', 'DateExtractorConfiguration', 'DateParserConfiguration',
+    'DatePeriodExtractorConfiguration', 'DatePeriodParserConfiguration', 'DateTimeExtra', 'DateTimeExtractor',
+    'DateTimeExtractorConfiguration', 'DateTimeFormatUtil', 'DateTimeListExtractor', 'DateTimeModel',
+    'DateTimeModelResult', 'DateTimeOptions', 'DateTimeOptionsConfiguration', 'DateTimeParseResult', 'DateTimeParser',
+    'DateTimeParserConfiguration', 'DateTimePeriodExtractorConfiguration', 'DateTimePeriodParserConfiguration',
+    'DateTimeRecognizer', 'DateTimeResolutionResult', 'DateTimeUtilityConfiguration', 'DateTimeZoneExtractor',
+    'DateUtils', 'DayOfWeek', 'DefinitionLoader', 'DurationExtractorConfiguration', 'DurationParserConfiguration',
+    'DurationParsingUtil', 'DutchCardinalExtractor', 'DutchCommonDateTimeParserConfiguration',
+    'DutchDateExtractorConfiguration', 'DutchDateParserConfiguration', 'DutchDatePeriodExtractorConfiguration',
+    'DutchDatePeriodParserConfiguration', 'DutchDateTime', 'DutchDateTimeExtractorConfiguration',
+    'DutchDateTimeParserConfiguration', 'DutchDateTimePeriodExtractorConfiguration',
+    'DutchDateTimePeriodParserConfiguration', 'DutchDateTimeUtilityConfiguration',
+    'DutchDurationExtractorConfiguration', 'DutchDurationParserConfiguration', 'DutchHolidayExtractorConfiguration',
+    'DutchHolidayParserConfiguration', 'DutchIntegerExtractor', 'DutchMergedExtractorConfiguration',
+    'DutchMergedParserConfiguration', 'DutchNumberParserConfiguration', 'DutchOrdinalExtractor',
+    'DutchSetExtractorConfiguration', 'DutchSetParserConfiguration', 'DutchTimeExtractorConfiguration',
+    'DutchTimeParser', 'DutchTimeParserConfiguration', 'DutchTimePeriodExtractorConfiguration',
+    'DutchTimePeriodParserConfiguration', 'DutchTimeZoneExtractorConfiguration', 'EnglishCardinalExtractor',
+    'EnglishCommonDateTimeParserConfiguration', 'EnglishDateExtractorConfiguration', 'EnglishDateParserConfiguration',
+    'EnglishDatePeriodExtractorConfiguration', 'EnglishDatePeriodParserConfiguration', 'EnglishDateTime',
+    'EnglishDateTimeExtractorConfiguration', 'EnglishDateTimeParserConfiguration',
+    'EnglishDateTimePeriodExtractorConfiguration', 'EnglishDateTimePeriodParserConfiguration',
+    'EnglishDateTimeUtilityConfiguration', 'EnglishDurationExtractorConfiguration',
+    'EnglishDurationParserConfiguration', 'EnglishHolidayExtractorConfiguration', 'EnglishHolidayParserConfiguration',
+    'EnglishIntegerExtractor', 'EnglishMergedExtractorConfiguration', 'EnglishMergedParserConfiguration',
+    'EnglishNumberParserConfiguration', 'EnglishOrdinalExtractor', 'EnglishSetExtractorConfiguration',
+    'EnglishSetParserConfiguration', 'EnglishTimeExtractorConfiguration', 'EnglishTimeParser',
+    'EnglishTimeParserConfiguration', 'EnglishTimePeriodExtractorConfiguration', 'EnglishTimePeriodParserConfiguration',
+    'EnglishTimeZoneExtractorConfiguration', 'ExtractResult', 'Extractor', 'FrenchCardinalExtractor',
+    'FrenchCommonDateTimeParserConfiguration', 'FrenchDateExtractorConfiguration', 'FrenchDateParserConfiguration',
+    'FrenchDatePeriodExtractorConfiguration', 'FrenchDatePeriodParserConfiguration', 'FrenchDateTime',
+    'FrenchDateTimeExtractorConfiguration', 'FrenchDateTimeParserConfiguration',
+    'FrenchDateTimePeriodExtractorConfiguration', 'FrenchDateTimePeriodParserConfiguration',
+    'FrenchDateTimeUtilityConfiguration', 'FrenchDurationExtractorConfiguration', 'FrenchDurationParserConfiguration',
+    'FrenchHolidayExtractorConfiguration', 'FrenchHolidayParserConfiguration', 'FrenchIntegerExtractor',
+    'FrenchMergedExtractorConfiguration', 'FrenchMergedParserConfiguration', 'FrenchNumberParserConfiguration',
+    'FrenchOrdinalExtractor', 'FrenchSetExtractorConfiguration', 'FrenchSetParserConfiguration',
+    'FrenchTimeExtractorConfiguration', 'FrenchTimeParser', 'FrenchTimeParserConfiguration',
+    'FrenchTimePeriodExtractorConfiguration', 'FrenchTimePeriodParserConfiguration',
+    'FrenchTimeZoneExtractorConfiguration', 'GermanCommonDateTimeParserConfiguration',
+    'GermanMergedExtractorConfiguration', 'GermanMergedParserConfiguration', 'HolidayExtractorConfiguration',
+    'HolidayFunctions', 'HolidayParserConfiguration', 'ItalianCommonDateTimeParserConfiguration',
+    'ItalianMergedExtractorConfiguration', 'ItalianMergedParserConfiguration', 'MatchResult', 'MatchStrategy',
+    'MatchedIndex', 'MatchedTimeRange', 'MatchedTimeRegex', 'MatchedTimex', 'MatchingUtil',
+    'MergedExtractorConfiguration', 'MergedParserConfiguration', 'MetaData', 'Metadata', 'Model', 'ModelResult',
+    'NumConstants', 'NumberConstants', 'NumberWithUnitExtractor', 'NumberWithUnitParser', 'NumberWithUnitTokenizer',
+    'ParseResult', 'Parser', 'PortugueseCommonDateTimeParserConfiguration', 'PortugueseMergedExtractorConfiguration',
+    'PortugueseMergedParserConfiguration', 'QueryProcessor', 'RangeTimexComponents', 'Recognizer', 'RegExpUtility',
+    'ResolutionStartEnd', 'SetExtractorConfiguration', 'SetParserConfiguration', 'SpanishCardinalExtractor',
+    'SpanishCommonDateTimeParserConfiguration', 'SpanishDateExtractorConfiguration', 'SpanishDateParserConfiguration',
+    'SpanishDatePeriodExtractorConfiguration', 'SpanishDatePeriodParserConfiguration', 'SpanishDateTime',
+    'SpanishDateTimeExtractorConfiguration', 'SpanishDateTimeParserConfiguration',
+    'SpanishDateTimePeriodExtractorConfiguration', 'SpanishDateTimePeriodParser',
+    'SpanishDateTimePeriodParserConfiguration', 'SpanishDateTimeUtilityConfiguration',
+    'SpanishDurationExtractorConfiguration', 'SpanishDurationParserConfiguration',
+    'SpanishHolidayExtractorConfiguration', 'SpanishHolidayParserConfiguration', 'SpanishIntegerExtractor',
+    'SpanishMergedExtractorConfiguration', 'SpanishMergedParserConfiguration', 'SpanishNumberParserConfiguration',
+    'SpanishOrdinalExtractor', 'SpanishSetExtractorConfiguration', 'SpanishSetParserConfiguration',
+    'SpanishTimeExtractorConfiguration', 'SpanishTimeParserConfiguration', 'SpanishTimePeriodExtractorConfiguration',
+    'SpanishTimePeriodParserConfiguration', 'SpanishTimeZoneExtractorConfiguration', 'StringMatcher',
+    'TimeExtractorConfiguration', 'TimeOfDayResolution', 'TimeParserConfiguration', 'TimePeriodExtractorConfiguration',
+    'TimePeriodParserConfiguration', 'TimePeriodType', 'TimeResolutionUtils', 'TimeResult', 'TimeType',
+    'TimeTypeConstants', 'TimeZoneDefinitions', 'TimeZoneExtractorConfiguration', 'TimeZoneResolutionResult',
+    'TimeZoneUtility', 'TimexUtil', 'Token', 'abstract_year_extractor', 'base_configs', 'base_date',
+    'base_date_time_extractor', 'base_dateperiod', 'base_datetime', 'base_datetimeperiod', 'base_duration',
+    'base_holiday', 'base_merged', 'base_set', 'base_time', 'base_timeperiod', 'base_timezone', 'chinese',
+    'common_configs', 'constants', 'date_extractor', 'date_extractor_config', 'date_parser', 'date_parser_config',
+    'date_period_timex_type_to_suffix', 'date_time_extractor', 'date_time_recognizer', 'dateperiod_extractor',
+    'dateperiod_extractor_config', 'dateperiod_parser', 'dateperiod_parser_config', 'datetime_extractor',
+    'datetime_extractor_config', 'datetime_list_extractor', 'datetime_parser', 'datetime_parser_config',
+    'datetime_zone_extractor', 'datetimeperiod_extractor', 'datetimeperiod_extractor_config', 'datetimeperiod_parser',
+    'datetimeperiod_parser_config', 'duration_extractor', 'duration_extractor_config', 'duration_parser',
+    'duration_parser_config', 'dutch', 'english', 'extractors', 'flatten', 'french', 'german', 'get_tokens_from_regex',
+    'holiday_extractor_config', 'holiday_parser', 'holiday_parser_config', 'italian', 'match_with_next_prefix',
+    'merge_all_tokens', 'merged_extractor', 'merged_extractor_config', 'merged_parser', 'merged_parser_config',
+    'models', 'parse_chinese_dynasty_year', 'parsers', 'portuguese', 'recognize_datetime', 'recognize_datetime_batch',
+    'set_extractor', 'set_extractor_config', 'set_parser', 'set_parser_config', 'spanish', 'time_extractor',
+    'time_extractor_config', 'time_parser', 'time_parser_config', 'timeperiod_extractor', 'timeperiod_extractor_config',
+    'timeperiod_parser', 'timeperiod_parser_config', 'timezone_extractor_config', 'utilities'
+]
+
+# Each culture is imported when its first model is built, or when one of its names is accessed
+__getattr__, __dir__ = lazy_package(__name__, ['english', 'spanish', 'chinese', 'french', 'portuguese', 'dutch',
+                                               'italian', 'german'], attributes={
+    # The portuguese package doesn't export its configurations
+    'PortugueseCommonDateTimeParserConfiguration': 'portuguese.common_configs',
+    'PortugueseMergedExtractorConfiguration': 'portuguese.merged_extractor_config',
+    'PortugueseMergedParserConfiguration': 'portuguese.merged_parser_config'
+})
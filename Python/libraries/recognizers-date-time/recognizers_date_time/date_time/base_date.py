@@ -7,7 +7,7 @@ from datetime import datetime, timedelta
 
 from recognizers_date_time.date_time.abstract_year_extractor import AbstractYearExtractor
 from datedelta import datedelta
-from recognizers_text.extractor import ExtractResult
+from recognizers_text.extractor import ExtractResult, memoize_extraction
 from recognizers_text.utilities import RegExpUtility, flatten
 from recognizers_number.number import Constants as NumberConstants
 from .constants import Constants, TimeTypeConstants
@@ -225,6 +225,7 @@ class BaseDateExtractor(DateTimeExtractor, AbstractYearExtractor):
     def __init__(self, config: DateExtractorConfiguration):
         super().__init__(config)
 
+    @memoize_extraction
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         from .utilities import merge_all_tokens
         if reference is None:
@@ -10,7 +10,7 @@ from collections import namedtuple
 import regex
 from datedelta import datedelta
 
-from recognizers_text.extractor import ExtractResult, Extractor, Metadata
+from recognizers_text.extractor import ExtractResult, Extractor, Metadata, memoize_extraction
 from recognizers_date_time.date_time.date_extractor import DateExtractor
 from recognizers_number.number import BaseNumberParser, BaseNumberExtractor
 from .constants import Constants, TimeTypeConstants
@@ -222,6 +222,7 @@ class BaseDatePeriodExtractor(DateTimeExtractor):
     def __init__(self, config: DatePeriodExtractorConfiguration):
         self.config = config
 
+    @memoize_extraction
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if not reference:
             reference = datetime.now()
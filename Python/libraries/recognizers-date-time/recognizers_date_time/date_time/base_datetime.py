@@ -8,7 +8,7 @@ from collections import namedtuple
 import regex
 
 from recognizers_date_time.date_time.date_extractor import DateExtractor
-from recognizers_text.extractor import ExtractResult
+from recognizers_text.extractor import ExtractResult, memoize_extraction
 from recognizers_number.number.extractors import BaseNumberExtractor
 from recognizers_number.number.parsers import BaseNumberParser
 from .constants import Constants, TimeTypeConstants
@@ -128,6 +128,7 @@ class BaseDateTimeExtractor(DateTimeExtractor):
     def __init__(self, config: DateTimeExtractorConfiguration):
         self.config = config
 
+    @memoize_extraction
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
 
         if reference is None:
@@ -7,7 +7,7 @@ from datetime import datetime, timedelta
 from collections import namedtuple
 import regex
 
-from recognizers_text.extractor import ExtractResult
+from recognizers_text.extractor import ExtractResult, memoize_extraction
 from recognizers_number import BaseNumberExtractor
 from .base_date import BaseDateExtractor
 from .base_time import BaseTimeExtractor
@@ -223,6 +223,7 @@ class BaseDateTimePeriodExtractor(DateTimeExtractor):
     def __init__(self, config: DateTimePeriodExtractorConfiguration):
         self.config = config
 
+    @memoize_extraction
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if reference is None:
             reference = datetime.now()
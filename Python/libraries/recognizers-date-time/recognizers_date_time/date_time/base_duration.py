@@ -7,7 +7,7 @@ from datetime import datetime
 import regex
 
 from recognizers_text.utilities import QueryProcessor
-from recognizers_text.extractor import ExtractResult
+from recognizers_text.extractor import ExtractResult, memoize_extraction
 from recognizers_number.number.extractors import BaseNumberExtractor
 from recognizers_number.number.parsers import BaseNumberParser
 from .constants import Constants, TimeTypeConstants
@@ -113,6 +113,7 @@ class BaseDurationExtractor(DateTimeExtractor):
         self.config = config
         self.merge = merge
 
+    @memoize_extraction
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if reference is None:
             reference = datetime.now()
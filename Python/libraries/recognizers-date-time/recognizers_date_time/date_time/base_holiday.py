@@ -6,7 +6,7 @@ from typing import List, Optional, Pattern, Callable, Dict, Match
 from datetime import datetime
 from calendar import Calendar
 
-from recognizers_text.extractor import ExtractResult, Metadata
+from recognizers_text.extractor import ExtractResult, Metadata, memoize_extraction
 from ..resources.base_date_time import BaseDateTime
 from .constants import Constants, TimeTypeConstants
 from .extractors import DateTimeExtractor
@@ -29,6 +29,7 @@ class BaseHolidayExtractor(DateTimeExtractor):
     def __init__(self, config: HolidayExtractorConfiguration):
         self.config = config
 
+    @memoize_extraction
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if not reference:
             reference = datetime.now()
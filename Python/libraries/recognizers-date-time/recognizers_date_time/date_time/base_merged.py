@@ -5,10 +5,15 @@ from abc import abstractmethod, ABC
 from typing import List, Optional, Pattern, Dict, Match
 from datetime import datetime
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from threading import Lock
+import os
 import regex
 
 from recognizers_text.extractor import Extractor, ExtractResult
 from recognizers_text.meta_data import MetaData
+from recognizers_text.utilities import TimeBudget, ConcurrentMatching
 from .constants import Constants, TimeTypeConstants
 from .extractors import DateTimeExtractor
 from .parsers import DateTimeParser, DateTimeParseResult
@@ -28,6 +33,18 @@ from .datetime_list_extractor import DateTimeListExtractor
 
 MatchedIndex = namedtuple('MatchedIndex', ['matched', 'index'])
 
+_shared_executor: Optional[ThreadPoolExecutor] = None
+_shared_executor_lock = Lock()
+
+
+def get_shared_executor() -> ThreadPoolExecutor:
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = ThreadPoolExecutor(
+                max_workers=min(9, os.cpu_count() or 1), thread_name_prefix='datetime-extractor')
+        return _shared_executor
+
 
 class MergedExtractorConfiguration:
 
@@ -187,9 +204,28 @@ class BaseMergedExtractor(DateTimeExtractor):
     def extractor_type_name(self) -> str:
         return Constants.SYS_DATETIME_MERGED
 
-    def __init__(self, config: MergedExtractorConfiguration, options: DateTimeOptions):
+    def __init__(self, config: MergedExtractorConfiguration, options: DateTimeOptions, concurrent: bool = False):
         self.config = config
         self.options = options
+        # When set, the sub-extractors run on a shared thread pool and their patterns match with the GIL
+        # released. Results are merged in the usual order.
+        self.concurrent = concurrent
+
+    def extract_all(self, extractors: List[DateTimeExtractor], source: str, reference: datetime):
+        # Within a time budget, a sub-extractor that runs out of time contributes no results
+        if not self.concurrent:
+            return (TimeBudget.run(extractor.extract, source, reference, fallback=[]) for extractor in extractors)
+
+        executor = get_shared_executor()
+        # Run in a copy of the caller's context so the workers see the current ExtractionContext and TimeBudget
+        futures = [executor.submit(copy_context().run, self.__extract_concurrently, extractor, source, reference)
+                   for extractor in extractors]
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def __extract_concurrently(extractor: DateTimeExtractor, source: str, reference: datetime) -> List[ExtractResult]:
+        with ConcurrentMatching():
+            return TimeBudget.run(extractor.extract, source, reference, fallback=[])
 
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if reference is None:
@@ -215,24 +251,20 @@ class BaseMergedExtractor(DateTimeExtractor):
                 self.config.superfluous_word_matcher
             )
         # The order is important, since there can be conflicts in merging
-        result = self.add_to(
-            result, self.config.date_extractor.extract(source, reference), source)
-        result = self.add_to(
-            result, self.config.time_extractor.extract(source, reference), source)
-        result = self.add_to(
-            result, self.config.date_period_extractor.extract(source, reference), source)
-        result = self.add_to(
-            result, self.config.duration_extractor.extract(source, reference), source)
-        result = self.add_to(
-            result, self.config.time_period_extractor.extract(source, reference), source)
-        result = self.add_to(
-            result, self.config.date_time_period_extractor.extract(source, reference), source)
-        result = self.add_to(
-            result, self.config.date_time_extractor.extract(source, reference), source)
-        result = self.add_to(
-            result, self.config.set_extractor.extract(source, reference), source)
-        result = self.add_to(
-            result, self.config.holiday_extractor.extract(source, reference), source)
+        extractors = [
+            self.config.date_extractor,
+            self.config.time_extractor,
+            self.config.date_period_extractor,
+            self.config.duration_extractor,
+            self.config.time_period_extractor,
+            self.config.date_time_period_extractor,
+            self.config.date_time_extractor,
+            self.config.set_extractor,
+            self.config.holiday_extractor
+        ]
+
+        for extract_results in self.extract_all(extractors, source, reference):
+            result = self.add_to(result, extract_results, source)
 
         if (self.options & DateTimeOptions.ENABLE_PREVIEW) != 0:
             self.add_to(result, self.config.time_zone_extractor.extract(source, reference), source)
@@ -7,7 +7,7 @@ from datetime import datetime
 import regex
 
 from recognizers_text.utilities import RegExpUtility
-from recognizers_text.extractor import ExtractResult
+from recognizers_text.extractor import ExtractResult, memoize_extraction
 from .constants import Constants, TimeTypeConstants
 from .extractors import DateTimeExtractor
 from .parsers import DateTimeParser, DateTimeParseResult
@@ -106,6 +106,7 @@ class BaseSetExtractor(DateTimeExtractor):
     def __init__(self, config: SetExtractorConfiguration):
         self.config = config
 
+    @memoize_extraction
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if reference is None:
             reference = datetime.now()
@@ -8,7 +8,7 @@ from collections import namedtuple
 import regex
 
 from recognizers_text.utilities import RegExpUtility, QueryProcessor
-from recognizers_text.extractor import Extractor, ExtractResult, Metadata
+from recognizers_text.extractor import Extractor, ExtractResult, Metadata, memoize_extraction
 from recognizers_date_time.date_time.base_time import BaseTimeExtractor, BaseTimeParser
 from .constants import Constants, TimeTypeConstants
 from .extractors import DateTimeExtractor
@@ -92,6 +92,7 @@ class BaseTimePeriodExtractor(DateTimeExtractor):
     def __init__(self, config: TimePeriodExtractorConfiguration):
         self.config = config
 
+    @memoize_extraction
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if reference is None:
             reference = datetime.now()
@@ -6,13 +6,14 @@ from typing import List, Pattern
 from abc import abstractmethod
 from datetime import datetime
 from .utilities import DateTimeOptionsConfiguration, DateTimeResolutionResult, TimeZoneResolutionResult, Token,\
-    MatchingUtil, DateUtils
+    DateUtils
 from .parsers import DateTimeParser, DateTimeParseResult
 from .datetime_zone_extractor import DateTimeZoneExtractor
 from .constants import Constants
 from ..resources import TimeZoneDefinitions
 from recognizers_text import ExtractResult, RegExpUtility, QueryProcessor
 from recognizers_text.matcher.string_matcher import StringMatcher
+from recognizers_text.matcher.match_mode import MatchMode
 
 
 class TimeZoneExtractorConfiguration(DateTimeOptionsConfiguration):
@@ -208,8 +209,7 @@ class BaseTimeZoneExtractor(DateTimeZoneExtractor):
         if len(time_match) != 0 and not is_all_suffix_inside_tokens:
             last_match_index = time_match[len(time_match) - 1].start()
             sub_str = text[0:last_match_index]
-            matches = self.config.location_matcher.find(sub_str)
-            location_matches = MatchingUtil.remove_sub_matches(matches)
+            location_matches = self.config.location_matcher.find(sub_str, MatchMode.Maximal)
 
             i = 0
             for match in time_match:
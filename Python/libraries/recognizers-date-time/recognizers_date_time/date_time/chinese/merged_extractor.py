@@ -13,8 +13,8 @@ from .merged_extractor_config import ChineseMergedExtractorConfiguration
 
 
 class ChineseMergedExtractor(BaseMergedExtractor):
-    def __init__(self, options: DateTimeOptions):
-        super().__init__(ChineseMergedExtractorConfiguration(), options)
+    def __init__(self, options: DateTimeOptions, concurrent: bool = False):
+        super().__init__(ChineseMergedExtractorConfiguration(), options, concurrent)
         self.day_of_month_regex = RegExpUtility.get_safe_reg_exp(
             '^\\d{1,2}号', regex.I)
 
@@ -23,24 +23,20 @@ class ChineseMergedExtractor(BaseMergedExtractor):
             reference = datetime.now()
 
         result: List[ExtractResult] = list()
-        result = self.add_to(
-            result, self.config.date_extractor.extract(source, reference), source)
-        result = self.add_to(
-            result, self.config.time_extractor.extract(source, reference), source)
-        result = self.add_to(
-            result, self.config.duration_extractor.extract(source, reference), source)
-        result = self.add_to(
-            result, self.config.date_period_extractor.extract(source, reference), source)
-        result = self.add_to(
-            result, self.config.date_time_extractor.extract(source, reference), source)
-        result = self.add_to(
-            result, self.config.time_period_extractor.extract(source, reference), source)
-        result = self.add_to(result, self.config.date_time_period_extractor.extract(
-            source, reference), source)
-        result = self.add_to(
-            result, self.config.set_extractor.extract(source, reference), source)
-        result = self.add_to(
-            result, self.config.holiday_extractor.extract(source, reference), source)
+        extractors = [
+            self.config.date_extractor,
+            self.config.time_extractor,
+            self.config.duration_extractor,
+            self.config.date_period_extractor,
+            self.config.date_time_extractor,
+            self.config.time_period_extractor,
+            self.config.date_time_period_extractor,
+            self.config.set_extractor,
+            self.config.holiday_extractor
+        ]
+
+        for extract_results in self.extract_all(extractors, source, reference):
+            result = self.add_to(result, extract_results, source)
 
         result = self._filter_ambiguity(result, source)
 
@@ -2,35 +2,12 @@
 #  Licensed under the MIT License.
 
 from datetime import datetime
-from typing import List
+from typing import List, Iterable
 from recognizers_text import Culture, Recognizer
 from recognizers_text.model import Model, ModelResult
 from .utilities import DateTimeOptions
 from .models import DateTimeModel
 from .base_merged import BaseMergedExtractor, BaseMergedParser
-from .english.common_configs import EnglishCommonDateTimeParserConfiguration
-from .english.merged_extractor_config import EnglishMergedExtractorConfiguration
-from .english.merged_parser_config import EnglishMergedParserConfiguration
-from .spanish.common_configs import SpanishCommonDateTimeParserConfiguration
-from .spanish.merged_extractor_config import SpanishMergedExtractorConfiguration
-from .spanish.merged_parser_config import SpanishMergedParserConfiguration
-from .chinese.merged_extractor import ChineseMergedExtractor
-from .chinese.merged_parser import ChineseMergedParser
-from .french.common_configs import FrenchCommonDateTimeParserConfiguration
-from .french.merged_extractor_config import FrenchMergedExtractorConfiguration
-from .french.merged_parser_config import FrenchMergedParserConfiguration
-from .portuguese.common_configs import PortugueseCommonDateTimeParserConfiguration
-from .portuguese.merged_extractor_config import PortugueseMergedExtractorConfiguration
-from .portuguese.merged_parser_config import PortugueseMergedParserConfiguration
-from .italian.common_configs import ItalianCommonDateTimeParserConfiguration
-from .italian.merged_extractor_config import ItalianMergedExtractorConfiguration
-from .italian.merged_parser_config import ItalianMergedParserConfiguration
-from .german.common_configs import GermanCommonDateTimeParserConfiguration
-from .german.merged_extractor_config import GermanMergedExtractorConfiguration
-from .german.merged_parser_config import GermanMergedParserConfiguration
-from .dutch.common_configs import DutchCommonDateTimeParserConfiguration
-from .dutch.merged_extractor_config import DutchMergedExtractorConfiguration
-from .dutch.merged_parser_config import DutchMergedParserConfiguration
 
 
 class DateTimeRecognizer(Recognizer[DateTimeOptions]):
@@ -42,53 +19,107 @@ class DateTimeRecognizer(Recognizer[DateTimeOptions]):
         super().__init__(target_culture, options, lazy_initialization)
 
     def initialize_configuration(self):
+        self.register_culture(Culture.English, self.__initialize_english)
+        self.register_culture(Culture.Chinese, self.__initialize_chinese)
+        self.register_culture(Culture.Spanish, self.__initialize_spanish)
+        self.register_culture(Culture.SpanishMexican, self.__initialize_spanish_mexican)
+        self.register_culture(Culture.French, self.__initialize_french)
+        self.register_culture(Culture.Portuguese, self.__initialize_portuguese)
+        self.register_culture(Culture.Italian, self.__initialize_italian)
+        self.register_culture(Culture.German, self.__initialize_german)
+        self.register_culture(Culture.Dutch, self.__initialize_dutch)
+
+    def __initialize_english(self):
+        from .english.common_configs import EnglishCommonDateTimeParserConfiguration
+        from .english.merged_extractor_config import EnglishMergedExtractorConfiguration
+        from .english.merged_parser_config import EnglishMergedParserConfiguration
+
         self.register_model('DateTimeModel', Culture.English, lambda options: DateTimeModel(
             BaseMergedParser(EnglishMergedParserConfiguration(
                 EnglishCommonDateTimeParserConfiguration()), options),
             BaseMergedExtractor(EnglishMergedExtractorConfiguration(), options)
         ))
 
+    def __initialize_chinese(self):
+        from .chinese.merged_extractor import ChineseMergedExtractor
+        from .chinese.merged_parser import ChineseMergedParser
+
         self.register_model('DateTimeModel', Culture.Chinese, lambda options: DateTimeModel(
             ChineseMergedParser(),
             ChineseMergedExtractor(options)
         ))
 
+    def __initialize_spanish(self):
+        from .spanish.common_configs import SpanishCommonDateTimeParserConfiguration
+        from .spanish.merged_extractor_config import SpanishMergedExtractorConfiguration
+        from .spanish.merged_parser_config import SpanishMergedParserConfiguration
+
         self.register_model('DateTimeModel', Culture.Spanish, lambda options: DateTimeModel(
             BaseMergedParser(SpanishMergedParserConfiguration(
                 SpanishCommonDateTimeParserConfiguration()), options),
             BaseMergedExtractor(SpanishMergedExtractorConfiguration(), options)
         ))
 
+    def __initialize_spanish_mexican(self):
+        from .spanish.common_configs import SpanishCommonDateTimeParserConfiguration
+        from .spanish.merged_extractor_config import SpanishMergedExtractorConfiguration
+        from .spanish.merged_parser_config import SpanishMergedParserConfiguration
+
         self.register_model('DateTimeModel', Culture.SpanishMexican, lambda options: DateTimeModel(
             BaseMergedParser(SpanishMergedParserConfiguration(
                 SpanishCommonDateTimeParserConfiguration()), options),
             BaseMergedExtractor(SpanishMergedExtractorConfiguration(), options)
         ))
 
+    def __initialize_french(self):
+        from .french.common_configs import FrenchCommonDateTimeParserConfiguration
+        from .french.merged_extractor_config import FrenchMergedExtractorConfiguration
+        from .french.merged_parser_config import FrenchMergedParserConfiguration
+
         self.register_model('DateTimeModel', Culture.French, lambda options: DateTimeModel(
             BaseMergedParser(FrenchMergedParserConfiguration(
                 FrenchCommonDateTimeParserConfiguration()), options),
             BaseMergedExtractor(FrenchMergedExtractorConfiguration(), options)
         ))
 
+    def __initialize_portuguese(self):
+        from .portuguese.common_configs import PortugueseCommonDateTimeParserConfiguration
+        from .portuguese.merged_extractor_config import PortugueseMergedExtractorConfiguration
+        from .portuguese.merged_parser_config import PortugueseMergedParserConfiguration
+
         self.register_model('DateTimeModel', Culture.Portuguese, lambda options: DateTimeModel(
             BaseMergedParser(PortugueseMergedParserConfiguration(
                 PortugueseCommonDateTimeParserConfiguration()), options),
             BaseMergedExtractor(PortugueseMergedExtractorConfiguration(), options)
         ))
 
+    def __initialize_italian(self):
+        from .italian.common_configs import ItalianCommonDateTimeParserConfiguration
+        from .italian.merged_extractor_config import ItalianMergedExtractorConfiguration
+        from .italian.merged_parser_config import ItalianMergedParserConfiguration
+
         self.register_model('DateTimeModel', Culture.Italian, lambda options: DateTimeModel(
             BaseMergedParser(ItalianMergedParserConfiguration(
                 ItalianCommonDateTimeParserConfiguration()), options),
             BaseMergedExtractor(ItalianMergedExtractorConfiguration(), options)
         ))
 
+    def __initialize_german(self):
+        from .german.common_configs import GermanCommonDateTimeParserConfiguration
+        from .german.merged_extractor_config import GermanMergedExtractorConfiguration
+        from .german.merged_parser_config import GermanMergedParserConfiguration
+
         self.register_model('DateTimeModel', Culture.German, lambda options: DateTimeModel(
             BaseMergedParser(GermanMergedParserConfiguration(
                 GermanCommonDateTimeParserConfiguration()), options),
             BaseMergedExtractor(GermanMergedExtractorConfiguration(), options)
         ))
 
+    def __initialize_dutch(self):
+        from .dutch.common_configs import DutchCommonDateTimeParserConfiguration
+        from .dutch.merged_extractor_config import DutchMergedExtractorConfiguration
+        from .dutch.merged_parser_config import DutchMergedParserConfiguration
+
         self.register_model('DateTimeModel', Culture.Dutch, lambda options: DateTimeModel(
             BaseMergedParser(DutchMergedParserConfiguration(
                 DutchCommonDateTimeParserConfiguration()), options),
@@ -100,7 +131,17 @@ class DateTimeRecognizer(Recognizer[DateTimeOptions]):
 
 
 def recognize_datetime(query: str, culture: str, options: DateTimeOptions = DateTimeOptions.NONE,
-                       reference: datetime = None, fallback_to_default_culture: bool = True) -> List[ModelResult]:
+                       reference: datetime = None, fallback_to_default_culture: bool = True,
+                       timeout_ms: float = None) -> List[ModelResult]:
+    recognizer = DateTimeRecognizer(culture, options)
+    model = recognizer.get_datetime_model(culture, fallback_to_default_culture)
+    return model.parse(query, reference, timeout_ms)
+
+
+def recognize_datetime_batch(queries: Iterable[str], culture: str, options: DateTimeOptions = DateTimeOptions.NONE,
+                             reference: datetime = None,
+                             fallback_to_default_culture: bool = True,
+                             timeout_ms: float = None) -> List[List[ModelResult]]:
     recognizer = DateTimeRecognizer(culture, options)
     model = recognizer.get_datetime_model(culture, fallback_to_default_culture)
-    return model.parse(query, reference)
+    return model.parse_batch(queries, reference, timeout_ms)
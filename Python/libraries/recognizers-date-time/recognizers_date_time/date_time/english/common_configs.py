@@ -3,6 +3,7 @@
 
 from typing import Dict, Pattern
 
+from recognizers_text.component_registry import ComponentRegistry
 from recognizers_number import BaseNumberExtractor, BaseNumberParser
 from recognizers_number.number.english.parsers import EnglishNumberParserConfiguration
 from recognizers_number.number.english.extractors import EnglishCardinalExtractor, EnglishIntegerExtractor, EnglishOrdinalExtractor
@@ -158,7 +159,7 @@ class EnglishCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
     def __init__(self, dmyDateFormat=False):
         BaseDateParserConfiguration.__init__(self)
 
-        self._utility_configuration = EnglishDateTimeUtilityConfiguration()
+        self._utility_configuration = ComponentRegistry.get_or_create(EnglishDateTimeUtilityConfiguration)
         self._unit_map = EnglishDateTime.UnitMap
         self._unit_value_map = EnglishDateTime.UnitValueMap
         self._season_map = EnglishDateTime.SeasonMap
@@ -167,29 +168,29 @@ class EnglishCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
         self._month_of_year = EnglishDateTime.MonthOfYear
         self._numbers = EnglishDateTime.Numbers
         self._double_numbers = EnglishDateTime.DoubleNumbers
-        self._cardinal_extractor = EnglishCardinalExtractor()
-        self._integer_extractor = EnglishIntegerExtractor()
-        self._ordinal_extractor = EnglishOrdinalExtractor()
+        self._cardinal_extractor = ComponentRegistry.get_or_create(EnglishCardinalExtractor)
+        self._integer_extractor = ComponentRegistry.get_or_create(EnglishIntegerExtractor)
+        self._ordinal_extractor = ComponentRegistry.get_or_create(EnglishOrdinalExtractor)
         self._check_both_before_after = EnglishDateTime.CheckBothBeforeAfter
         self._day_of_month = {
             **BaseDateTime.DayOfMonthDictionary, **EnglishDateTime.DayOfMonth}
         self._time_zone_parser = BaseTimeZoneParser()
-        self._number_parser = BaseNumberParser(
-            EnglishNumberParserConfiguration())
-        self._date_extractor = BaseDateExtractor(
-            EnglishDateExtractorConfiguration(dmyDateFormat))
-        self._time_extractor = BaseTimeExtractor(
-            EnglishTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            EnglishDurationExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            EnglishDatePeriodExtractorConfiguration(dmyDateFormat))
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            EnglishTimePeriodExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            EnglishDateTimeExtractorConfiguration(dmyDateFormat))
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            EnglishDateTimePeriodExtractorConfiguration(dmyDateFormat))
+        self._number_parser = ComponentRegistry.get_or_create(
+            BaseNumberParser, ComponentRegistry.get_or_create(EnglishNumberParserConfiguration))
+        self._date_extractor = ComponentRegistry.get_or_create(
+            BaseDateExtractor, ComponentRegistry.get_or_create(EnglishDateExtractorConfiguration, dmyDateFormat))
+        self._time_extractor = ComponentRegistry.get_or_create(
+            BaseTimeExtractor, ComponentRegistry.get_or_create(EnglishTimeExtractorConfiguration))
+        self._duration_extractor = ComponentRegistry.get_or_create(
+            BaseDurationExtractor, ComponentRegistry.get_or_create(EnglishDurationExtractorConfiguration))
+        self._date_period_extractor = ComponentRegistry.get_or_create(
+            BaseDatePeriodExtractor, ComponentRegistry.get_or_create(EnglishDatePeriodExtractorConfiguration, dmyDateFormat))
+        self._time_period_extractor = ComponentRegistry.get_or_create(
+            BaseTimePeriodExtractor, ComponentRegistry.get_or_create(EnglishTimePeriodExtractorConfiguration))
+        self._date_time_extractor = ComponentRegistry.get_or_create(
+            BaseDateTimeExtractor, ComponentRegistry.get_or_create(EnglishDateTimeExtractorConfiguration, dmyDateFormat))
+        self._date_time_period_extractor = ComponentRegistry.get_or_create(
+            BaseDateTimePeriodExtractor, ComponentRegistry.get_or_create(EnglishDateTimePeriodExtractorConfiguration, dmyDateFormat))
         self._duration_parser = BaseDurationParser(
             EnglishDurationParserConfiguration(self))
         self._date_parser = BaseDateParser(
@@ -5,6 +5,7 @@ from typing import Pattern, List, Dict
 from recognizers_number import (BaseNumberExtractor, BaseNumberParser,
                                 EnglishOrdinalExtractor, EnglishIntegerExtractor, EnglishNumberParserConfiguration)
 from recognizers_text.utilities import RegExpUtility
+from recognizers_text.component_registry import ComponentRegistry
 from ...resources.english_date_time import EnglishDateTime
 from ..extractors import DateTimeExtractor
 from ..base_duration import BaseDurationExtractor
@@ -219,13 +220,13 @@ class EnglishDateExtractorConfiguration(DateExtractorConfiguration):
         self._week_day_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.WeekDayRegex)
         self._day_of_week = EnglishDateTime.DayOfWeek
-        self._ordinal_extractor = EnglishOrdinalExtractor()
-        self._integer_extractor = EnglishIntegerExtractor()
-        self._number_parser = BaseNumberParser(
-            EnglishNumberParserConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            EnglishDurationExtractorConfiguration())
-        self._utility_configuration = EnglishDateTimeUtilityConfiguration()
+        self._ordinal_extractor = ComponentRegistry.get_or_create(EnglishOrdinalExtractor)
+        self._integer_extractor = ComponentRegistry.get_or_create(EnglishIntegerExtractor)
+        self._number_parser = ComponentRegistry.get_or_create(
+            BaseNumberParser, ComponentRegistry.get_or_create(EnglishNumberParserConfiguration))
+        self._duration_extractor = ComponentRegistry.get_or_create(
+            BaseDurationExtractor, ComponentRegistry.get_or_create(EnglishDurationExtractorConfiguration))
+        self._utility_configuration = ComponentRegistry.get_or_create(EnglishDateTimeUtilityConfiguration)
         self._range_connector_symbol_regex = RegExpUtility.get_safe_reg_exp(
             BaseDateTime.RangeConnectorSymbolRegex
         )
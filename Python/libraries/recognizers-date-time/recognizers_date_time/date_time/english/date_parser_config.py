@@ -5,6 +5,7 @@ from typing import Pattern, List, Dict
 import regex
 
 from recognizers_text.utilities import RegExpUtility
+from recognizers_text.component_registry import ComponentRegistry
 from recognizers_number import BaseNumberExtractor, BaseNumberParser
 from ...resources.english_date_time import EnglishDateTime
 from ..extractors import DateTimeExtractor
@@ -163,7 +164,7 @@ class EnglishDateParserConfiguration(DateParserConfiguration):
         self._day_of_week = config.day_of_week
         self._unit_map = config.unit_map
         self._cardinal_map = config.cardinal_map
-        self._date_regex = EnglishDateExtractorConfiguration(dmyDateFormat)._date_regex_list
+        self._date_regex = ComponentRegistry.get_or_create(EnglishDateExtractorConfiguration, dmyDateFormat)._date_regex_list
         self._on_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.OnRegex)
         self._special_day_regex = RegExpUtility.get_safe_reg_exp(
@@ -5,6 +5,7 @@ from typing import List, Pattern
 
 from recognizers_text.extractor import Extractor
 from recognizers_text.utilities import RegExpUtility
+from recognizers_text.component_registry import ComponentRegistry
 from recognizers_number.number import BaseNumberParser, BaseNumberExtractor
 from recognizers_number.number.english.extractors import EnglishIntegerExtractor
 from recognizers_number.number.english.parsers import EnglishNumberParserConfiguration
@@ -223,13 +224,13 @@ class EnglishDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
             EnglishDateTime.InConnectorRegex)
         self._range_unit_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.RangeUnitRegex)
-        self._date_point_extractor = BaseDateExtractor(
-            EnglishDateExtractorConfiguration(dmyDateFormat))
-        self._integer_extractor = EnglishIntegerExtractor()
-        self._number_parser = BaseNumberParser(
-            EnglishNumberParserConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            EnglishDurationExtractorConfiguration())
+        self._date_point_extractor = ComponentRegistry.get_or_create(
+            BaseDateExtractor, ComponentRegistry.get_or_create(EnglishDateExtractorConfiguration, dmyDateFormat))
+        self._integer_extractor = ComponentRegistry.get_or_create(EnglishIntegerExtractor)
+        self._number_parser = ComponentRegistry.get_or_create(
+            BaseNumberParser, ComponentRegistry.get_or_create(EnglishNumberParserConfiguration))
+        self._duration_extractor = ComponentRegistry.get_or_create(
+            BaseDurationExtractor, ComponentRegistry.get_or_create(EnglishDurationExtractorConfiguration))
         self._range_connector_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.RangeConnectorRegex)
         self._now_regex = RegExpUtility.get_safe_reg_exp(
@@ -269,11 +270,11 @@ class EnglishDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
         self._century_suffix_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.CenturySuffixRegex
         )
-        self._ordinal_extractor = EnglishOrdinalExtractor()
+        self._ordinal_extractor = ComponentRegistry.get_or_create(EnglishOrdinalExtractor)
         self._previous_prefix_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.PreviousPrefixRegex
         )
-        self._cardinal_extractor = EnglishCardinalExtractor()
+        self._cardinal_extractor = ComponentRegistry.get_or_create(EnglishCardinalExtractor)
 
     def get_from_token_index(self, source: str) -> MatchedIndex:
         return MatchedIndex(True, source.rfind('from')) if source.endswith('from') else MatchedIndex(False, -1)
@@ -5,6 +5,7 @@ from typing import Pattern
 import regex
 
 from recognizers_text.utilities import RegExpUtility
+from recognizers_text.component_registry import ComponentRegistry
 from ...resources.english_date_time import EnglishDateTime
 from ..extractors import DateTimeExtractor
 from ..base_date import BaseDateExtractor
@@ -108,13 +109,13 @@ class EnglishDateTimeExtractorConfiguration(DateTimeExtractorConfiguration):
 
     def __init__(self, dmyDateFormat=False):
         super().__init__()
-        self._date_point_extractor = BaseDateExtractor(
-            EnglishDateExtractorConfiguration(dmyDateFormat))
-        self._time_point_extractor = BaseTimeExtractor(
-            EnglishTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            EnglishDurationExtractorConfiguration())
-        self._utility_configuration = EnglishDateTimeUtilityConfiguration()
+        self._date_point_extractor = ComponentRegistry.get_or_create(
+            BaseDateExtractor, ComponentRegistry.get_or_create(EnglishDateExtractorConfiguration, dmyDateFormat))
+        self._time_point_extractor = ComponentRegistry.get_or_create(
+            BaseTimeExtractor, ComponentRegistry.get_or_create(EnglishTimeExtractorConfiguration))
+        self._duration_extractor = ComponentRegistry.get_or_create(
+            BaseDurationExtractor, ComponentRegistry.get_or_create(EnglishDurationExtractorConfiguration))
+        self._utility_configuration = ComponentRegistry.get_or_create(EnglishDateTimeUtilityConfiguration)
         self.preposition_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.PrepositionRegex)
         self._now_regex = RegExpUtility.get_safe_reg_exp(
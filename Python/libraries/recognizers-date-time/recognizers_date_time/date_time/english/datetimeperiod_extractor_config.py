@@ -6,6 +6,7 @@ import regex
 
 from recognizers_number import BaseNumberExtractor, EnglishCardinalExtractor
 from recognizers_text.utilities import RegExpUtility
+from recognizers_text.component_registry import ComponentRegistry
 from ...resources.english_date_time import EnglishDateTime
 from ..extractors import DateTimeExtractor
 from ..base_datetimeperiod import DateTimePeriodExtractorConfiguration, MatchedIndex
@@ -168,19 +169,19 @@ class EnglishDateTimePeriodExtractorConfiguration(DateTimePeriodExtractorConfigu
             EnglishDateTime.WeekDayRegex
         )
         self._check_both_before_after = EnglishDateTime.CheckBothBeforeAfter
-        self._cardinal_extractor = EnglishCardinalExtractor()
-        self._single_date_extractor = BaseDateExtractor(
-            EnglishDateExtractorConfiguration(dmyDateFormat))
-        self._single_time_extractor = BaseTimeExtractor(
-            EnglishTimeExtractorConfiguration())
-        self._single_date_time_extractor = BaseDateTimeExtractor(
-            EnglishDateTimeExtractorConfiguration(dmyDateFormat))
-        self._duration_extractor = BaseDurationExtractor(
-            EnglishDurationExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            EnglishTimePeriodExtractorConfiguration())
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            EnglishTimeZoneExtractorConfiguration())
+        self._cardinal_extractor = ComponentRegistry.get_or_create(EnglishCardinalExtractor)
+        self._single_date_extractor = ComponentRegistry.get_or_create(
+            BaseDateExtractor, ComponentRegistry.get_or_create(EnglishDateExtractorConfiguration, dmyDateFormat))
+        self._single_time_extractor = ComponentRegistry.get_or_create(
+            BaseTimeExtractor, ComponentRegistry.get_or_create(EnglishTimeExtractorConfiguration))
+        self._single_date_time_extractor = ComponentRegistry.get_or_create(
+            BaseDateTimeExtractor, ComponentRegistry.get_or_create(EnglishDateTimeExtractorConfiguration, dmyDateFormat))
+        self._duration_extractor = ComponentRegistry.get_or_create(
+            BaseDurationExtractor, ComponentRegistry.get_or_create(EnglishDurationExtractorConfiguration))
+        self._time_period_extractor = ComponentRegistry.get_or_create(
+            BaseTimePeriodExtractor, ComponentRegistry.get_or_create(EnglishTimePeriodExtractorConfiguration))
+        self._time_zone_extractor = ComponentRegistry.get_or_create(
+            BaseTimeZoneExtractor, ComponentRegistry.get_or_create(EnglishTimeZoneExtractorConfiguration))
         self._simple_cases_regexes = [
             RegExpUtility.get_safe_reg_exp(EnglishDateTime.PureNumFromTo),
             RegExpUtility.get_safe_reg_exp(EnglishDateTime.PureNumBetweenAnd)
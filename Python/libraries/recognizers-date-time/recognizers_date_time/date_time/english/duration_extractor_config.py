@@ -4,6 +4,7 @@
 from typing import Pattern
 
 from recognizers_text.utilities import RegExpUtility
+from recognizers_text.component_registry import ComponentRegistry
 from recognizers_number.number.extractors import BaseNumberExtractor
 from recognizers_number.number.english.extractors import EnglishCardinalExtractor
 from ...resources.english_date_time import EnglishDateTime
@@ -115,7 +116,7 @@ class EnglishDurationExtractorConfiguration(DurationExtractorConfiguration):
         self._during_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.DuringRegex
         )
-        self._cardinal_extractor: BaseNumberExtractor = EnglishCardinalExtractor()
+        self._cardinal_extractor: BaseNumberExtractor = ComponentRegistry.get_or_create(EnglishCardinalExtractor)
         self._unit_map = EnglishDateTime.UnitMap
         self._unit_value_map = EnglishDateTime.UnitValueMap
         self._duration_unit_regex = RegExpUtility.get_safe_reg_exp(
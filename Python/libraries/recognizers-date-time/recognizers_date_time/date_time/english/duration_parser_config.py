@@ -4,6 +4,7 @@
 from typing import Pattern, Dict
 
 from recognizers_text.utilities import RegExpUtility
+from recognizers_text.component_registry import ComponentRegistry
 from recognizers_number.number.extractors import BaseNumberExtractor
 from recognizers_number.number.parsers import BaseNumberParser
 from recognizers_number.number.english.extractors import EnglishCardinalExtractor
@@ -72,11 +73,11 @@ class EnglishDurationParserConfiguration(DurationParserConfiguration):
         return self._duration_extractor
 
     def __init__(self, config):
-        self._duration_extractor = BaseDurationExtractor(
-            EnglishDurationExtractorConfiguration(), False)
-        self._cardinal_extractor: BaseNumberExtractor = EnglishCardinalExtractor()
-        self._number_parser: BaseNumberParser = BaseNumberParser(
-            EnglishNumberParserConfiguration())
+        self._duration_extractor = ComponentRegistry.get_or_create(
+            BaseDurationExtractor, ComponentRegistry.get_or_create(EnglishDurationExtractorConfiguration), False)
+        self._cardinal_extractor: BaseNumberExtractor = ComponentRegistry.get_or_create(EnglishCardinalExtractor)
+        self._number_parser: BaseNumberParser = ComponentRegistry.get_or_create(
+            BaseNumberParser, ComponentRegistry.get_or_create(EnglishNumberParserConfiguration))
         self._followed_unit: Pattern = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.DurationFollowedUnit)
         self._suffix_and_regex: Pattern = RegExpUtility.get_safe_reg_exp(
@@ -5,6 +5,7 @@ from typing import List, Pattern
 
 from recognizers_text.extractor import Extractor
 from recognizers_text.utilities import RegExpUtility
+from recognizers_text.component_registry import ComponentRegistry
 from recognizers_number import EnglishIntegerExtractor
 from ...resources.english_date_time import EnglishDateTime
 from ..extractors import DateTimeExtractor
@@ -154,25 +155,25 @@ class EnglishMergedExtractorConfiguration(MergedExtractorConfiguration):
         return self._term_filter_regexes
 
     def __init__(self, dmyDateFormat=False):
-        self._integer_extractor = EnglishIntegerExtractor()
-        self._date_extractor = BaseDateExtractor(
-            EnglishDateExtractorConfiguration(dmyDateFormat))
-        self._time_extractor = BaseTimeExtractor(
-            EnglishTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            EnglishDurationExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            EnglishDatePeriodExtractorConfiguration(dmyDateFormat))
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            EnglishTimePeriodExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            EnglishDateTimeExtractorConfiguration(dmyDateFormat))
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            EnglishDateTimePeriodExtractorConfiguration(dmyDateFormat))
-        self._set_extractor = BaseSetExtractor(
-            EnglishSetExtractorConfiguration(dmyDateFormat))
-        self._holiday_extractor = BaseHolidayExtractor(
-            EnglishHolidayExtractorConfiguration())
+        self._integer_extractor = ComponentRegistry.get_or_create(EnglishIntegerExtractor)
+        self._date_extractor = ComponentRegistry.get_or_create(
+            BaseDateExtractor, ComponentRegistry.get_or_create(EnglishDateExtractorConfiguration, dmyDateFormat))
+        self._time_extractor = ComponentRegistry.get_or_create(
+            BaseTimeExtractor, ComponentRegistry.get_or_create(EnglishTimeExtractorConfiguration))
+        self._duration_extractor = ComponentRegistry.get_or_create(
+            BaseDurationExtractor, ComponentRegistry.get_or_create(EnglishDurationExtractorConfiguration))
+        self._date_period_extractor = ComponentRegistry.get_or_create(
+            BaseDatePeriodExtractor, ComponentRegistry.get_or_create(EnglishDatePeriodExtractorConfiguration, dmyDateFormat))
+        self._time_period_extractor = ComponentRegistry.get_or_create(
+            BaseTimePeriodExtractor, ComponentRegistry.get_or_create(EnglishTimePeriodExtractorConfiguration))
+        self._date_time_extractor = ComponentRegistry.get_or_create(
+            BaseDateTimeExtractor, ComponentRegistry.get_or_create(EnglishDateTimeExtractorConfiguration, dmyDateFormat))
+        self._date_time_period_extractor = ComponentRegistry.get_or_create(
+            BaseDateTimePeriodExtractor, ComponentRegistry.get_or_create(EnglishDateTimePeriodExtractorConfiguration, dmyDateFormat))
+        self._set_extractor = ComponentRegistry.get_or_create(
+            BaseSetExtractor, ComponentRegistry.get_or_create(EnglishSetExtractorConfiguration, dmyDateFormat))
+        self._holiday_extractor = ComponentRegistry.get_or_create(
+            BaseHolidayExtractor, ComponentRegistry.get_or_create(EnglishHolidayExtractorConfiguration))
         self._after_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.AfterRegex)
         self._before_regex = RegExpUtility.get_safe_reg_exp(
@@ -207,7 +208,7 @@ class EnglishMergedExtractorConfiguration(MergedExtractorConfiguration):
             EnglishDateTime.FailFastRegex
         )
         self._check_both_before_after = EnglishDateTime.CheckBothBeforeAfter
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            EnglishTimeZoneExtractorConfiguration())
+        self._time_zone_extractor = ComponentRegistry.get_or_create(
+            BaseTimeZoneExtractor, ComponentRegistry.get_or_create(EnglishTimeZoneExtractorConfiguration))
         # TODO When the implementation for these properties is added, change the None values to their respective Regexps
         self._datetime_alt_extractor = None
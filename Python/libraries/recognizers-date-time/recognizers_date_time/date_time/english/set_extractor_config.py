@@ -4,6 +4,7 @@
 from typing import Pattern
 
 from recognizers_text.utilities import RegExpUtility
+from recognizers_text.component_registry import ComponentRegistry
 from ...resources.english_date_time import EnglishDateTime
 from ..extractors import DateTimeExtractor
 from ..base_set import SetExtractorConfiguration
@@ -89,20 +90,20 @@ class EnglishSetExtractorConfiguration(SetExtractorConfiguration):
         return self._duration_unit_regex
 
     def __init__(self, dmyDateFormat=False):
-        self._duration_extractor = BaseDurationExtractor(
-            EnglishDurationExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            EnglishTimeExtractorConfiguration())
-        self._date_extractor = BaseDateExtractor(
-            EnglishDateExtractorConfiguration(dmyDateFormat))
-        self._date_time_extractor = BaseDateTimeExtractor(
-            EnglishDateTimeExtractorConfiguration(dmyDateFormat))
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            EnglishDatePeriodExtractorConfiguration(dmyDateFormat))
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            EnglishTimePeriodExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            EnglishDateTimePeriodExtractorConfiguration(dmyDateFormat))
+        self._duration_extractor = ComponentRegistry.get_or_create(
+            BaseDurationExtractor, ComponentRegistry.get_or_create(EnglishDurationExtractorConfiguration))
+        self._time_extractor = ComponentRegistry.get_or_create(
+            BaseTimeExtractor, ComponentRegistry.get_or_create(EnglishTimeExtractorConfiguration))
+        self._date_extractor = ComponentRegistry.get_or_create(
+            BaseDateExtractor, ComponentRegistry.get_or_create(EnglishDateExtractorConfiguration, dmyDateFormat))
+        self._date_time_extractor = ComponentRegistry.get_or_create(
+            BaseDateTimeExtractor, ComponentRegistry.get_or_create(EnglishDateTimeExtractorConfiguration, dmyDateFormat))
+        self._date_period_extractor = ComponentRegistry.get_or_create(
+            BaseDatePeriodExtractor, ComponentRegistry.get_or_create(EnglishDatePeriodExtractorConfiguration, dmyDateFormat))
+        self._time_period_extractor = ComponentRegistry.get_or_create(
+            BaseTimePeriodExtractor, ComponentRegistry.get_or_create(EnglishTimePeriodExtractorConfiguration))
+        self._date_time_period_extractor = ComponentRegistry.get_or_create(
+            BaseDateTimePeriodExtractor, ComponentRegistry.get_or_create(EnglishDateTimePeriodExtractorConfiguration, dmyDateFormat))
         self._last_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.SetLastRegex)
         self._each_prefix_regex = RegExpUtility.get_safe_reg_exp(
@@ -4,6 +4,7 @@
 from typing import List, Pattern
 
 from recognizers_text.utilities import RegExpUtility
+from recognizers_text.component_registry import ComponentRegistry
 from ...resources.english_date_time import EnglishDateTime
 from ..base_time import TimeExtractorConfiguration
 from ..base_timezone import BaseTimeZoneExtractor
@@ -173,5 +174,5 @@ class EnglishTimeExtractorConfiguration(TimeExtractorConfiguration):
             EnglishDateTime.IshRegex)
         self._time_before_after_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.TimeBeforeAfterRegex)
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            EnglishTimeZoneExtractorConfiguration())
+        self._time_zone_extractor = ComponentRegistry.get_or_create(
+            BaseTimeZoneExtractor, ComponentRegistry.get_or_create(EnglishTimeZoneExtractorConfiguration))
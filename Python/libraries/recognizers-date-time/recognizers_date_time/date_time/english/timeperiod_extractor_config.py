@@ -5,6 +5,7 @@ from typing import List, Pattern
 
 from recognizers_text.utilities import RegExpUtility
 from recognizers_text.extractor import Extractor
+from recognizers_text.component_registry import ComponentRegistry
 from recognizers_number.number.english.extractors import EnglishIntegerExtractor
 from ...resources.english_date_time import EnglishDateTime
 from ..extractors import DateTimeExtractor
@@ -117,11 +118,11 @@ class EnglishTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguration):
             EnglishDateTime.TimeOfDayRegex)
         self._general_ending_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.GeneralEndingRegex)
-        self._single_time_extractor = BaseTimeExtractor(
-            EnglishTimeExtractorConfiguration())
-        self._integer_extractor = EnglishIntegerExtractor()
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            EnglishTimeZoneExtractorConfiguration())
+        self._single_time_extractor = ComponentRegistry.get_or_create(
+            BaseTimeExtractor, ComponentRegistry.get_or_create(EnglishTimeExtractorConfiguration))
+        self._integer_extractor = ComponentRegistry.get_or_create(EnglishIntegerExtractor)
+        self._time_zone_extractor = ComponentRegistry.get_or_create(
+            BaseTimeZoneExtractor, ComponentRegistry.get_or_create(EnglishTimeZoneExtractorConfiguration))
         self._token_before_date = EnglishDateTime.TokenBeforeDate
         self._pure_number_regex = [EnglishDateTime.PureNumFromTo, EnglishDateTime.PureNumFromTo]
         self._options = DateTimeOptions.NONE
@@ -5,6 +5,7 @@ from typing import Pattern, Dict
 
 from recognizers_text.utilities import RegExpUtility
 from recognizers_text.extractor import Extractor
+from recognizers_text.component_registry import ComponentRegistry
 from recognizers_number.number.english.extractors import EnglishIntegerExtractor
 from ...resources.english_date_time import EnglishDateTime
 from ..extractors import DateTimeExtractor
@@ -68,7 +69,7 @@ class EnglishTimePeriodParserConfiguration(TimePeriodParserConfiguration):
         self._time_extractor = config.time_extractor
         self._time_parser = config.time_parser
         self._time_zone_parser = config.time_zone_parser
-        self._integer_extractor = EnglishIntegerExtractor()
+        self._integer_extractor = ComponentRegistry.get_or_create(EnglishIntegerExtractor)
         self._pure_number_from_to_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.PureNumFromTo)
         self._pure_number_between_and_regex = RegExpUtility.get_safe_reg_exp(
@@ -1,20 +1,28 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
-from typing import List
+from typing import List, Iterable
 from datetime import datetime
 
 from recognizers_text.model import Model, ModelResult
-from recognizers_text.utilities import QueryProcessor
+from recognizers_text.extractor import ExtractionContext
+from recognizers_text.utilities import QueryProcessor, TimeBudget
 from .extractors import DateTimeExtractor
 from .parsers import DateTimeParser
 
 
 class DateTimeModelResult(ModelResult):
+    __slots__ = ('timex_str',)
+
     def __init__(self):
         super().__init__()
         self.timex_str: str
 
+    def _copy_to(self, result):
+        super()._copy_to(result)
+        if hasattr(self, 'timex_str'):
+            result.timex_str = self.timex_str
+
 
 class DateTimeModel(Model):
     def model_type_name(self) -> str:
@@ -24,24 +32,36 @@ class DateTimeModel(Model):
         self.parser = parser
         self.extractor = extractor
 
-    def parse(self, query: str, reference: datetime = None) -> List[ModelResult]:  # pylint: disable=W0221
+    def parse(self, query: str, reference: datetime = None, timeout_ms: float = None) -> List[ModelResult]:  # pylint: disable=W0221
         query = QueryProcessor.preprocess(query)
         parser_dates = []
 
         try:
-            extract_results = self.extractor.extract(query, reference)
-
-            for result in extract_results:
-                parse_result = self.parser.parse(result, reference)
-                if isinstance(parse_result.value, list):
-                    parser_dates += parse_result.value
-                else:
-                    parser_dates.append(parse_result)
+            # Share sub-extractor results between the nested extractors and parsers of this call
+            with ExtractionContext():
+                # The merged extractor bounds each of its sub-extractors by the budget
+                with TimeBudget(timeout_ms):
+                    extract_results = self.extractor.extract(query, reference)
+
+                for result in extract_results:
+                    parse_result = self.parser.parse(result, reference)
+                    if isinstance(parse_result.value, list):
+                        parser_dates += parse_result.value
+                    else:
+                        parser_dates.append(parse_result)
         except Exception:
             pass
 
         return [self.__to_model_result(x) for x in parser_dates]
 
+    def parse_batch(self, queries: Iterable[str], reference: datetime = None,
+                    timeout_ms: float = None) -> List[List[ModelResult]]:
+        # Resolve every query of the batch against the same reference
+        if reference is None:
+            reference = datetime.now()
+
+        return [self.parse(query, reference, timeout_ms) for query in queries]
+
     @staticmethod
     def __to_model_result(parse_result_value) -> ModelResult:
         result = ModelResult()
@@ -10,10 +10,16 @@ from recognizers_text.parser import Parser, ParseResult
 
 
 class DateTimeParseResult(ParseResult):
+    __slots__ = ('timex_str',)
+
     def __init__(self, source: ExtractResult = None):
         super().__init__(source)
         self.timex_str: str = ''
 
+    def _copy_to(self, result):
+        super()._copy_to(result)
+        result.timex_str = self.timex_str
+
 
 class DateTimeParser(Parser):
     @property
@@ -0,0 +1,5 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+# The other configurations import from common_configs, which has to be imported first
+from .common_configs import *
@@ -12,6 +12,7 @@ import regex
 
 from recognizers_text.matcher.number_with_unit_tokenizer import NumberWithUnitTokenizer
 from recognizers_text.matcher.match_strategy import MatchStrategy
+from recognizers_text.matcher.match_mode import MatchMode
 from recognizers_text.extractor import ExtractResult, Metadata
 from recognizers_text.utilities import RegExpUtility
 from recognizers_date_time.date_time.constants import TimeTypeConstants, Constants
@@ -64,8 +65,8 @@ class TimeZoneUtility:
         return has_time_zone_data
 
     @staticmethod
-    def build_matcher_from_lists(*collections: List[str]) -> StringMatcher:
-        matcher = StringMatcher(MatchStrategy.TrieTree, NumberWithUnitTokenizer())
+    def build_matcher_from_lists(*collections: List[str], match_strategy: MatchStrategy = MatchStrategy.ArrayTrie) -> StringMatcher:
+        matcher = StringMatcher(match_strategy, NumberWithUnitTokenizer())
 
         matcher_list = []
         for collection in collections:
@@ -132,6 +133,8 @@ class DurationParsingUtil:
 
 
 class Token:
+    __slots__ = ('_start', '_end', '_metadata')
+
     def __init__(self, start: int, end: int, metadata: Metadata = None):
         self._start: int = start
         self._end: int = end
@@ -167,6 +170,9 @@ class Token:
     def metadata(self, value):
         self._metadata = value
 
+    def copy(self):
+        return Token(self._start, self._end, self._metadata.copy() if self._metadata is not None else None)
+
 
 def merge_all_tokens(tokens: List[Token], source: str, extractor_name: str) -> List[ExtractResult]:
     result = []
@@ -654,7 +660,7 @@ class MatchingUtil:
 
     @staticmethod
     def pre_process_text_remove_superfluous_words(text: str, matcher: Pattern):
-        superfluous_word_matches = MatchingUtil.remove_sub_matches(matcher.find(text))
+        superfluous_word_matches = matcher.find(text, MatchMode.Maximal)
 
         bias = 0
 
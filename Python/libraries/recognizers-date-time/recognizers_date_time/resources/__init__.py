@@ -1,13 +1,31 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
-from .base_date_time import BaseDateTime
-from .chinese_date_time import ChineseDateTime
-from .english_date_time import EnglishDateTime
-from .french_date_time import FrenchDateTime
-from .portuguese_date_time import PortugueseDateTime
-from .spanish_date_time import SpanishDateTime
-from .italian_date_time import ItalianDateTime
-from .german_date_time import GermanDateTime
-from .english_time_zone import TimeZoneDefinitions
-from .dutch_date_time import DutchDateTime
+import os
+from recognizers_text.lazy_imports import lazy_package
+from recognizers_text.matcher.array_trie import ArrayTrie
+
+# Star imports resolve these names, most of which are only imported on first access
+__all__ = [
+    'BaseDateTime', 'ChineseDateTime', 'DutchDateTime', 'EnglishDateTime', 'FrenchDateTime', 'GermanDateTime',
+    'ItalianDateTime', 'PortugueseDateTime', 'SpanishDateTime', 'TimeZoneDefinitions', 'base_date_time',
+    'chinese_date_time', 'dutch_date_time', 'english_date_time', 'english_time_zone', 'french_date_time',
+    'german_date_time', 'italian_date_time', 'portuguese_date_time', 'spanish_date_time'
+]
+
+# Each resource module is only imported when its class is first used
+__getattr__, __dir__ = lazy_package(__name__, attributes={
+    'BaseDateTime': 'base_date_time',
+    'ChineseDateTime': 'chinese_date_time',
+    'EnglishDateTime': 'english_date_time',
+    'FrenchDateTime': 'french_date_time',
+    'PortugueseDateTime': 'portuguese_date_time',
+    'SpanishDateTime': 'spanish_date_time',
+    'ItalianDateTime': 'italian_date_time',
+    'GermanDateTime': 'german_date_time',
+    'TimeZoneDefinitions': 'english_time_zone',
+    'DutchDateTime': 'dutch_date_time'
+})
+
+# Dictionaries prebuilt by resource-generator/matchers.py, mapped rather than built again
+ArrayTrie.add_prebuilt_path(os.path.join(os.path.dirname(__file__), 'matchers'))
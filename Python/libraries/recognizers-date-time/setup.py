@@ -25,6 +25,7 @@ setup(
     long_description=read('README.rst'),
     license='MIT',
     packages=find_packages(),
+    package_data={'recognizers_date_time': ['resources/matchers/*.bin']},
     install_requires=REQUIRES,
     classifiers=[
         'Programming Language :: Python :: 3.6',
@@ -1,5 +1,53 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
-from .number_with_unit import *
-from .resources import *
+from recognizers_text.lazy_imports import lazy_package
+from . import number_with_unit
+
+# Star imports resolve these names, most of which are only imported on first access
+__all__ = [
+    'AbstractNumberWithUnitModel', 'AgeModel', 'AgnosticNumberParserFactory', 'BaseCurrency', 'BaseCurrencyParser',
+    'BaseMergedUnitExtractor', 'BaseMergedUnitParser', 'BaseNumbers', 'BaseUnits', 'ChineseAgeExtractorConfiguration',
+    'ChineseAgeParserConfiguration', 'ChineseCurrencyExtractorConfiguration', 'ChineseCurrencyParserConfiguration',
+    'ChineseDimensionExtractorConfiguration', 'ChineseDimensionParserConfiguration', 'ChineseNumberExtractor',
+    'ChineseNumberExtractorMode', 'ChineseNumberParserConfiguration', 'ChineseNumberWithUnitExtractorConfiguration',
+    'ChineseNumberWithUnitParserConfiguration', 'ChineseNumericWithUnit', 'ChineseTemperatureExtractorConfiguration',
+    'ChineseTemperatureParserConfiguration', 'Constants', 'Culture', 'CultureInfo', 'CurrencyModel',
+    'CurrencyUnitValue', 'DefinitionLoader', 'DictionaryUtility', 'DimensionModel', 'DutchAgeExtractorConfiguration',
+    'DutchAgeParserConfiguration', 'DutchCurrencyExtractorConfiguration', 'DutchCurrencyParserConfiguration',
+    'DutchDimensionExtractorConfiguration', 'DutchDimensionParserConfiguration', 'DutchNumberExtractor',
+    'DutchNumberParserConfiguration', 'DutchNumberWithUnitExtractorConfiguration',
+    'DutchNumberWithUnitParserConfiguration', 'DutchNumericWithUnit', 'DutchTemperatureExtractorConfiguration',
+    'DutchTemperatureParserConfiguration', 'EnglishAgeExtractorConfiguration', 'EnglishAgeParserConfiguration',
+    'EnglishCurrencyExtractorConfiguration', 'EnglishCurrencyParserConfiguration',
+    'EnglishDimensionExtractorConfiguration', 'EnglishDimensionParserConfiguration', 'EnglishNumericWithUnit',
+    'EnglishTemperatureExtractorConfiguration', 'EnglishTemperatureParserConfiguration', 'ExtractResult', 'Extractor',
+    'ExtractorParserModel', 'FrenchAgeExtractorConfiguration', 'FrenchAgeParserConfiguration',
+    'FrenchCurrencyExtractorConfiguration', 'FrenchCurrencyParserConfiguration',
+    'FrenchDimensionExtractorConfiguration', 'FrenchDimensionParserConfiguration', 'FrenchNumericWithUnit',
+    'FrenchTemperatureExtractorConfiguration', 'FrenchTemperatureParserConfiguration',
+    'GermanCurrencyExtractorConfiguration', 'GermanCurrencyParserConfiguration', 'GermanNumericWithUnit',
+    'ItalianCurrencyExtractorConfiguration', 'ItalianCurrencyParserConfiguration', 'ItalianNumericWithUnit',
+    'MatchResult', 'MatchStrategy', 'Model', 'ModelResult', 'NumberMode', 'NumberWithUnitExtractor',
+    'NumberWithUnitExtractorConfiguration', 'NumberWithUnitOptions', 'NumberWithUnitParser',
+    'NumberWithUnitParserConfiguration', 'NumberWithUnitRecognizer', 'NumberWithUnitTokenizer', 'ParseResult', 'Parser',
+    'ParserType', 'PortugueseAgeExtractorConfiguration', 'PortugueseAgeParserConfiguration',
+    'PortugueseCurrencyExtractorConfiguration', 'PortugueseCurrencyParserConfiguration',
+    'PortugueseDimensionExtractorConfiguration', 'PortugueseDimensionParserConfiguration', 'PortugueseNumericWithUnit',
+    'PortugueseTemperatureExtractorConfiguration', 'PortugueseTemperatureParserConfiguration', 'PrefixUnitResult',
+    'QueryProcessor', 'Recognizer', 'RegExpUtility', 'SpanishAgeExtractorConfiguration',
+    'SpanishAgeParserConfiguration', 'SpanishCurrencyExtractorConfiguration', 'SpanishCurrencyParserConfiguration',
+    'SpanishDimensionExtractorConfiguration', 'SpanishDimensionParserConfiguration', 'SpanishNumericWithUnit',
+    'SpanishTemperatureExtractorConfiguration', 'SpanishTemperatureParserConfiguration', 'StringMatcher',
+    'TemperatureModel', 'Token', 'UnitValue', 'base_currency', 'base_numbers', 'base_units', 'chinese',
+    'chinese_numeric_with_unit', 'constants', 'dutch', 'dutch_numeric_with_unit', 'english',
+    'english_numeric_with_unit', 'extractors', 'french', 'french_numeric_with_unit', 'german',
+    'german_numeric_with_unit', 'italian', 'italian_numeric_with_unit', 'models', 'number_with_unit',
+    'number_with_unit_recognizer', 'parsers', 'portuguese', 'portuguese_numeric_with_unit', 'recognize_age',
+    'recognize_age_batch', 'recognize_currency', 'recognize_currency_batch', 'recognize_dimension',
+    'recognize_dimension_batch', 'recognize_temperature', 'recognize_temperature_batch', 'resources', 'spanish',
+    'spanish_numeric_with_unit', 'utilities'
+]
+
+# The recognizers, resources and culture specific modules are only imported when first used
+__getattr__, __dir__ = lazy_package(__name__, ['number_with_unit', 'resources'])
@@ -1,10 +1,54 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
+from recognizers_text.lazy_imports import lazy_package
 from .number_with_unit_recognizer import *
 from .constants import *
 from .models import *
 from .extractors import *
 from .parsers import *
-from .chinese import *
-from .dutch import *
+
+# Star imports resolve these names, most of which are only imported on first access
+__all__ = [
+    'AbstractNumberWithUnitModel', 'AgeModel', 'AgnosticNumberParserFactory', 'BaseCurrency', 'BaseCurrencyParser',
+    'BaseMergedUnitExtractor', 'BaseMergedUnitParser', 'BaseUnits', 'ChineseAgeExtractorConfiguration',
+    'ChineseAgeParserConfiguration', 'ChineseCurrencyExtractorConfiguration', 'ChineseCurrencyParserConfiguration',
+    'ChineseDimensionExtractorConfiguration', 'ChineseDimensionParserConfiguration', 'ChineseNumberExtractor',
+    'ChineseNumberExtractorMode', 'ChineseNumberParserConfiguration', 'ChineseNumberWithUnitExtractorConfiguration',
+    'ChineseNumberWithUnitParserConfiguration', 'ChineseNumericWithUnit', 'ChineseTemperatureExtractorConfiguration',
+    'ChineseTemperatureParserConfiguration', 'Constants', 'Culture', 'CultureInfo', 'CurrencyModel',
+    'CurrencyUnitValue', 'DefinitionLoader', 'DictionaryUtility', 'DimensionModel', 'DutchAgeExtractorConfiguration',
+    'DutchAgeParserConfiguration', 'DutchCurrencyExtractorConfiguration', 'DutchCurrencyParserConfiguration',
+    'DutchDimensionExtractorConfiguration', 'DutchDimensionParserConfiguration', 'DutchNumberExtractor',
+    'DutchNumberParserConfiguration', 'DutchNumberWithUnitExtractorConfiguration',
+    'DutchNumberWithUnitParserConfiguration', 'DutchNumericWithUnit', 'DutchTemperatureExtractorConfiguration',
+    'DutchTemperatureParserConfiguration', 'EnglishAgeExtractorConfiguration', 'EnglishAgeParserConfiguration',
+    'EnglishCurrencyExtractorConfiguration', 'EnglishCurrencyParserConfiguration',
+    'EnglishDimensionExtractorConfiguration', 'EnglishDimensionParserConfiguration',
+    'EnglishTemperatureExtractorConfiguration', 'EnglishTemperatureParserConfiguration', 'ExtractResult', 'Extractor',
+    'ExtractorParserModel', 'FrenchAgeExtractorConfiguration', 'FrenchAgeParserConfiguration',
+    'FrenchCurrencyExtractorConfiguration', 'FrenchCurrencyParserConfiguration',
+    'FrenchDimensionExtractorConfiguration', 'FrenchDimensionParserConfiguration',
+    'FrenchTemperatureExtractorConfiguration', 'FrenchTemperatureParserConfiguration',
+    'GermanCurrencyExtractorConfiguration', 'GermanCurrencyParserConfiguration',
+    'ItalianCurrencyExtractorConfiguration', 'ItalianCurrencyParserConfiguration', 'MatchResult', 'MatchStrategy',
+    'Model', 'ModelResult', 'NumberMode', 'NumberWithUnitExtractor', 'NumberWithUnitExtractorConfiguration',
+    'NumberWithUnitOptions', 'NumberWithUnitParser', 'NumberWithUnitParserConfiguration', 'NumberWithUnitRecognizer',
+    'NumberWithUnitTokenizer', 'ParseResult', 'Parser', 'ParserType', 'PortugueseAgeExtractorConfiguration',
+    'PortugueseAgeParserConfiguration', 'PortugueseCurrencyExtractorConfiguration',
+    'PortugueseCurrencyParserConfiguration', 'PortugueseDimensionExtractorConfiguration',
+    'PortugueseDimensionParserConfiguration', 'PortugueseTemperatureExtractorConfiguration',
+    'PortugueseTemperatureParserConfiguration', 'PrefixUnitResult', 'QueryProcessor', 'Recognizer', 'RegExpUtility',
+    'SpanishAgeExtractorConfiguration', 'SpanishAgeParserConfiguration', 'SpanishCurrencyExtractorConfiguration',
+    'SpanishCurrencyParserConfiguration', 'SpanishDimensionExtractorConfiguration',
+    'SpanishDimensionParserConfiguration', 'SpanishTemperatureExtractorConfiguration',
+    'SpanishTemperatureParserConfiguration', 'StringMatcher', 'TemperatureModel', 'Token', 'UnitValue', 'chinese',
+    'constants', 'dutch', 'english', 'extractors', 'french', 'german', 'italian', 'models',
+    'number_with_unit_recognizer', 'parsers', 'portuguese', 'recognize_age', 'recognize_age_batch',
+    'recognize_currency', 'recognize_currency_batch', 'recognize_dimension', 'recognize_dimension_batch',
+    'recognize_temperature', 'recognize_temperature_batch', 'spanish', 'utilities'
+]
+
+# Each culture is imported when its first model is built, or when one of its names is accessed
+__getattr__, __dir__ = lazy_package(__name__, ['chinese', 'dutch', 'english', 'french', 'german', 'italian',
+                                               'portuguese', 'spanish'])
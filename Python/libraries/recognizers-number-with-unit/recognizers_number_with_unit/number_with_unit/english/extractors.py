@@ -5,6 +5,7 @@ from typing import Dict, List, Pattern
 
 from recognizers_text.culture import Culture
 from recognizers_text.extractor import Extractor
+from recognizers_text.component_registry import ComponentRegistry
 from recognizers_text.utilities import RegExpUtility, DefinitionLoader
 from recognizers_number.culture import CultureInfo
 from recognizers_number.number.models import NumberMode
@@ -60,7 +61,7 @@ class EnglishNumberWithUnitExtractorConfiguration(NumberWithUnitExtractorConfigu
         if culture_info is None:
             culture_info = CultureInfo(Culture.English)
         super().__init__(culture_info)
-        self._unit_num_extractor = EnglishNumberExtractor(NumberMode.Unit)
+        self._unit_num_extractor = ComponentRegistry.get_or_create(EnglishNumberExtractor, NumberMode.Unit)
         self._build_prefix = EnglishNumericWithUnit.BuildPrefix
         self._build_suffix = EnglishNumericWithUnit.BuildSuffix
         self._compound_unit_connector_regex = RegExpUtility.get_safe_reg_exp(
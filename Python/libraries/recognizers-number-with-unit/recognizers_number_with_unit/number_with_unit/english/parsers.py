@@ -4,6 +4,7 @@
 from recognizers_text import Culture
 from recognizers_text.extractor import Extractor
 from recognizers_text.parser import Parser
+from recognizers_text.component_registry import ComponentRegistry
 from recognizers_number.culture import CultureInfo
 from recognizers_number.number.english.extractors import EnglishNumberExtractor, NumberMode
 from recognizers_number.number.parser_factory import AgnosticNumberParserFactory, ParserType
@@ -29,8 +30,8 @@ class EnglishNumberWithUnitParserConfiguration(NumberWithUnitParserConfiguration
         if culture_info is None:
             culture_info = CultureInfo(Culture.English)
         super().__init__(culture_info)
-        self._internal_number_extractor = EnglishNumberExtractor(
-            NumberMode.DEFAULT)
+        self._internal_number_extractor = ComponentRegistry.get_or_create(
+            EnglishNumberExtractor, NumberMode.DEFAULT)
         self._internal_number_parser = AgnosticNumberParserFactory.get_parser(
             ParserType.NUMBER, EnglishNumberParserConfiguration(culture_info))
 
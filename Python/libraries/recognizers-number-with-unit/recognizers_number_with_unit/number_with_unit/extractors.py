@@ -4,7 +4,6 @@
 from abc import ABC, abstractmethod
 from sys import prefix
 from typing import List, Dict, Set, Pattern, Match
-from copy import deepcopy
 from collections import namedtuple
 from itertools import chain
 import regex
@@ -140,9 +139,10 @@ class NumberWithUnitExtractor(Extractor):
     def single_char_unit_regex(self):
         return RegExpUtility.get_safe_reg_exp(BaseUnits.SingleCharUnitRegex)
 
-    def __init__(self, config: NumberWithUnitExtractorConfiguration):
+    def __init__(self, config: NumberWithUnitExtractorConfiguration, match_strategy: MatchStrategy = MatchStrategy.ArrayTrie):
 
         self.config = config
+        self.match_strategy = match_strategy
         self.max_prefix_match_len = 0
 
         if self.config.suffix_list:
@@ -180,8 +180,9 @@ class NumberWithUnitExtractor(Extractor):
         matched = [False] * len(source)
         result = []
         prefix_matched = False
-        prefix_match: List[MatchResult] = sorted(self.prefix_matcher.find(source), key=lambda o: o.start)
-        suffix_match: List[MatchResult] = sorted(self.suffix_matcher.find(source), key=lambda o: o.start)
+        # Matchers yield their matches by start already
+        prefix_match: List[MatchResult] = self.prefix_matcher.find(source)
+        suffix_match: List[MatchResult] = self.suffix_matcher.find(source)
 
         if len(prefix_match) > 0 or len(suffix_match) > 0:
 
@@ -343,7 +344,7 @@ class NumberWithUnitExtractor(Extractor):
         return len(source) != 0
 
     def _extract_separate_units(self, source: str, num_depend_source: List[ExtractResult], non_unit_matches) -> List[ExtractResult]:
-        result = deepcopy(num_depend_source)
+        result = [er.copy() for er in num_depend_source]
         match_result: List[bool] = [False] * len(source)
         for ex_result in num_depend_source:
             start = ex_result.start
@@ -383,7 +384,7 @@ class NumberWithUnitExtractor(Extractor):
 
     def _build_matcher_from_set(self, definitions) -> StringMatcher:
 
-        matcher = StringMatcher(match_strategy=MatchStrategy.TrieTree, tokenizer=NumberWithUnitTokenizer())
+        matcher = StringMatcher(match_strategy=self.match_strategy, tokenizer=NumberWithUnitTokenizer())
 
         match_term_list = list(map(lambda words:
                                    list(filter(lambda word: not str.isspace(word) and word is not None,
@@ -572,19 +573,21 @@ class NumberWithUnitExtractor(Extractor):
 
 
 class BaseMergedUnitExtractor(Extractor):
-    def __init__(self, config: NumberWithUnitExtractorConfiguration):
+    def __init__(self, config: NumberWithUnitExtractorConfiguration, match_strategy: MatchStrategy = MatchStrategy.ArrayTrie):
         self.config = config
+        # Building the unit matchers is far costlier than an extraction, so it's done once
+        self.__unit_extractor = NumberWithUnitExtractor(config, match_strategy)
 
     def extract(self, source: str) -> List[ExtractResult]:
         if self.config.extract_type == Constants.SYS_UNIT_CURRENCY:
             result = self.__merged_compound_units(source)
         else:
-            result = NumberWithUnitExtractor(self.config).extract(source)
+            result = self.__unit_extractor.extract(source)
 
         return result
 
     def __merged_compound_units(self, source: str):
-        ers = NumberWithUnitExtractor(self.config).extract(source)
+        ers = self.__unit_extractor.extract(source)
         ers = self.__merge_pure_number(source, ers)
 
         result = []
@@ -7,7 +7,7 @@ from typing import List
 from recognizers_text.model import Model, ModelResult
 from recognizers_text.extractor import Extractor
 from recognizers_text.parser import Parser
-from recognizers_text.utilities import QueryProcessor
+from recognizers_text.utilities import QueryProcessor, TimeBudget
 from recognizers_number_with_unit.number_with_unit.parsers import UnitValue, CurrencyUnitValue
 
 
@@ -26,37 +26,38 @@ class AbstractNumberWithUnitModel(Model):
     def __init__(self, extractor_parser: List[ExtractorParserModel]):
         self.extractor_parser: List[ExtractorParserModel] = extractor_parser
 
-    def parse(self, query: str) -> List[ModelResult]:
+    def parse(self, query: str, timeout_ms: float = None) -> List[ModelResult]:
 
         query = QueryProcessor.preprocess(query, True)
         extraction_results = []
         parse_results = []
 
         try:
-            for item in self.extractor_parser:
-                extract_results = item.extractor.extract(query)
-                for result in extract_results:
-                    r = item.parser.parse(result)
-                    if r.value is not None:
-                        if isinstance(r.value, list):
-                            for j in r.value:
-                                parse_results.append(j)
-                        else:
-                            parse_results.append(r)
-
-                for parse_result in parse_results:
-                    model_result = ModelResult()
-                    model_result.start = parse_result.start
-                    model_result.end = parse_result.start + parse_result.length - 1
-                    model_result.text = parse_result.text
-                    model_result.type_name = self.model_type_name
-                    model_result.resolution = self.get_resolution(
-                        parse_result.value)
-
-                    b_add = not [x for x in extraction_results if (model_result.start <= x.start and model_result.end >= x.end)]
-
-                    if b_add:
-                        extraction_results.append(model_result)
+            with TimeBudget(timeout_ms):
+                for item in self.extractor_parser:
+                    extract_results = TimeBudget.run(item.extractor.extract, query, fallback=[])
+                    for result in extract_results:
+                        r = item.parser.parse(result)
+                        if r.value is not None:
+                            if isinstance(r.value, list):
+                                for j in r.value:
+                                    parse_results.append(j)
+                            else:
+                                parse_results.append(r)
+
+                    for parse_result in parse_results:
+                        model_result = ModelResult()
+                        model_result.start = parse_result.start
+                        model_result.end = parse_result.start + parse_result.length - 1
+                        model_result.text = parse_result.text
+                        model_result.type_name = self.model_type_name
+                        model_result.resolution = self.get_resolution(
+                            parse_result.value)
+
+                        b_add = not [x for x in extraction_results if (model_result.start <= x.start and model_result.end >= x.end)]
+
+                        if b_add:
+                            extraction_results.append(model_result)
         except Exception:
             pass
 
@@ -2,65 +2,13 @@
 #  Licensed under the MIT License.
 
 from enum import IntFlag
-from typing import List
-from recognizers_text import Culture, Recognizer
+from typing import List, Iterable
+from recognizers_text import Culture, Recognizer, ComponentRegistry
 from recognizers_text.model import Model, ModelResult
 from recognizers_number.culture import CultureInfo
 from .models import CurrencyModel, TemperatureModel, DimensionModel, AgeModel, ExtractorParserModel
 from .extractors import NumberWithUnitExtractor, BaseMergedUnitExtractor
 from .parsers import NumberWithUnitParser, BaseMergedUnitParser
-from .english.extractors import (EnglishCurrencyExtractorConfiguration,
-                                 EnglishTemperatureExtractorConfiguration,
-                                 EnglishDimensionExtractorConfiguration,
-                                 EnglishAgeExtractorConfiguration)
-from .english.parsers import (EnglishCurrencyParserConfiguration,
-                              EnglishTemperatureParserConfiguration,
-                              EnglishDimensionParserConfiguration,
-                              EnglishAgeParserConfiguration)
-from .chinese.extractors import (ChineseCurrencyExtractorConfiguration,
-                                 ChineseTemperatureExtractorConfiguration,
-                                 ChineseDimensionExtractorConfiguration,
-                                 ChineseAgeExtractorConfiguration)
-from .chinese.parsers import (ChineseCurrencyParserConfiguration,
-                              ChineseTemperatureParserConfiguration,
-                              ChineseDimensionParserConfiguration,
-                              ChineseAgeParserConfiguration)
-from .dutch.extractors import (DutchCurrencyExtractorConfiguration,
-                               DutchTemperatureExtractorConfiguration,
-                               DutchDimensionExtractorConfiguration,
-                               DutchAgeExtractorConfiguration)
-from .dutch.parsers import (DutchCurrencyParserConfiguration,
-                            DutchTemperatureParserConfiguration,
-                            DutchDimensionParserConfiguration,
-                            DutchAgeParserConfiguration)
-from .spanish.extractors import (SpanishCurrencyExtractorConfiguration,
-                                 SpanishTemperatureExtractorConfiguration,
-                                 SpanishDimensionExtractorConfiguration,
-                                 SpanishAgeExtractorConfiguration)
-from .spanish.parsers import (SpanishCurrencyParserConfiguration,
-                              SpanishTemperatureParserConfiguration,
-                              SpanishDimensionParserConfiguration,
-                              SpanishAgeParserConfiguration)
-from .french.extractors import (FrenchCurrencyExtractorConfiguration,
-                                FrenchTemperatureExtractorConfiguration,
-                                FrenchDimensionExtractorConfiguration,
-                                FrenchAgeExtractorConfiguration)
-from .french.parsers import (FrenchCurrencyParserConfiguration,
-                             FrenchTemperatureParserConfiguration,
-                             FrenchDimensionParserConfiguration,
-                             FrenchAgeParserConfiguration)
-from .portuguese.extractors import (PortugueseCurrencyExtractorConfiguration,
-                                    PortugueseTemperatureExtractorConfiguration,
-                                    PortugueseDimensionExtractorConfiguration,
-                                    PortugueseAgeExtractorConfiguration)
-from .portuguese.parsers import (PortugueseCurrencyParserConfiguration,
-                                 PortugueseTemperatureParserConfiguration,
-                                 PortugueseDimensionParserConfiguration,
-                                 PortugueseAgeParserConfiguration)
-from .german.extractors import GermanCurrencyExtractorConfiguration
-from .german.parsers import GermanCurrencyParserConfiguration
-from .italian.extractors import ItalianCurrencyExtractorConfiguration
-from .italian.parsers import ItalianCurrencyParserConfiguration
 
 
 class NumberWithUnitOptions(IntFlag):
@@ -76,26 +24,53 @@ class NumberWithUnitRecognizer(Recognizer[NumberWithUnitOptions]):
         super().__init__(target_culture, options, lazy_initialization)
 
     def initialize_configuration(self):
-        # region English
+        self.register_culture(Culture.English, self.__initialize_english)
+        self.register_culture(Culture.Chinese, self.__initialize_chinese)
+        self.register_culture(Culture.Dutch, self.__initialize_dutch)
+        self.register_culture(Culture.French, self.__initialize_french)
+        self.register_culture(Culture.Portuguese, self.__initialize_portuguese)
+        self.register_culture(Culture.Spanish, self.__initialize_spanish)
+        self.register_culture(Culture.SpanishMexican, self.__initialize_spanish_mexican)
+        self.register_culture(Culture.Italian, self.__initialize_italian)
+        self.register_culture(Culture.German, self.__initialize_german)
+
+    def __initialize_english(self):
+        from .english.extractors import EnglishCurrencyExtractorConfiguration, EnglishTemperatureExtractorConfiguration, \
+            EnglishDimensionExtractorConfiguration, EnglishAgeExtractorConfiguration
+        from .english.parsers import EnglishCurrencyParserConfiguration, EnglishTemperatureParserConfiguration, \
+            EnglishDimensionParserConfiguration, EnglishAgeParserConfiguration
+
         self.register_model('CurrencyModel', Culture.English, lambda options: CurrencyModel(
-            [ExtractorParserModel(BaseMergedUnitExtractor(EnglishCurrencyExtractorConfiguration(
-            )), BaseMergedUnitParser(EnglishCurrencyParserConfiguration()))]
+            [ExtractorParserModel(
+                BaseMergedUnitExtractor(ComponentRegistry.get_or_create(EnglishCurrencyExtractorConfiguration)),
+                BaseMergedUnitParser(ComponentRegistry.get_or_create(EnglishCurrencyParserConfiguration)))]
         ))
         self.register_model('TemperatureModel', Culture.English, lambda options: TemperatureModel(
-            [ExtractorParserModel(NumberWithUnitExtractor(EnglishTemperatureExtractorConfiguration(
-            )), NumberWithUnitParser(EnglishTemperatureParserConfiguration()))]
+            [ExtractorParserModel(
+                NumberWithUnitExtractor(ComponentRegistry.get_or_create(EnglishTemperatureExtractorConfiguration)),
+                NumberWithUnitParser(ComponentRegistry.get_or_create(EnglishTemperatureParserConfiguration)))]
         ))
         self.register_model('DimensionModel', Culture.English, lambda options: DimensionModel(
-            [ExtractorParserModel(NumberWithUnitExtractor(EnglishDimensionExtractorConfiguration(
-            )), NumberWithUnitParser(EnglishDimensionParserConfiguration()))]
+            [ExtractorParserModel(
+                NumberWithUnitExtractor(ComponentRegistry.get_or_create(EnglishDimensionExtractorConfiguration)),
+                NumberWithUnitParser(ComponentRegistry.get_or_create(EnglishDimensionParserConfiguration)))]
         ))
         self.register_model('AgeModel', Culture.English, lambda options: AgeModel(
-            [ExtractorParserModel(NumberWithUnitExtractor(EnglishAgeExtractorConfiguration(
-            )), NumberWithUnitParser(EnglishAgeParserConfiguration()))]
+            [ExtractorParserModel(
+                NumberWithUnitExtractor(ComponentRegistry.get_or_create(EnglishAgeExtractorConfiguration)),
+                NumberWithUnitParser(ComponentRegistry.get_or_create(EnglishAgeParserConfiguration)))]
         ))
-        # endregion
 
-        # region Chinese
+    def __initialize_chinese(self):
+        from .english.extractors import EnglishCurrencyExtractorConfiguration, EnglishTemperatureExtractorConfiguration, \
+            EnglishDimensionExtractorConfiguration, EnglishAgeExtractorConfiguration
+        from .english.parsers import EnglishCurrencyParserConfiguration, EnglishTemperatureParserConfiguration, \
+            EnglishDimensionParserConfiguration, EnglishAgeParserConfiguration
+        from .chinese.extractors import ChineseCurrencyExtractorConfiguration, ChineseTemperatureExtractorConfiguration, \
+            ChineseDimensionExtractorConfiguration, ChineseAgeExtractorConfiguration
+        from .chinese.parsers import ChineseCurrencyParserConfiguration, ChineseTemperatureParserConfiguration, \
+            ChineseDimensionParserConfiguration, ChineseAgeParserConfiguration
+
         self.register_model('CurrencyModel', Culture.Chinese, lambda options: CurrencyModel([
             ExtractorParserModel(
                 BaseMergedUnitExtractor(
@@ -103,8 +78,8 @@ class NumberWithUnitRecognizer(Recognizer[NumberWithUnitOptions]):
                 BaseMergedUnitParser(ChineseCurrencyParserConfiguration())),
             ExtractorParserModel(
                 NumberWithUnitExtractor(
-                    EnglishCurrencyExtractorConfiguration()),
-                NumberWithUnitParser(EnglishCurrencyParserConfiguration()))
+                    ComponentRegistry.get_or_create(EnglishCurrencyExtractorConfiguration)),
+                NumberWithUnitParser(ComponentRegistry.get_or_create(EnglishCurrencyParserConfiguration)))
         ]))
         self.register_model('TemperatureModel', Culture.Chinese, lambda options: TemperatureModel([
             ExtractorParserModel(
@@ -113,8 +88,8 @@ class NumberWithUnitRecognizer(Recognizer[NumberWithUnitOptions]):
                 NumberWithUnitParser(ChineseTemperatureParserConfiguration())),
             ExtractorParserModel(
                 NumberWithUnitExtractor(
-                    EnglishTemperatureExtractorConfiguration()),
-                NumberWithUnitParser(EnglishTemperatureParserConfiguration()))
+                    ComponentRegistry.get_or_create(EnglishTemperatureExtractorConfiguration)),
+                NumberWithUnitParser(ComponentRegistry.get_or_create(EnglishTemperatureParserConfiguration)))
         ]))
         self.register_model('DimensionModel', Culture.Chinese, lambda options: DimensionModel([
             ExtractorParserModel(
@@ -123,20 +98,24 @@ class NumberWithUnitRecognizer(Recognizer[NumberWithUnitOptions]):
                 NumberWithUnitParser(ChineseDimensionParserConfiguration())),
             ExtractorParserModel(
                 NumberWithUnitExtractor(
-                    EnglishDimensionExtractorConfiguration()),
-                NumberWithUnitParser(EnglishDimensionParserConfiguration()))
+                    ComponentRegistry.get_or_create(EnglishDimensionExtractorConfiguration)),
+                NumberWithUnitParser(ComponentRegistry.get_or_create(EnglishDimensionParserConfiguration)))
         ]))
         self.register_model('AgeModel', Culture.Chinese, lambda options: AgeModel([
             ExtractorParserModel(
                 NumberWithUnitExtractor(ChineseAgeExtractorConfiguration()),
                 NumberWithUnitParser(ChineseAgeParserConfiguration())),
             ExtractorParserModel(
-                NumberWithUnitExtractor(EnglishAgeExtractorConfiguration()),
-                NumberWithUnitParser(EnglishAgeParserConfiguration()))
+                NumberWithUnitExtractor(ComponentRegistry.get_or_create(EnglishAgeExtractorConfiguration)),
+                NumberWithUnitParser(ComponentRegistry.get_or_create(EnglishAgeParserConfiguration)))
         ]))
-        # endregion
 
-        # region Dutch
+    def __initialize_dutch(self):
+        from .dutch.extractors import DutchCurrencyExtractorConfiguration, DutchTemperatureExtractorConfiguration, \
+            DutchDimensionExtractorConfiguration, DutchAgeExtractorConfiguration
+        from .dutch.parsers import DutchCurrencyParserConfiguration, DutchTemperatureParserConfiguration, \
+            DutchDimensionParserConfiguration, DutchAgeParserConfiguration
+
         self.register_model('CurrencyModel', Culture.Dutch, lambda options: CurrencyModel(
             [ExtractorParserModel(BaseMergedUnitExtractor(DutchCurrencyExtractorConfiguration(
             )), BaseMergedUnitParser(DutchCurrencyParserConfiguration()))]
@@ -158,9 +137,13 @@ class NumberWithUnitRecognizer(Recognizer[NumberWithUnitOptions]):
                 NumberWithUnitExtractor(DutchAgeExtractorConfiguration()),
                 NumberWithUnitParser(DutchAgeParserConfiguration()))
         ]))
-        # endregion
 
-        # region French
+    def __initialize_french(self):
+        from .french.extractors import FrenchCurrencyExtractorConfiguration, FrenchTemperatureExtractorConfiguration, \
+            FrenchDimensionExtractorConfiguration, FrenchAgeExtractorConfiguration
+        from .french.parsers import FrenchCurrencyParserConfiguration, FrenchTemperatureParserConfiguration, \
+            FrenchDimensionParserConfiguration, FrenchAgeParserConfiguration
+
         self.register_model('CurrencyModel', Culture.French, lambda options: CurrencyModel(
             [ExtractorParserModel(BaseMergedUnitExtractor(FrenchCurrencyExtractorConfiguration(
             )), BaseMergedUnitParser(FrenchCurrencyParserConfiguration()))]
@@ -182,9 +165,13 @@ class NumberWithUnitRecognizer(Recognizer[NumberWithUnitOptions]):
                 NumberWithUnitExtractor(FrenchAgeExtractorConfiguration()),
                 NumberWithUnitParser(FrenchAgeParserConfiguration()))
         ]))
-        # endregion
 
-        # region Portuguese
+    def __initialize_portuguese(self):
+        from .portuguese.extractors import PortugueseCurrencyExtractorConfiguration, PortugueseTemperatureExtractorConfiguration, \
+            PortugueseDimensionExtractorConfiguration, PortugueseAgeExtractorConfiguration
+        from .portuguese.parsers import PortugueseCurrencyParserConfiguration, PortugueseTemperatureParserConfiguration, \
+            PortugueseDimensionParserConfiguration, PortugueseAgeParserConfiguration
+
         self.register_model('CurrencyModel', Culture.Portuguese, lambda options: CurrencyModel(
             [ExtractorParserModel(BaseMergedUnitExtractor(PortugueseCurrencyExtractorConfiguration(
             )), BaseMergedUnitParser(PortugueseCurrencyParserConfiguration()))]
@@ -206,9 +193,13 @@ class NumberWithUnitRecognizer(Recognizer[NumberWithUnitOptions]):
                 NumberWithUnitExtractor(PortugueseAgeExtractorConfiguration()),
                 NumberWithUnitParser(PortugueseAgeParserConfiguration()))
         ]))
-        # endregion
 
-        # region Spanish
+    def __initialize_spanish(self):
+        from .spanish.extractors import SpanishCurrencyExtractorConfiguration, SpanishTemperatureExtractorConfiguration, \
+            SpanishDimensionExtractorConfiguration, SpanishAgeExtractorConfiguration
+        from .spanish.parsers import SpanishCurrencyParserConfiguration, SpanishTemperatureParserConfiguration, \
+            SpanishDimensionParserConfiguration, SpanishAgeParserConfiguration
+
         self.register_model('CurrencyModel', Culture.Spanish, lambda options: CurrencyModel(
             [ExtractorParserModel(BaseMergedUnitExtractor(SpanishCurrencyExtractorConfiguration(
             )), BaseMergedUnitParser(SpanishCurrencyParserConfiguration()))]
@@ -225,9 +216,13 @@ class NumberWithUnitRecognizer(Recognizer[NumberWithUnitOptions]):
             [ExtractorParserModel(NumberWithUnitExtractor(SpanishAgeExtractorConfiguration(
             )), NumberWithUnitParser(SpanishAgeParserConfiguration()))]
         ))
-        # endregion
 
-        # region Spanish Mexican
+    def __initialize_spanish_mexican(self):
+        from .spanish.extractors import SpanishCurrencyExtractorConfiguration, SpanishTemperatureExtractorConfiguration, \
+            SpanishDimensionExtractorConfiguration, SpanishAgeExtractorConfiguration
+        from .spanish.parsers import SpanishCurrencyParserConfiguration, SpanishTemperatureParserConfiguration, \
+            SpanishDimensionParserConfiguration, SpanishAgeParserConfiguration
+
         self.register_model('CurrencyModel', Culture.SpanishMexican, lambda options: CurrencyModel(
             [ExtractorParserModel(BaseMergedUnitExtractor(SpanishCurrencyExtractorConfiguration(
             )), BaseMergedUnitParser(SpanishCurrencyParserConfiguration(culture_info=CultureInfo(Culture.SpanishMexican))))]
@@ -244,18 +239,22 @@ class NumberWithUnitRecognizer(Recognizer[NumberWithUnitOptions]):
             [ExtractorParserModel(NumberWithUnitExtractor(SpanishAgeExtractorConfiguration(
             )), NumberWithUnitParser(SpanishAgeParserConfiguration(culture_info=CultureInfo(Culture.SpanishMexican))))]
         ))
-        # endregion
 
-        # region Italian
+    def __initialize_italian(self):
+        from .italian.extractors import ItalianCurrencyExtractorConfiguration
+        from .italian.parsers import ItalianCurrencyParserConfiguration
+
         self.register_model('CurrencyModel', Culture.Italian, lambda options: CurrencyModel([
             ExtractorParserModel(
                 BaseMergedUnitExtractor(
                     ItalianCurrencyExtractorConfiguration()),
                 BaseMergedUnitParser(ItalianCurrencyParserConfiguration()))
         ]))
-        # endregion
 
-        # region German
+    def __initialize_german(self):
+        from .german.extractors import GermanCurrencyExtractorConfiguration
+        from .german.parsers import GermanCurrencyParserConfiguration
+
         self.register_model('CurrencyModel', Culture.German, lambda options: CurrencyModel([
             ExtractorParserModel(
                 BaseMergedUnitExtractor(
@@ -277,27 +276,63 @@ class NumberWithUnitRecognizer(Recognizer[NumberWithUnitOptions]):
         return self.get_model('TemperatureModel', culture, fallback_to_default_culture)
 
 
-def recognize_age(query: str, culture: str, options: NumberWithUnitOptions = NumberWithUnitOptions.NONE, fallback_to_default_culture: bool = True) -> List[ModelResult]:
+def recognize_age(query: str, culture: str, options: NumberWithUnitOptions = NumberWithUnitOptions.NONE, fallback_to_default_culture: bool = True,
+                  timeout_ms: float = None) -> List[ModelResult]:
     recognizer = NumberWithUnitRecognizer(culture, options)
     model = recognizer.get_age_model(culture, fallback_to_default_culture)
-    return model.parse(query)
+    return model.parse(query, timeout_ms=timeout_ms)
 
 
-def recognize_currency(query: str, culture: str, options: NumberWithUnitOptions = NumberWithUnitOptions.NONE, fallback_to_default_culture: bool = True) -> List[ModelResult]:
+def recognize_currency(query: str, culture: str, options: NumberWithUnitOptions = NumberWithUnitOptions.NONE, fallback_to_default_culture: bool = True,
+                       timeout_ms: float = None) -> List[ModelResult]:
     recognizer = NumberWithUnitRecognizer(culture, options)
     model = recognizer.get_currency_model(culture, fallback_to_default_culture)
-    return model.parse(query)
+    return model.parse(query, timeout_ms=timeout_ms)
 
 
-def recognize_dimension(query: str, culture: str, options: NumberWithUnitOptions = NumberWithUnitOptions.NONE, fallback_to_default_culture: bool = True) -> List[ModelResult]:
+def recognize_dimension(query: str, culture: str, options: NumberWithUnitOptions = NumberWithUnitOptions.NONE, fallback_to_default_culture: bool = True,
+                        timeout_ms: float = None) -> List[ModelResult]:
     recognizer = NumberWithUnitRecognizer(culture, options)
     model = recognizer.get_dimension_model(
         culture, fallback_to_default_culture)
-    return model.parse(query)
+    return model.parse(query, timeout_ms=timeout_ms)
 
 
-def recognize_temperature(query: str, culture: str, options: NumberWithUnitOptions = NumberWithUnitOptions.NONE, fallback_to_default_culture: bool = True) -> List[ModelResult]:
+def recognize_temperature(query: str, culture: str, options: NumberWithUnitOptions = NumberWithUnitOptions.NONE, fallback_to_default_culture: bool = True,
+                          timeout_ms: float = None) -> List[ModelResult]:
     recognizer = NumberWithUnitRecognizer(culture, options)
     model = recognizer.get_temperature_model(
         culture, fallback_to_default_culture)
-    return model.parse(query)
+    return model.parse(query, timeout_ms=timeout_ms)
+
+
+def recognize_age_batch(queries: Iterable[str], culture: str, options: NumberWithUnitOptions = NumberWithUnitOptions.NONE,
+                        fallback_to_default_culture: bool = True,
+                        timeout_ms: float = None) -> List[List[ModelResult]]:
+    recognizer = NumberWithUnitRecognizer(culture, options)
+    model = recognizer.get_age_model(culture, fallback_to_default_culture)
+    return model.parse_batch(queries, timeout_ms=timeout_ms)
+
+
+def recognize_currency_batch(queries: Iterable[str], culture: str, options: NumberWithUnitOptions = NumberWithUnitOptions.NONE,
+                             fallback_to_default_culture: bool = True,
+                             timeout_ms: float = None) -> List[List[ModelResult]]:
+    recognizer = NumberWithUnitRecognizer(culture, options)
+    model = recognizer.get_currency_model(culture, fallback_to_default_culture)
+    return model.parse_batch(queries, timeout_ms=timeout_ms)
+
+
+def recognize_dimension_batch(queries: Iterable[str], culture: str, options: NumberWithUnitOptions = NumberWithUnitOptions.NONE,
+                              fallback_to_default_culture: bool = True,
+                              timeout_ms: float = None) -> List[List[ModelResult]]:
+    recognizer = NumberWithUnitRecognizer(culture, options)
+    model = recognizer.get_dimension_model(culture, fallback_to_default_culture)
+    return model.parse_batch(queries, timeout_ms=timeout_ms)
+
+
+def recognize_temperature_batch(queries: Iterable[str], culture: str, options: NumberWithUnitOptions = NumberWithUnitOptions.NONE,
+                                fallback_to_default_culture: bool = True,
+                                timeout_ms: float = None) -> List[List[ModelResult]]:
+    recognizer = NumberWithUnitRecognizer(culture, options)
+    model = recognizer.get_temperature_model(culture, fallback_to_default_culture)
+    return model.parse_batch(queries, timeout_ms=timeout_ms)
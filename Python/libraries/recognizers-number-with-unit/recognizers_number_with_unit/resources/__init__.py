@@ -1,12 +1,31 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
-from .base_numbers import BaseNumbers
-from .chinese_numeric_with_unit import ChineseNumericWithUnit
-from .english_numeric_with_unit import EnglishNumericWithUnit
-from .french_numeric_with_unit import FrenchNumericWithUnit
-from .italian_numeric_with_unit import ItalianNumericWithUnit
-from .german_numeric_with_unit import GermanNumericWithUnit
-from .dutch_numeric_with_unit import DutchNumericWithUnit
-from .portuguese_numeric_with_unit import PortugueseNumericWithUnit
-from .spanish_numeric_with_unit import SpanishNumericWithUnit
+import os
+from recognizers_text.lazy_imports import lazy_package
+from recognizers_text.matcher.array_trie import ArrayTrie
+
+# Star imports resolve these names, most of which are only imported on first access
+__all__ = [
+    'BaseNumbers', 'ChineseNumericWithUnit', 'DutchNumericWithUnit', 'EnglishNumericWithUnit', 'FrenchNumericWithUnit',
+    'GermanNumericWithUnit', 'ItalianNumericWithUnit', 'PortugueseNumericWithUnit', 'SpanishNumericWithUnit',
+    'base_currency', 'base_numbers', 'base_units', 'chinese_numeric_with_unit', 'dutch_numeric_with_unit',
+    'english_numeric_with_unit', 'french_numeric_with_unit', 'german_numeric_with_unit', 'italian_numeric_with_unit',
+    'portuguese_numeric_with_unit', 'spanish_numeric_with_unit'
+]
+
+# Each resource module is only imported when its class is first used
+__getattr__, __dir__ = lazy_package(__name__, attributes={
+    'BaseNumbers': 'base_numbers',
+    'ChineseNumericWithUnit': 'chinese_numeric_with_unit',
+    'EnglishNumericWithUnit': 'english_numeric_with_unit',
+    'FrenchNumericWithUnit': 'french_numeric_with_unit',
+    'ItalianNumericWithUnit': 'italian_numeric_with_unit',
+    'GermanNumericWithUnit': 'german_numeric_with_unit',
+    'DutchNumericWithUnit': 'dutch_numeric_with_unit',
+    'PortugueseNumericWithUnit': 'portuguese_numeric_with_unit',
+    'SpanishNumericWithUnit': 'spanish_numeric_with_unit'
+})
+
+# Dictionaries prebuilt by resource-generator/matchers.py, mapped rather than built again
+ArrayTrie.add_prebuilt_path(os.path.join(os.path.dirname(__file__), 'matchers'))
@@ -24,6 +24,7 @@ setup(
     long_description=read('README.rst'),
     license='MIT',
     packages=find_packages(),
+    package_data={'recognizers_number_with_unit': ['resources/matchers/*.bin']},
     install_requires=REQUIRES,
     classifiers=[
         'Programming Language :: Python :: 3.6',
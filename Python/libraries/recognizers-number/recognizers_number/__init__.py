@@ -1,5 +1,47 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
-from .number import *
-from .resources import *
+from recognizers_text.lazy_imports import lazy_package
+from . import number
+
+# Star imports resolve these names, most of which are only imported on first access
+__all__ = [
+    'AbstractNumberModel', 'AgnosticNumberParserFactory', 'BaseMergedNumberExtractor', 'BaseNumberExtractor',
+    'BaseNumberParser', 'BaseNumbers', 'BasePercentageExtractor', 'BasePercentageParser', 'CJKNumberParser',
+    'CJKNumberParserConfiguration', 'ChineseCardinalExtractor', 'ChineseDoubleExtractor', 'ChineseFractionExtractor',
+    'ChineseIntegerExtractor', 'ChineseNumberExtractor', 'ChineseNumberExtractorMode',
+    'ChineseNumberParserConfiguration', 'ChineseNumeric', 'ChineseOrdinalExtractor', 'ChinesePercentageExtractor',
+    'Constants', 'Culture', 'CultureInfo', 'DutchCardinalExtractor', 'DutchDoubleExtractor', 'DutchFractionExtractor',
+    'DutchIntegerExtractor', 'DutchMergedNumberExtractor', 'DutchNumberExtractor', 'DutchNumberParserConfiguration',
+    'DutchNumeric', 'DutchOrdinalExtractor', 'DutchPercentageExtractor', 'EnglishCardinalExtractor',
+    'EnglishDoubleExtractor', 'EnglishFractionExtractor', 'EnglishIntegerExtractor', 'EnglishMergedNumberExtractor',
+    'EnglishNumberExtractor', 'EnglishNumberParserConfiguration', 'EnglishNumeric', 'EnglishOrdinalExtractor',
+    'EnglishPercentageExtractor', 'ExtractResult', 'Extractor', 'FrenchCardinalExtractor', 'FrenchDoubleExtractor',
+    'FrenchFractionExtractor', 'FrenchIntegerExtractor', 'FrenchNumberExtractor', 'FrenchNumberParserConfiguration',
+    'FrenchNumeric', 'FrenchOrdinalExtractor', 'FrenchPercentageExtractor', 'GermanCardinalExtractor',
+    'GermanDoubleExtractor', 'GermanFractionExtractor', 'GermanIntegerExtractor', 'GermanMergedNumberExtractor',
+    'GermanNumberExtractor', 'GermanNumberParserConfiguration', 'GermanNumeric', 'GermanOrdinalExtractor',
+    'GermanPercentageExtractor', 'ItalianCardinalExtractor', 'ItalianDoubleExtractor', 'ItalianFractionExtractor',
+    'ItalianIntegerExtractor', 'ItalianMergedNumberExtractor', 'ItalianNumberExtractor',
+    'ItalianNumberParserConfiguration', 'ItalianNumeric', 'ItalianOrdinalExtractor', 'ItalianPercentageExtractor',
+    'JapaneseCardinalExtractor', 'JapaneseDoubleExtractor', 'JapaneseFractionExtractor', 'JapaneseIntegerExtractor',
+    'JapaneseNumberExtractor', 'JapaneseNumberExtractorMode', 'JapaneseNumberParserConfiguration', 'JapaneseNumeric',
+    'JapaneseOrdinalExtractor', 'JapanesePercentageExtractor', 'LongFormatMode', 'LongFormatType', 'MatchesVal',
+    'MetaData', 'Model', 'ModelResult', 'NumberMode', 'NumberModel', 'NumberOptions', 'NumberParserConfiguration',
+    'NumberRecognizer', 'OrdinalModel', 'ParseResult', 'Parser', 'ParserType', 'PercentModel',
+    'PortugueseCardinalExtractor', 'PortugueseDoubleExtractor', 'PortugueseFractionExtractor',
+    'PortugueseIntegerExtractor', 'PortugueseNumberExtractor', 'PortugueseNumberParserConfiguration',
+    'PortugueseNumeric', 'PortugueseOrdinalExtractor', 'PortuguesePercentageExtractor', 'QueryProcessor', 'ReRe',
+    'ReVal', 'Recognizer', 'RegExpUtility', 'SourcePositionResults', 'SpanishCardinalExtractor',
+    'SpanishDoubleExtractor', 'SpanishFractionExtractor', 'SpanishIntegerExtractor', 'SpanishNumberExtractor',
+    'SpanishNumberParserConfiguration', 'SpanishNumeric', 'SpanishOrdinalExtractor', 'SpanishPercentageExtractor',
+    'base_numbers', 'chinese', 'chinese_numeric', 'cjk_parsers', 'constants', 'culture', 'dutch', 'dutch_numeric',
+    'english', 'english_numeric', 'extractors', 'french', 'french_numeric', 'german', 'german_numeric', 'italian',
+    'italian_numeric', 'japanese', 'japanese_numeric', 'models', 'number', 'number_recognizer', 'parser_factory',
+    'parsers', 'portuguese', 'portuguese_numeric', 'precision', 'recognize_number', 'recognize_number_batch',
+    'recognize_ordinal', 'recognize_ordinal_batch', 'recognize_percentage', 'recognize_percentage_batch', 'resources',
+    'spanish', 'spanish_numeric', 'utilities'
+]
+
+# The recognizers, resources and culture specific modules are only imported when first used
+__getattr__, __dir__ = lazy_package(__name__, ['number', 'resources'])
@@ -1,18 +1,51 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
+from recognizers_text.lazy_imports import lazy_package
 from .models import *
 from .extractors import *
 from .parsers import *
-from .english import *
-from .dutch import *
-from .german import *
-from .spanish import *
-from .chinese import *
-from .french import *
-from .japanese import *
-from .italian import *
-from .portuguese import *
 from .number_recognizer import *
 from .parser_factory import *
 from .utilities import *
+
+# Star imports resolve these names, most of which are only imported on first access
+__all__ = [
+    'AbstractNumberModel', 'AgnosticNumberParserFactory', 'BaseMergedNumberExtractor', 'BaseNumberExtractor',
+    'BaseNumberParser', 'BaseNumbers', 'BasePercentageExtractor', 'BasePercentageParser', 'CJKNumberParser',
+    'CJKNumberParserConfiguration', 'ChineseCardinalExtractor', 'ChineseDoubleExtractor', 'ChineseFractionExtractor',
+    'ChineseIntegerExtractor', 'ChineseNumberExtractor', 'ChineseNumberExtractorMode',
+    'ChineseNumberParserConfiguration', 'ChineseNumeric', 'ChineseOrdinalExtractor', 'ChinesePercentageExtractor',
+    'Constants', 'Culture', 'CultureInfo', 'DutchCardinalExtractor', 'DutchDoubleExtractor', 'DutchFractionExtractor',
+    'DutchIntegerExtractor', 'DutchMergedNumberExtractor', 'DutchNumberExtractor', 'DutchNumberParserConfiguration',
+    'DutchNumeric', 'DutchOrdinalExtractor', 'DutchPercentageExtractor', 'EnglishCardinalExtractor',
+    'EnglishDoubleExtractor', 'EnglishFractionExtractor', 'EnglishIntegerExtractor', 'EnglishMergedNumberExtractor',
+    'EnglishNumberExtractor', 'EnglishNumberParserConfiguration', 'EnglishNumeric', 'EnglishOrdinalExtractor',
+    'EnglishPercentageExtractor', 'ExtractResult', 'Extractor', 'FrenchCardinalExtractor', 'FrenchDoubleExtractor',
+    'FrenchFractionExtractor', 'FrenchIntegerExtractor', 'FrenchNumberExtractor', 'FrenchNumberParserConfiguration',
+    'FrenchNumeric', 'FrenchOrdinalExtractor', 'FrenchPercentageExtractor', 'GermanCardinalExtractor',
+    'GermanDoubleExtractor', 'GermanFractionExtractor', 'GermanIntegerExtractor', 'GermanMergedNumberExtractor',
+    'GermanNumberExtractor', 'GermanNumberParserConfiguration', 'GermanNumeric', 'GermanOrdinalExtractor',
+    'GermanPercentageExtractor', 'ItalianCardinalExtractor', 'ItalianDoubleExtractor', 'ItalianFractionExtractor',
+    'ItalianIntegerExtractor', 'ItalianMergedNumberExtractor', 'ItalianNumberExtractor',
+    'ItalianNumberParserConfiguration', 'ItalianNumeric', 'ItalianOrdinalExtractor', 'ItalianPercentageExtractor',
+    'JapaneseCardinalExtractor', 'JapaneseDoubleExtractor', 'JapaneseFractionExtractor', 'JapaneseIntegerExtractor',
+    'JapaneseNumberExtractor', 'JapaneseNumberExtractorMode', 'JapaneseNumberParserConfiguration', 'JapaneseNumeric',
+    'JapaneseOrdinalExtractor', 'JapanesePercentageExtractor', 'LongFormatMode', 'LongFormatType', 'MatchesVal',
+    'MetaData', 'Model', 'ModelResult', 'NumberMode', 'NumberModel', 'NumberOptions', 'NumberParserConfiguration',
+    'NumberRecognizer', 'OrdinalModel', 'ParseResult', 'Parser', 'ParserType', 'PercentModel',
+    'PortugueseCardinalExtractor', 'PortugueseDoubleExtractor', 'PortugueseFractionExtractor',
+    'PortugueseIntegerExtractor', 'PortugueseNumberExtractor', 'PortugueseNumberParserConfiguration',
+    'PortugueseNumeric', 'PortugueseOrdinalExtractor', 'PortuguesePercentageExtractor', 'QueryProcessor', 'ReRe',
+    'ReVal', 'Recognizer', 'RegExpUtility', 'SourcePositionResults', 'SpanishCardinalExtractor',
+    'SpanishDoubleExtractor', 'SpanishFractionExtractor', 'SpanishIntegerExtractor', 'SpanishNumberExtractor',
+    'SpanishNumberParserConfiguration', 'SpanishNumeric', 'SpanishOrdinalExtractor', 'SpanishPercentageExtractor',
+    'chinese', 'cjk_parsers', 'constants', 'dutch', 'english', 'extractors', 'french', 'german', 'italian', 'japanese',
+    'models', 'number_recognizer', 'parser_factory', 'parsers', 'portuguese', 'precision', 'recognize_number',
+    'recognize_number_batch', 'recognize_ordinal', 'recognize_ordinal_batch', 'recognize_percentage',
+    'recognize_percentage_batch', 'spanish', 'utilities'
+]
+
+# Each culture is imported when its first model is built, or when one of its names is accessed
+__getattr__, __dir__ = lazy_package(__name__, ['english', 'dutch', 'german', 'spanish', 'chinese', 'french',
+                                               'japanese', 'italian', 'portuguese'])
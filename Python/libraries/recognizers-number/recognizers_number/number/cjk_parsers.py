@@ -5,7 +5,6 @@ from abc import abstractmethod
 from typing import List, Dict, Pattern, Optional
 from collections import namedtuple
 from decimal import Decimal, getcontext
-import copy
 import regex
 
 from recognizers_text.utilities import RegExpUtility
@@ -123,7 +122,7 @@ class CJKNumberParser(BaseNumberParser):
     def parse(self, source: ExtractResult) -> Optional[ParseResult]:
         result: ParseResult
         extra: str = source.data
-        simplified_source: ExtractResult = copy.deepcopy(source)
+        simplified_source: ExtractResult = source.copy()
         simplified_source.text = self.replace_trad_with_simplified(source.text)
 
         if not extra:
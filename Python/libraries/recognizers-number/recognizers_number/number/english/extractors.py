@@ -5,6 +5,7 @@ from typing import Pattern, List, NamedTuple
 import regex
 
 from recognizers_text.utilities import RegExpUtility
+from recognizers_text.component_registry import ComponentRegistry
 from recognizers_number.number.models import NumberMode, LongFormatMode
 from recognizers_number.resources import BaseNumbers
 from recognizers_number.resources.english_numeric import EnglishNumeric
@@ -36,18 +37,18 @@ class EnglishNumberExtractor(BaseNumberExtractor):
         cardinal_ex: EnglishCardinalExtractor = None
 
         if mode is NumberMode.PURE_NUMBER:
-            cardinal_ex = EnglishCardinalExtractor(
-                EnglishNumeric.PlaceHolderPureNumber)
+            cardinal_ex = ComponentRegistry.get_or_create(
+                EnglishCardinalExtractor, EnglishNumeric.PlaceHolderPureNumber)
         elif mode is NumberMode.CURRENCY:
             self.__regexes.append(ReVal(re=RegExpUtility.get_safe_reg_exp(
                 EnglishNumeric.CurrencyRegex), val='IntegerNum'))
 
         if cardinal_ex is None:
-            cardinal_ex = EnglishCardinalExtractor()
+            cardinal_ex = ComponentRegistry.get_or_create(EnglishCardinalExtractor)
 
         self.__regexes.extend(cardinal_ex.regexes)
 
-        fraction_ex = EnglishFractionExtractor(mode)
+        fraction_ex = ComponentRegistry.get_or_create(EnglishFractionExtractor, mode)
         self.__regexes.extend(fraction_ex.regexes)
 
         ambiguity_filters_dict: List[ReRe] = list()
@@ -72,11 +73,11 @@ class EnglishCardinalExtractor(BaseNumberExtractor):
         self.__regexes: List[ReVal] = list()
 
         # Add integer regexes
-        integer_ex = EnglishIntegerExtractor(placeholder)
+        integer_ex = ComponentRegistry.get_or_create(EnglishIntegerExtractor, placeholder)
         self.__regexes.extend(integer_ex.regexes)
 
         # Add double regexes
-        double_ex = EnglishDoubleExtractor(placeholder)
+        double_ex = ComponentRegistry.get_or_create(EnglishDoubleExtractor, placeholder)
         self.__regexes.extend(double_ex.regexes)
 
 
@@ -245,7 +246,7 @@ class EnglishOrdinalExtractor(BaseNumberExtractor):
 
 class EnglishPercentageExtractor(BasePercentageExtractor):
     def __init__(self):
-        super().__init__(EnglishNumberExtractor(NumberMode.DEFAULT))
+        super().__init__(ComponentRegistry.get_or_create(EnglishNumberExtractor, NumberMode.DEFAULT))
 
     def get_definitions(self) -> List[str]:
         return [
@@ -265,4 +266,4 @@ class EnglishMergedNumberExtractor(BaseMergedNumberExtractor):
         return RegExpUtility.get_safe_reg_exp(EnglishNumeric.ConnectorRegex)
 
     def __init__(self, mode: NumberMode = NumberMode.DEFAULT):
-        self._number_extractor = EnglishNumberExtractor(mode)
+        self._number_extractor = ComponentRegistry.get_or_create(EnglishNumberExtractor, mode)
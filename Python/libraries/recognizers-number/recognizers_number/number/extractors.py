@@ -1,13 +1,13 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
-import copy
 from abc import abstractmethod
 from typing import List, Pattern, Dict, Match
 from collections import namedtuple
 import regex
 
 from recognizers_text.utilities import RegExpUtility
-from recognizers_text.extractor import Extractor, ExtractResult
+from recognizers_text.extractor import Extractor, ExtractResult, memoize_extraction
+from recognizers_text.prefilter import Prefilter
 from recognizers_number.resources.base_numbers import BaseNumbers
 from recognizers_number.resources.english_numeric import EnglishNumeric
 from recognizers_number.number.models import LongFormatType
@@ -19,6 +19,8 @@ MatchesVal = namedtuple('MatchesVal', ['matches', 'val'])
 
 
 class BaseNumberExtractor(Extractor):
+    __prefilter: Prefilter = None
+
     @property
     @abstractmethod
     def regexes(self) -> List[ReVal]:
@@ -37,8 +39,9 @@ class BaseNumberExtractor(Extractor):
     def _negative_number_terms(self) -> Pattern:
         pass
 
+    @memoize_extraction
     def extract(self, source: str) -> List[ExtractResult]:
-        if source is None or len(source.strip()) == 0:
+        if source is None or len(source.strip()) == 0 or not self._pre_check_str(source):
             return list()
         result: List[ExtractResult] = list()
         match_source = dict()
@@ -89,6 +92,13 @@ class BaseNumberExtractor(Extractor):
         result = self._filter_ambiguity(result, source)
         return result
 
+    def _pre_check_str(self, source: str) -> bool:
+        # Results only come from the matches of the regexes, so a text none of them can match is skipped
+        if self.__prefilter is None:
+            self.__prefilter = Prefilter([r.re for r in self.regexes], type(self).__name__)
+
+        return self.__prefilter.may_match(source)
+
     def _filter_ambiguity(self, ers: List[ExtractResult], text: str) -> List[ExtractResult]:
         if self.ambiguity_filters_dict is not None:
             for item in self.ambiguity_filters_dict:
@@ -332,7 +342,7 @@ class BaseMergedNumberExtractor(Extractor):
 
             if idx == 0 or groups[idx] != groups[idx - 1]:
 
-                tmp_extract_result = copy.deepcopy(ers[idx])
+                tmp_extract_result = ers[idx].copy()
 
                 value = ExtractResult()
                 value.start = tmp_extract_result.start
@@ -9,7 +9,7 @@ from collections import namedtuple
 from recognizers_text import Model, ModelResult
 from recognizers_text.extractor import Extractor, ExtractResult
 from recognizers_text.parser import Parser
-from recognizers_text.utilities import QueryProcessor
+from recognizers_text.utilities import QueryProcessor, TimeBudget
 from recognizers_number.number.constants import Constants
 
 
@@ -49,13 +49,14 @@ class AbstractNumberModel(Model):
         self.parser: Parser = parser
         self.extractor: Extractor = extractor
 
-    def parse(self, query: str) -> List[ModelResult]:
+    def parse(self, query: str, timeout_ms: float = None) -> List[ModelResult]:
 
         query = QueryProcessor.preprocess(query, True)
         results = []
 
         try:
-            extract_results = self.extractor.extract(query)
+            with TimeBudget(timeout_ms):
+                extract_results = TimeBudget.run(self.extractor.extract, query, fallback=[])
             results = list(map(self.__single_parse, extract_results))
         except Exception:
             pass
@@ -2,31 +2,12 @@
 #  Licensed under the MIT License.
 
 from enum import IntFlag
-from typing import List
+from typing import List, Iterable
 
-from recognizers_text import Culture, Recognizer, Model
+from recognizers_text import Culture, Recognizer, Model, ComponentRegistry
 from recognizers_number.culture import CultureInfo
 from recognizers_number.number.models import NumberMode, NumberModel, OrdinalModel, PercentModel, ModelResult
 from recognizers_number.number.parser_factory import ParserType, AgnosticNumberParserFactory
-from recognizers_number.number.english.extractors import EnglishNumberExtractor, EnglishOrdinalExtractor, \
-    EnglishPercentageExtractor, EnglishMergedNumberExtractor
-from recognizers_number.number.english.parsers import EnglishNumberParserConfiguration
-from recognizers_number.number.spanish.extractors import SpanishNumberExtractor, SpanishOrdinalExtractor, SpanishPercentageExtractor
-from recognizers_number.number.chinese.extractors import ChineseNumberExtractor, ChineseOrdinalExtractor, ChinesePercentageExtractor
-from recognizers_number.number.chinese.parsers import ChineseNumberParserConfiguration
-from recognizers_number.number.dutch.extractors import DutchOrdinalExtractor, DutchPercentageExtractor, DutchMergedNumberExtractor
-from recognizers_number.number.dutch.parsers import DutchNumberParserConfiguration
-from recognizers_number.number.japanese.extractors import JapaneseNumberExtractor, JapaneseOrdinalExtractor, JapanesePercentageExtractor
-from recognizers_number.number.japanese.parsers import JapaneseNumberParserConfiguration
-from recognizers_number.number.spanish.parsers import SpanishNumberParserConfiguration
-from recognizers_number.number.portuguese.extractors import PortugueseNumberExtractor, PortugueseOrdinalExtractor, PortuguesePercentageExtractor
-from recognizers_number.number.portuguese.parsers import PortugueseNumberParserConfiguration
-from recognizers_number.number.french.extractors import FrenchNumberExtractor, FrenchOrdinalExtractor, FrenchPercentageExtractor
-from recognizers_number.number.french.parsers import FrenchNumberParserConfiguration
-from recognizers_number.number.german.extractors import GermanMergedNumberExtractor, GermanOrdinalExtractor, GermanPercentageExtractor
-from recognizers_number.number.german.parsers import GermanNumberParserConfiguration
-from recognizers_number.number.italian.extractors import ItalianMergedNumberExtractor, ItalianOrdinalExtractor, ItalianPercentageExtractor
-from recognizers_number.number.italian.parsers import ItalianNumberParserConfiguration
 
 
 class NumberOptions(IntFlag):
@@ -40,25 +21,43 @@ class NumberRecognizer(Recognizer[NumberOptions]):
         super().__init__(target_culture, options, lazy_initialization)
 
     def initialize_configuration(self):
-        # region English
+        self.register_culture(Culture.English, self.__initialize_english)
+        self.register_culture(Culture.German, self.__initialize_german)
+        self.register_culture(Culture.Dutch, self.__initialize_dutch)
+        self.register_culture(Culture.Chinese, self.__initialize_chinese)
+        self.register_culture(Culture.Japanese, self.__initialize_japanese)
+        self.register_culture(Culture.Spanish, self.__initialize_spanish)
+        self.register_culture(Culture.SpanishMexican, self.__initialize_spanish_mexican)
+        self.register_culture(Culture.Portuguese, self.__initialize_portuguese)
+        self.register_culture(Culture.French, self.__initialize_french)
+        self.register_culture(Culture.Italian, self.__initialize_italian)
+
+    def __initialize_english(self):
+        from recognizers_number.number.english.extractors import EnglishOrdinalExtractor, EnglishPercentageExtractor, \
+            EnglishMergedNumberExtractor
+        from recognizers_number.number.english.parsers import EnglishNumberParserConfiguration
+
         self.register_model('NumberModel', Culture.English, lambda options: NumberModel(
             AgnosticNumberParserFactory.get_parser(
-                ParserType.NUMBER, EnglishNumberParserConfiguration()),
-            EnglishMergedNumberExtractor(NumberMode.PURE_NUMBER)
+                ParserType.NUMBER, ComponentRegistry.get_or_create(EnglishNumberParserConfiguration)),
+            ComponentRegistry.get_or_create(EnglishMergedNumberExtractor, NumberMode.PURE_NUMBER)
         ))
         self.register_model('OrdinalModel', Culture.English, lambda options: OrdinalModel(
             AgnosticNumberParserFactory.get_parser(
-                ParserType.ORDINAL, EnglishNumberParserConfiguration()),
-            EnglishOrdinalExtractor()
+                ParserType.ORDINAL, ComponentRegistry.get_or_create(EnglishNumberParserConfiguration)),
+            ComponentRegistry.get_or_create(EnglishOrdinalExtractor)
         ))
         self.register_model('PercentModel', Culture.English, lambda options: PercentModel(
             AgnosticNumberParserFactory.get_parser(
-                ParserType.PERCENTAGE, EnglishNumberParserConfiguration()),
-            EnglishPercentageExtractor()
+                ParserType.PERCENTAGE, ComponentRegistry.get_or_create(EnglishNumberParserConfiguration)),
+            ComponentRegistry.get_or_create(EnglishPercentageExtractor)
         ))
-        # endregion
 
-        # region German
+    def __initialize_german(self):
+        from recognizers_number.number.german.extractors import GermanMergedNumberExtractor, GermanOrdinalExtractor, \
+            GermanPercentageExtractor
+        from recognizers_number.number.german.parsers import GermanNumberParserConfiguration
+
         self.register_model('NumberModel', Culture.German, lambda options: NumberModel(
             AgnosticNumberParserFactory.get_parser(
                 ParserType.NUMBER, GermanNumberParserConfiguration()),
@@ -74,9 +73,11 @@ class NumberRecognizer(Recognizer[NumberOptions]):
                 ParserType.PERCENTAGE, GermanNumberParserConfiguration()),
             GermanPercentageExtractor()
         ))
-        # endregion
 
-        # region Dutch
+    def __initialize_dutch(self):
+        from recognizers_number.number.dutch.extractors import DutchOrdinalExtractor, DutchPercentageExtractor, DutchMergedNumberExtractor
+        from recognizers_number.number.dutch.parsers import DutchNumberParserConfiguration
+
         self.register_model('NumberModel', Culture.Dutch, lambda options: NumberModel(
             AgnosticNumberParserFactory.get_parser(
                 ParserType.NUMBER, DutchNumberParserConfiguration()),
@@ -92,9 +93,11 @@ class NumberRecognizer(Recognizer[NumberOptions]):
                 ParserType.PERCENTAGE, DutchNumberParserConfiguration()),
             DutchPercentageExtractor()
         ))
-        # endregion
 
-        # region Chinese
+    def __initialize_chinese(self):
+        from recognizers_number.number.chinese.extractors import ChineseNumberExtractor, ChineseOrdinalExtractor, ChinesePercentageExtractor
+        from recognizers_number.number.chinese.parsers import ChineseNumberParserConfiguration
+
         self.register_model('NumberModel', Culture.Chinese, lambda options: NumberModel(
             AgnosticNumberParserFactory.get_parser(
                 ParserType.NUMBER, ChineseNumberParserConfiguration()),
@@ -110,9 +113,12 @@ class NumberRecognizer(Recognizer[NumberOptions]):
                 ParserType.PERCENTAGE, ChineseNumberParserConfiguration()),
             ChinesePercentageExtractor()
         ))
-        # endregion
 
-        # region Japanese
+    def __initialize_japanese(self):
+        from recognizers_number.number.japanese.extractors import JapaneseNumberExtractor, JapaneseOrdinalExtractor, \
+            JapanesePercentageExtractor
+        from recognizers_number.number.japanese.parsers import JapaneseNumberParserConfiguration
+
         self.register_model('NumberModel', Culture.Japanese, lambda options: NumberModel(
             AgnosticNumberParserFactory.get_parser(
                 ParserType.NUMBER, JapaneseNumberParserConfiguration()),
@@ -128,9 +134,11 @@ class NumberRecognizer(Recognizer[NumberOptions]):
                 ParserType.PERCENTAGE, JapaneseNumberParserConfiguration()),
             JapanesePercentageExtractor()
         ))
-        # endregion
 
-        # region Spanish
+    def __initialize_spanish(self):
+        from recognizers_number.number.spanish.extractors import SpanishNumberExtractor, SpanishOrdinalExtractor, SpanishPercentageExtractor
+        from recognizers_number.number.spanish.parsers import SpanishNumberParserConfiguration
+
         self.register_model('NumberModel', Culture.Spanish, lambda options: NumberModel(
             AgnosticNumberParserFactory.get_parser(
                 ParserType.NUMBER, SpanishNumberParserConfiguration()),
@@ -146,9 +154,11 @@ class NumberRecognizer(Recognizer[NumberOptions]):
                 ParserType.PERCENTAGE, SpanishNumberParserConfiguration()),
             SpanishPercentageExtractor()
         ))
-        # endregion
 
-        # region Spanish Mexican
+    def __initialize_spanish_mexican(self):
+        from recognizers_number.number.spanish.extractors import SpanishNumberExtractor, SpanishOrdinalExtractor, SpanishPercentageExtractor
+        from recognizers_number.number.spanish.parsers import SpanishNumberParserConfiguration
+
         self.register_model('NumberModel', Culture.SpanishMexican, lambda options: NumberModel(
             AgnosticNumberParserFactory.get_parser(
                 ParserType.NUMBER, SpanishNumberParserConfiguration(CultureInfo(Culture.SpanishMexican))),
@@ -164,9 +174,12 @@ class NumberRecognizer(Recognizer[NumberOptions]):
                 ParserType.PERCENTAGE, SpanishNumberParserConfiguration(CultureInfo(Culture.SpanishMexican))),
             SpanishPercentageExtractor()
         ))
-        # endregion
 
-        # region Portuguese
+    def __initialize_portuguese(self):
+        from recognizers_number.number.portuguese.extractors import PortugueseNumberExtractor, PortugueseOrdinalExtractor, \
+            PortuguesePercentageExtractor
+        from recognizers_number.number.portuguese.parsers import PortugueseNumberParserConfiguration
+
         self.register_model('NumberModel', Culture.Portuguese, lambda options: NumberModel(
             AgnosticNumberParserFactory.get_parser(
                 ParserType.NUMBER, PortugueseNumberParserConfiguration()),
@@ -182,9 +195,11 @@ class NumberRecognizer(Recognizer[NumberOptions]):
                 ParserType.PERCENTAGE, PortugueseNumberParserConfiguration()),
             PortuguesePercentageExtractor()
         ))
-        # endregion
 
-        # region French
+    def __initialize_french(self):
+        from recognizers_number.number.french.extractors import FrenchNumberExtractor, FrenchOrdinalExtractor, FrenchPercentageExtractor
+        from recognizers_number.number.french.parsers import FrenchNumberParserConfiguration
+
         self.register_model('NumberModel', Culture.French, lambda options: NumberModel(
             AgnosticNumberParserFactory.get_parser(
                 ParserType.NUMBER, FrenchNumberParserConfiguration()),
@@ -200,9 +215,12 @@ class NumberRecognizer(Recognizer[NumberOptions]):
                 ParserType.PERCENTAGE, FrenchNumberParserConfiguration()),
             FrenchPercentageExtractor()
         ))
-        # endregion
 
-        # region Italian
+    def __initialize_italian(self):
+        from recognizers_number.number.italian.extractors import ItalianMergedNumberExtractor, ItalianOrdinalExtractor, \
+            ItalianPercentageExtractor
+        from recognizers_number.number.italian.parsers import ItalianNumberParserConfiguration
+
         self.register_model('NumberModel', Culture.Italian, lambda options: NumberModel(
             AgnosticNumberParserFactory.get_parser(
                 ParserType.NUMBER, ItalianNumberParserConfiguration()),
@@ -230,20 +248,47 @@ class NumberRecognizer(Recognizer[NumberOptions]):
         return self.get_model('PercentModel', culture, fallback_to_default_culture)
 
 
-def recognize_number(query: str, culture: str, options: NumberOptions = NumberOptions.NONE, fallback_to_default_culture: bool = True) -> List[ModelResult]:
+def recognize_number(query: str, culture: str, options: NumberOptions = NumberOptions.NONE, fallback_to_default_culture: bool = True,
+                     timeout_ms: float = None) -> List[ModelResult]:
     recognizer = NumberRecognizer(culture, options)
     model = recognizer.get_number_model(culture, fallback_to_default_culture)
-    return model.parse(query)
+    return model.parse(query, timeout_ms=timeout_ms)
 
 
-def recognize_ordinal(query: str, culture: str, options: NumberOptions = NumberOptions.NONE, fallback_to_default_culture: bool = True) -> List[ModelResult]:
+def recognize_ordinal(query: str, culture: str, options: NumberOptions = NumberOptions.NONE, fallback_to_default_culture: bool = True,
+                      timeout_ms: float = None) -> List[ModelResult]:
     recognizer = NumberRecognizer(culture, options)
     model = recognizer.get_ordinal_model(culture, fallback_to_default_culture)
-    return model.parse(query)
+    return model.parse(query, timeout_ms=timeout_ms)
 
 
-def recognize_percentage(query: str, culture: str, options: NumberOptions = NumberOptions.NONE, fallback_to_default_culture: bool = True) -> List[ModelResult]:
+def recognize_percentage(query: str, culture: str, options: NumberOptions = NumberOptions.NONE, fallback_to_default_culture: bool = True,
+                         timeout_ms: float = None) -> List[ModelResult]:
     recognizer = NumberRecognizer(culture, options)
     model = recognizer.get_percentage_model(
         culture, fallback_to_default_culture)
-    return model.parse(query)
+    return model.parse(query, timeout_ms=timeout_ms)
+
+
+def recognize_number_batch(queries: Iterable[str], culture: str, options: NumberOptions = NumberOptions.NONE,
+                           fallback_to_default_culture: bool = True,
+                           timeout_ms: float = None) -> List[List[ModelResult]]:
+    recognizer = NumberRecognizer(culture, options)
+    model = recognizer.get_number_model(culture, fallback_to_default_culture)
+    return model.parse_batch(queries, timeout_ms=timeout_ms)
+
+
+def recognize_ordinal_batch(queries: Iterable[str], culture: str, options: NumberOptions = NumberOptions.NONE,
+                            fallback_to_default_culture: bool = True,
+                            timeout_ms: float = None) -> List[List[ModelResult]]:
+    recognizer = NumberRecognizer(culture, options)
+    model = recognizer.get_ordinal_model(culture, fallback_to_default_culture)
+    return model.parse_batch(queries, timeout_ms=timeout_ms)
+
+
+def recognize_percentage_batch(queries: Iterable[str], culture: str, options: NumberOptions = NumberOptions.NONE,
+                               fallback_to_default_culture: bool = True,
+                               timeout_ms: float = None) -> List[List[ModelResult]]:
+    recognizer = NumberRecognizer(culture, options)
+    model = recognizer.get_percentage_model(culture, fallback_to_default_culture)
+    return model.parse_batch(queries, timeout_ms=timeout_ms)
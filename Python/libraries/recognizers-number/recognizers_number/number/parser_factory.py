@@ -1,13 +1,12 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
+import sys
 from enum import Enum
 
 from recognizers_number.number.parsers import NumberParserConfiguration, BaseNumberParser, BasePercentageParser
 from recognizers_number.number.constants import Constants
 from recognizers_number.number.cjk_parsers import CJKNumberParser
-from recognizers_number.number.chinese.parsers import ChineseNumberParserConfiguration
-from recognizers_number.number.japanese.parsers import JapaneseNumberParserConfiguration
 
 
 class ParserType(Enum):
@@ -20,14 +19,19 @@ class ParserType(Enum):
     PERCENTAGE = 6
 
 
+def _is_instance(value, module: str, class_name: str) -> bool:
+    # The CJK configurations can only be instances once their culture is imported, which is left to the recognizer
+    loaded = sys.modules.get(module)
+    return loaded is not None and isinstance(value, getattr(loaded, class_name))
+
+
 class AgnosticNumberParserFactory:
     @staticmethod
     def get_parser(parser_type: ParserType, language_config: NumberParserConfiguration) -> BaseNumberParser:
         parser = BaseNumberParser(language_config)
 
-        chinese = isinstance(language_config, ChineseNumberParserConfiguration)
-        japanese = isinstance(
-            language_config, JapaneseNumberParserConfiguration)
+        chinese = _is_instance(language_config, 'recognizers_number.number.chinese.parsers', 'ChineseNumberParserConfiguration')
+        japanese = _is_instance(language_config, 'recognizers_number.number.japanese.parsers', 'JapaneseNumberParserConfiguration')
 
         if chinese:
             parser = CJKNumberParser(language_config)
@@ -1,13 +1,26 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
-from .base_numbers import BaseNumbers
-from .chinese_numeric import ChineseNumeric
-from .english_numeric import EnglishNumeric
-from .german_numeric import GermanNumeric
-from .dutch_numeric import DutchNumeric
-from .italian_numeric import ItalianNumeric
-from .french_numeric import FrenchNumeric
-from .portuguese_numeric import PortugueseNumeric
-from .spanish_numeric import SpanishNumeric
-from .japanese_numeric import JapaneseNumeric
+from recognizers_text.lazy_imports import lazy_package
+
+# Star imports resolve these names, most of which are only imported on first access
+__all__ = [
+    'BaseNumbers', 'ChineseNumeric', 'DutchNumeric', 'EnglishNumeric', 'FrenchNumeric', 'GermanNumeric',
+    'ItalianNumeric', 'JapaneseNumeric', 'PortugueseNumeric', 'SpanishNumeric', 'base_numbers', 'chinese_numeric',
+    'dutch_numeric', 'english_numeric', 'french_numeric', 'german_numeric', 'italian_numeric', 'japanese_numeric',
+    'portuguese_numeric', 'spanish_numeric'
+]
+
+# Each resource module is only imported when its class is first used
+__getattr__, __dir__ = lazy_package(__name__, attributes={
+    'BaseNumbers': 'base_numbers',
+    'ChineseNumeric': 'chinese_numeric',
+    'EnglishNumeric': 'english_numeric',
+    'GermanNumeric': 'german_numeric',
+    'DutchNumeric': 'dutch_numeric',
+    'ItalianNumeric': 'italian_numeric',
+    'FrenchNumeric': 'french_numeric',
+    'PortugueseNumeric': 'portuguese_numeric',
+    'SpanishNumeric': 'spanish_numeric',
+    'JapaneseNumeric': 'japanese_numeric'
+})
@@ -1,6 +1,7 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
+from recognizers_text.lazy_imports import lazy_package
 from .base_email import *
 from .base_GUID import *
 from .base_url import *
@@ -8,8 +9,15 @@ from .base_hashtag import *
 from .base_ip import *
 from .base_mention import *
 from .english_phone_numbers import *
-from .chinese_phone_numbers import *
-from .portuguese_phone_numbers import *
-from .chinese_url import *
-from .chinese_ip import *
 from .base_phone_numbers import *
+
+# Star imports resolve these names, most of which are only imported on first access
+__all__ = [
+    'BaseEmail', 'BaseGUID', 'BaseHashtag', 'BaseIp', 'BaseMention', 'BasePhoneNumbers', 'BaseURL', 'ChineseIp',
+    'ChinesePhoneNumbers', 'ChineseURL', 'EnglishPhoneNumbers', 'PhoneNumbersDefinitions', 'PortuguesePhoneNumbers',
+    'base_GUID', 'base_email', 'base_hashtag', 'base_ip', 'base_mention', 'base_phone_numbers', 'base_url',
+    'chinese_ip', 'chinese_phone_numbers', 'chinese_url', 'english_phone_numbers', 'portuguese_phone_numbers'
+]
+
+# The other cultures are only imported when first used
+__getattr__, __dir__ = lazy_package(__name__, ['chinese_phone_numbers', 'portuguese_phone_numbers', 'chinese_url', 'chinese_ip'])
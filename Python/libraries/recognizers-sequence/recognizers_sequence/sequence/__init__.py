@@ -1,11 +1,47 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
+from recognizers_text.lazy_imports import lazy_package
 from .sequence_recognizer import *
 from .constants import *
 from .models import *
 from .extractors import *
 from .parsers import *
 from .english import *
-from .chinese import *
-from .portuguese import *
+
+# Star imports resolve these names, most of which are only imported on first access
+__all__ = [
+    'AbstractSequenceModel', 'BaseCultureInfo', 'BaseEmail', 'BaseEmailExtractor', 'BaseGUID', 'BaseGUIDExtractor',
+    'BaseHashTagExtractor', 'BaseHashtag', 'BaseIp', 'BaseIpExtractor', 'BaseIpParser', 'BaseMention',
+    'BaseMentionExtractor', 'BasePhoneNumberExtractor', 'BasePhoneNumberExtractorConfiguration', 'BasePhoneNumbers',
+    'BaseURL', 'BaseURLExtractor', 'CacheKey', 'ChineseIp', 'ChineseIpExtractorConfiguration',
+    'ChinesePhoneNumberExtractorConfiguration', 'ChinesePhoneNumbers', 'ChineseURL', 'ChineseURLExtractorConfiguration',
+    'ConditionalMatch', 'Constants', 'Culture', 'CultureInfo', 'DefinitionLoader', 'EmailModel', 'EmailParser',
+    'EnglishEmailExtractor', 'EnglishGUIDExtractor', 'EnglishHashtagExtractor', 'EnglishIpExtractorConfiguration',
+    'EnglishMentionExtractor', 'EnglishPhoneNumberExtractorConfiguration', 'EnglishPhoneNumbers',
+    'EnglishURLExtractorConfiguration', 'ExtractResult', 'Extractor', 'GUIDModel', 'GUIDParser', 'HashtagModel',
+    'HashtagParser', 'IpAddressModel', 'IpConfiguration', 'IpParser', 'MatchesVal', 'MentionModel', 'MentionParser',
+    'MetaData', 'Metadata', 'Model', 'ModelCtorKey', 'ModelFactory', 'ModelResult', 'ParseResult', 'Parser',
+    'PhoneNumberConfiguration', 'PhoneNumberModel', 'PhoneNumberParser', 'PhoneNumbersDefinitions',
+    'PortuguesePhoneNumberExtractorConfiguration', 'PortuguesePhoneNumbers', 'QueryProcessor', 'ReVal', 'Recognizer',
+    'RegExpUtility', 'SequenceExtractor', 'SequenceOptions', 'SequenceParser', 'SequenceRecognizer', 'SimpleTokenizer',
+    'StringMatcher', 'StringUtility', 'T_MODEL_OPTIONS', 'URLConfiguration', 'URLModel', 'URLParser', 'base_GUID',
+    'base_email', 'base_hashtag', 'base_ip', 'base_mention', 'base_phone_number_configuration', 'base_phone_numbers',
+    'base_url', 'chinese', 'chinese_ip', 'chinese_phone_numbers', 'chinese_url', 'config', 'constants', 'count_digits',
+    'english', 'english_phone_numbers', 'extractors', 'flatten', 'ip_configuration', 'models', 'parsers',
+    'phone_number_configuration', 'portuguese', 'portuguese_phone_numbers', 'recognize_email', 'recognize_email_batch',
+    'recognize_guid', 'recognize_guid_batch', 'recognize_hashtag', 'recognize_hashtag_batch', 'recognize_ip_address',
+    'recognize_ip_address_batch', 'recognize_mention', 'recognize_mention_batch', 'recognize_phone_number',
+    'recognize_phone_number_batch', 'recognize_url', 'recognize_url_batch', 'resources', 'sequence_recognizer',
+    'url_configuration'
+]
+
+# The other cultures are imported when their first model is built, or when one of their names is accessed
+__getattr__, __dir__ = lazy_package(__name__, ['chinese', 'portuguese'], attributes={
+    # Names of the resources package, which the extractors used to star-import
+    'resources': '.',
+    **{name: '.resources' for name in ['PhoneNumbersDefinitions', 'base_GUID', 'base_email', 'base_hashtag', 'base_ip',
+                                       'base_mention', 'base_phone_numbers', 'base_url', 'chinese_ip',
+                                       'chinese_phone_numbers', 'chinese_url', 'english_phone_numbers',
+                                       'portuguese_phone_numbers']}
+})
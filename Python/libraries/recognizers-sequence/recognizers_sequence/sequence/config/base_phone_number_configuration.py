@@ -2,7 +2,7 @@
 #  Licensed under the MIT License.
 
 from recognizers_sequence.sequence.config import *
-from recognizers_sequence.resources import *
+from recognizers_sequence.resources.base_phone_numbers import BasePhoneNumbers
 from recognizers_text.culture import Culture
 from recognizers_number import CultureInfo
 
@@ -2,9 +2,10 @@
 #  Licensed under the MIT License.
 
 from recognizers_number import CultureInfo
-from recognizers_sequence import *
 from recognizers_sequence.sequence.extractors import *
-from recognizers_sequence.resources import *
+from recognizers_sequence.resources.base_ip import BaseIp
+from recognizers_sequence.resources.base_url import BaseURL
+from recognizers_sequence.resources.english_phone_numbers import EnglishPhoneNumbers
 from recognizers_text.culture import Culture
 from recognizers_sequence.sequence.config import *
 import regex as re
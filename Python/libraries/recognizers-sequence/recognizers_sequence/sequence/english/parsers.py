@@ -3,11 +3,11 @@
 
 from typing import Optional
 
-import regex as re
 from recognizers_sequence.sequence.parsers import SequenceParser, BaseIpParser
 from recognizers_sequence.resources import BasePhoneNumbers, BaseEmail, BaseGUID
 from recognizers_text.parser import Parser, ParseResult
-from recognizers_text import ExtractResult, Pattern, regex
+from recognizers_text import ExtractResult, Pattern
+from recognizers_text.utilities import RegExpUtility
 
 
 class PhoneNumberParser(SequenceParser):
@@ -28,22 +28,21 @@ class PhoneNumberParser(SequenceParser):
     tail_same_limit = 2
     phone_number_length_base = 8
     pure_digit_length_limit = 11
-    complete_bracket_regex = re.compile('\\(.*\\)')
-    single_bracket_regex = re.compile('\\(|\\)')
-    tail_same_digit_regex = re.compile('([\\d])\\1{2,10}$')
-    pure_digit_regex = re.compile('^\\d*$')
-    continue_digit_regex = re.compile('\\d{5}\\d*')
-    digit_regex = re.compile('\\d')
+    complete_bracket_regex = RegExpUtility.get_safe_reg_exp('\\(.*\\)', 0)
+    single_bracket_regex = RegExpUtility.get_safe_reg_exp('\\(|\\)', 0)
+    tail_same_digit_regex = RegExpUtility.get_safe_reg_exp('([\\d])\\1{2,10}$', 0)
+    pure_digit_regex = RegExpUtility.get_safe_reg_exp('^\\d*$', 0)
+    continue_digit_regex = RegExpUtility.get_safe_reg_exp('\\d{5}\\d*', 0)
+    digit_regex = RegExpUtility.get_safe_reg_exp('\\d', 0)
 
     def score_phone_number(self, phone_number_text) -> float:
         score = self.base_score
 
-        country_code_regex = re.compile(BasePhoneNumbers.CountryCodeRegex)
-        area_code_regex = re.compile(BasePhoneNumbers.AreaCodeIndicatorRegex)
-        format_indicator_regex = re.compile(
-            BasePhoneNumbers.FormatIndicatorRegex, re.IGNORECASE | re.DOTALL)
-        no_area_code_USphonenumber_regex = re.compile(
-            BasePhoneNumbers.NoAreaCodeUSPhoneNumberRegex)
+        country_code_regex = RegExpUtility.get_safe_reg_exp(BasePhoneNumbers.CountryCodeRegex, 0)
+        area_code_regex = RegExpUtility.get_safe_reg_exp(BasePhoneNumbers.AreaCodeIndicatorRegex, 0)
+        format_indicator_regex = RegExpUtility.get_safe_reg_exp(BasePhoneNumbers.FormatIndicatorRegex)
+        no_area_code_USphonenumber_regex = RegExpUtility.get_safe_reg_exp(
+            BasePhoneNumbers.NoAreaCodeUSPhoneNumberRegex, 0)
 
         # Country code score or area code score
         score += self.country_code_award if country_code_regex.search(
@@ -80,7 +79,7 @@ class PhoneNumberParser(SequenceParser):
 
         # Special format deduction
         for pattern in BasePhoneNumbers.TypicalDeductionRegexList:
-            if re.search(pattern, phone_number_text):
+            if RegExpUtility.get_safe_reg_exp(pattern, 0).search(phone_number_text):
                 score -= self.typical_format_deduction_score
                 break
 
@@ -130,8 +129,8 @@ class GUIDParser(SequenceParser):
     no_boundary_penalty = 10
     no_format_penalty = 10
     pure_digit_penalty = 15
-    pure_digit_regex = re.compile('^\\d*$')
-    format_regex = re.compile('-')
+    pure_digit_regex = RegExpUtility.get_safe_reg_exp('^\\d*$', 0)
+    format_regex = RegExpUtility.get_safe_reg_exp('-', 0)
 
     def parse(self, source: ExtractResult):
         res = ParseResult(source)
@@ -146,7 +145,7 @@ class GUIDParser(SequenceParser):
     def score_guid(self, guid_text) -> float:
         score = self.base_score
         guid_element_regex = BaseGUID.GUIDRegexElement
-        element_match = list(regex.finditer(guid_element_regex, guid_text))
+        element_match = list(RegExpUtility.get_safe_reg_exp(guid_element_regex, 0).finditer(guid_text))
         element_match = list(filter(None, map(lambda m: m.group(), element_match)))
 
         for match in element_match:
@@ -11,8 +11,14 @@ from recognizers_text.matcher.string_matcher import StringMatcher
 from .constants import *
 from recognizers_text.utilities import RegExpUtility
 from recognizers_text.extractor import Extractor, ExtractResult
+from recognizers_text.prefilter import Prefilter
 from recognizers_number.culture import CultureInfo
-from recognizers_sequence.resources import *
+from recognizers_sequence.resources.base_email import BaseEmail
+from recognizers_sequence.resources.base_GUID import BaseGUID
+from recognizers_sequence.resources.base_hashtag import BaseHashtag
+from recognizers_sequence.resources.base_mention import BaseMention
+from recognizers_sequence.resources.base_phone_numbers import BasePhoneNumbers
+from recognizers_sequence.resources.base_url import BaseURL
 from urllib.parse import urlparse
 from os.path import splitext
 from recognizers_text.matcher.simple_tokenizer import SimpleTokenizer
@@ -22,6 +28,8 @@ MatchesVal = namedtuple('MatchesVal', ['matches', 'val'])
 
 
 class SequenceExtractor(Extractor):
+    __prefilter: Prefilter = None
+
     @property
     @abstractmethod
     def regexes(self) -> List[ReVal]:
@@ -78,9 +86,15 @@ class SequenceExtractor(Extractor):
 
         return result
 
-    @staticmethod
-    def _pre_check_str(source: str) -> bool:
-        return len(source) != 0
+    def _pre_check_str(self, source: str) -> bool:
+        if len(source) == 0:
+            return False
+
+        # Derived on first use, once the subclass has set its regexes
+        if self.__prefilter is None:
+            self.__prefilter = Prefilter([r.re for r in self.regexes], type(self).__name__)
+
+        return self.__prefilter.may_match(source)
 
     def _is_valid_match(self, source: str) -> bool:
         return True
@@ -138,15 +152,14 @@ class BasePhoneNumberExtractor(SequenceExtractor):
 
     def extract(self, source: str):
         ret = []
-        pre_check_phone_number_regex = re.compile(BasePhoneNumbers.PreCheckPhoneNumberRegex)
-        ssn_filter_regex = re.compile(BasePhoneNumbers.SSNFilterRegex)
-        colon_prefix_check_regex = re.compile(self.config.colon_prefix_check_regex)
+        pre_check_phone_number_regex = RegExpUtility.get_safe_reg_exp(BasePhoneNumbers.PreCheckPhoneNumberRegex, 0)
+        ssn_filter_regex = RegExpUtility.get_safe_reg_exp(BasePhoneNumbers.SSNFilterRegex, 0)
+        colon_prefix_check_regex = RegExpUtility.get_safe_reg_exp(self.config.colon_prefix_check_regex, 0)
 
         if (pre_check_phone_number_regex.search(source) is None):
             return ret
         extract_results = super().extract(source)
-        format_indicator_regex = re.compile(
-            BasePhoneNumbers.FormatIndicatorRegex, re.IGNORECASE | re.DOTALL)
+        format_indicator_regex = RegExpUtility.get_safe_reg_exp(BasePhoneNumbers.FormatIndicatorRegex)
         for er in extract_results:
             if (count_digits(er.text) < 7 and er.data != "ITPhoneNumber") or \
                     ssn_filter_regex.search(er.text):
@@ -170,7 +183,8 @@ class BasePhoneNumberExtractor(SequenceExtractor):
 
             ch = source[er.start - 1]
             front = source[0: er.start - 1]
-            if self.config.false_positive_prefix_regex and re.compile(self.config.false_positive_prefix_regex).search(front):
+            if self.config.false_positive_prefix_regex and \
+                    RegExpUtility.get_safe_reg_exp(self.config.false_positive_prefix_regex, 0).search(front):
                 continue
 
             if er.start != 0:
@@ -181,8 +195,8 @@ class BasePhoneNumberExtractor(SequenceExtractor):
                             er.start >= 2:
                         ch_gap = source[er.start - 2]
                         if ch_gap.isdigit():
-                            international_dialing_prefix_regex = re.compile(
-                                BasePhoneNumbers.InternationDialingPrefixRegex)
+                            international_dialing_prefix_regex = RegExpUtility.get_safe_reg_exp(
+                                BasePhoneNumbers.InternationDialingPrefixRegex, 0)
                             match = international_dialing_prefix_regex.search(front)
                             if match is not None:
                                 er.start = match.start()
@@ -206,7 +220,7 @@ class BasePhoneNumberExtractor(SequenceExtractor):
             ret.append(er)
 
         # filter hexadecimal address like 00 10 00 31 46 D9 E9 11
-        for m in re.finditer(BasePhoneNumbers.PhoneNumberMaskRegex, source):
+        for m in RegExpUtility.get_safe_reg_exp(BasePhoneNumbers.PhoneNumberMaskRegex, 0).finditer(source):
             ret = [er for er in ret if er.start <
                    m.start() or er.end > m.end()]
 
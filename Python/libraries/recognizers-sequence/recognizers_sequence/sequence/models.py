@@ -5,7 +5,7 @@ from abc import abstractmethod
 from typing import List
 
 from recognizers_sequence.sequence.constants import Constants
-from recognizers_text import QueryProcessor
+from recognizers_text import QueryProcessor, TimeBudget
 from recognizers_text.model import Model, ModelResult
 from recognizers_text.extractor import Extractor
 from recognizers_text.parser import Parser, ParseResult
@@ -21,13 +21,14 @@ class AbstractSequenceModel(Model):
         self.extractor = extractor
         self.parser = parser
 
-    def parse(self, query: str) -> List[ModelResult]:
+    def parse(self, query: str, timeout_ms: float = None) -> List[ModelResult]:
         model_results: List[ModelResult] = list()
         parse_results = []
         query = QueryProcessor.preprocess(query)
 
         try:
-            extract_results = self.extractor.extract(query)
+            with TimeBudget(timeout_ms):
+                extract_results = TimeBudget.run(self.extractor.extract, query, fallback=[])
             parse_results = [self.parser.parse(e) for e in extract_results]
         except Exception:
             pass
@@ -56,14 +57,15 @@ class PhoneNumberModel(AbstractSequenceModel):
     def model_type_name(self) -> str:
         return Constants.MODEL_PHONE_NUMBER
 
-    def parse(self, query: str) -> List[ModelResult]:
+    def parse(self, query: str, timeout_ms: float = None) -> List[ModelResult]:
 
         model_results: List[ModelResult] = list()
         parse_results = []
         query = QueryProcessor.preprocess(query)
 
         try:
-            extract_results = self.extractor.extract(query)
+            with TimeBudget(timeout_ms):
+                extract_results = TimeBudget.run(self.extractor.extract, query, fallback=[])
             parse_results = [self.parser.parse(e) for e in extract_results]
         except Exception:
             pass
@@ -99,13 +101,14 @@ class GUIDModel(AbstractSequenceModel):
     def model_type_name(self) -> str:
         return Constants.MODEL_GUID
 
-    def parse(self, query: str) -> List[ModelResult]:
+    def parse(self, query: str, timeout_ms: float = None) -> List[ModelResult]:
         model_results: List[ModelResult] = list()
         parse_results = []
         query = QueryProcessor.preprocess(query)
 
         try:
-            extract_results = self.extractor.extract(query)
+            with TimeBudget(timeout_ms):
+                extract_results = TimeBudget.run(self.extractor.extract, query, fallback=[])
             parse_results = [self.parser.parse(e) for e in extract_results]
         except Exception:
             pass
@@ -141,12 +144,13 @@ class IpAddressModel(AbstractSequenceModel):
     def model_type_name(self) -> str:
         return Constants.MODEL_IP
 
-    def parse(self, query: str) -> List[ModelResult]:
+    def parse(self, query: str, timeout_ms: float = None) -> List[ModelResult]:
         model_results: List[ModelResult] = list()
         parse_results = []
 
         try:
-            extract_results = self.extractor.extract(query)
+            with TimeBudget(timeout_ms):
+                extract_results = TimeBudget.run(self.extractor.extract, query, fallback=[])
             parse_results = [self.parser.parse(e) for e in extract_results]
         except Exception:
             pass
@@ -2,8 +2,7 @@
 #  Licensed under the MIT License.
 
 from enum import IntFlag
-from .chinese.extractors import *
-from .portuguese.extractors import *
+from typing import Iterable
 from recognizers_text import *
 from .english.extractors import *
 from .english.parsers import *
@@ -23,18 +22,15 @@ class SequenceRecognizer(Recognizer[SequenceOptions]):
         super().__init__(target_culture, options, lazy_initialization)
 
     def initialize_configuration(self):
+        self.register_culture(Culture.English, self.__initialize_english)
+        self.register_culture(Culture.Chinese, self.__initialize_chinese)
+        self.register_culture(Culture.Portuguese, self.__initialize_portuguese)
+
+    def __initialize_english(self):
         self.register_model('PhoneNumberModel', Culture.English,
                             lambda options: PhoneNumberModel(PhoneNumberParser(),
                                                              BasePhoneNumberExtractor(EnglishPhoneNumberExtractorConfiguration())))
 
-        self.register_model('PhoneNumberModel', Culture.Chinese,
-                            lambda options: PhoneNumberModel(PhoneNumberParser(),
-                                                             BasePhoneNumberExtractor(ChinesePhoneNumberExtractorConfiguration())))
-
-        self.register_model('PhoneNumberModel', Culture.Portuguese,
-                            lambda options: PhoneNumberModel(PhoneNumberParser(),
-                                                             BasePhoneNumberExtractor(PortuguesePhoneNumberExtractorConfiguration())))
-
         self.register_model('EmailModel', Culture.English,
                             lambda options: EmailModel(EmailParser(), EnglishEmailExtractor()))
 
@@ -42,10 +38,6 @@ class SequenceRecognizer(Recognizer[SequenceOptions]):
                             lambda options: IpAddressModel(IpParser(),
                                                            BaseIpExtractor(EnglishIpExtractorConfiguration(options))))
 
-        self.register_model('IpAddressModel', Culture.Chinese,
-                            lambda options: IpAddressModel(IpParser(),
-                                                           BaseIpExtractor(ChineseIpExtractorConfiguration(options))))
-
         self.register_model('MentionModel', Culture.English,
                             lambda options: MentionModel(MentionParser(), EnglishMentionExtractor()))
 
@@ -57,13 +49,32 @@ class SequenceRecognizer(Recognizer[SequenceOptions]):
                                 URLParser(), BaseURLExtractor(EnglishURLExtractorConfiguration(options)))
                             )
 
+        self.register_model('GUIDModel', Culture.English,
+                            lambda options: GUIDModel(GUIDParser(), EnglishGUIDExtractor()))
+
+    def __initialize_chinese(self):
+        from .chinese.extractors import ChinesePhoneNumberExtractorConfiguration, ChineseIpExtractorConfiguration, \
+            ChineseURLExtractorConfiguration
+
+        self.register_model('PhoneNumberModel', Culture.Chinese,
+                            lambda options: PhoneNumberModel(PhoneNumberParser(),
+                                                             BasePhoneNumberExtractor(ChinesePhoneNumberExtractorConfiguration())))
+
+        self.register_model('IpAddressModel', Culture.Chinese,
+                            lambda options: IpAddressModel(IpParser(),
+                                                           BaseIpExtractor(ChineseIpExtractorConfiguration(options))))
+
         self.register_model('URLModel', Culture.Chinese,
                             lambda options: URLModel(
                                 URLParser(), BaseURLExtractor(ChineseURLExtractorConfiguration(options)))
                             )
 
-        self.register_model('GUIDModel', Culture.English,
-                            lambda options: GUIDModel(GUIDParser(), EnglishGUIDExtractor()))
+    def __initialize_portuguese(self):
+        from .portuguese.extractors import PortuguesePhoneNumberExtractorConfiguration
+
+        self.register_model('PhoneNumberModel', Culture.Portuguese,
+                            lambda options: PhoneNumberModel(PhoneNumberParser(),
+                                                             BasePhoneNumberExtractor(PortuguesePhoneNumberExtractorConfiguration())))
 
     def get_phone_number_model(self, culture: str = None, fallback_to_default_culture: bool = True) -> Model:
         if culture and (culture.lower().startswith("zh-") or culture.lower().startswith("ja-")):
@@ -94,49 +105,112 @@ class SequenceRecognizer(Recognizer[SequenceOptions]):
 
 
 def recognize_phone_number(query: str, culture: str, options: SequenceOptions = SequenceOptions.NONE,
-                           fallback_to_default_culture: bool = True) -> List[ModelResult]:
+                           fallback_to_default_culture: bool = True,
+                           timeout_ms: float = None) -> List[ModelResult]:
     recognizer = SequenceRecognizer(culture, options)
     model = recognizer.get_phone_number_model(culture, fallback_to_default_culture)
-    return model.parse(query)
+    return model.parse(query, timeout_ms=timeout_ms)
 
 
 def recognize_email(query: str, culture: str, options: SequenceOptions = SequenceOptions.NONE,
-                    fallback_to_default_culture: bool = True) -> List[ModelResult]:
+                    fallback_to_default_culture: bool = True,
+                    timeout_ms: float = None) -> List[ModelResult]:
     recognizer = SequenceRecognizer(culture, options)
     model = recognizer.get_email_model(culture, fallback_to_default_culture)
-    return model.parse(query)
+    return model.parse(query, timeout_ms=timeout_ms)
 
 
 def recognize_ip_address(query: str, culture: str, options: SequenceOptions = SequenceOptions.NONE,
-                         fallback_to_default_culture: bool = True) -> List[ModelResult]:
+                         fallback_to_default_culture: bool = True,
+                         timeout_ms: float = None) -> List[ModelResult]:
     recognizer = SequenceRecognizer(culture, options)
     model = recognizer.get_ip_address_model(culture, fallback_to_default_culture)
-    return model.parse(query)
+    return model.parse(query, timeout_ms=timeout_ms)
 
 
 def recognize_mention(query: str, culture: str, options: SequenceOptions = SequenceOptions.NONE,
-                      fallback_to_default_culture: bool = True) -> List[ModelResult]:
+                      fallback_to_default_culture: bool = True,
+                      timeout_ms: float = None) -> List[ModelResult]:
     recognizer = SequenceRecognizer(culture, options)
     model = recognizer.get_mention_model(culture, fallback_to_default_culture)
-    return model.parse(query)
+    return model.parse(query, timeout_ms=timeout_ms)
 
 
 def recognize_hashtag(query: str, culture: str, options: SequenceOptions = SequenceOptions.NONE,
-                      fallback_to_default_culture: bool = True) -> List[ModelResult]:
+                      fallback_to_default_culture: bool = True,
+                      timeout_ms: float = None) -> List[ModelResult]:
     recognizer = SequenceRecognizer(culture, options)
     model = recognizer.get_hashtag_model(culture, fallback_to_default_culture)
-    return model.parse(query)
+    return model.parse(query, timeout_ms=timeout_ms)
 
 
 def recognize_url(query: str, culture: str, options: SequenceOptions = SequenceOptions.NONE,
-                  fallback_to_default_culture: bool = True) -> List[ModelResult]:
+                  fallback_to_default_culture: bool = True,
+                  timeout_ms: float = None) -> List[ModelResult]:
     recognizer = SequenceRecognizer(culture, options)
     model = recognizer.get_url_model(culture, fallback_to_default_culture)
-    return model.parse(query)
+    return model.parse(query, timeout_ms=timeout_ms)
 
 
 def recognize_guid(query: str, culture: str, options: SequenceOptions = SequenceOptions.NONE,
-                   fallback_to_default_culture: bool = True) -> List[ModelResult]:
+                   fallback_to_default_culture: bool = True,
+                   timeout_ms: float = None) -> List[ModelResult]:
+    recognizer = SequenceRecognizer(culture, options)
+    model = recognizer.get_guid_model(culture, fallback_to_default_culture)
+    return model.parse(query, timeout_ms=timeout_ms)
+
+
+def recognize_phone_number_batch(queries: Iterable[str], culture: str, options: SequenceOptions = SequenceOptions.NONE,
+                                 fallback_to_default_culture: bool = True,
+                                 timeout_ms: float = None) -> List[List[ModelResult]]:
+    recognizer = SequenceRecognizer(culture, options)
+    model = recognizer.get_phone_number_model(culture, fallback_to_default_culture)
+    return model.parse_batch(queries, timeout_ms=timeout_ms)
+
+
+def recognize_email_batch(queries: Iterable[str], culture: str, options: SequenceOptions = SequenceOptions.NONE,
+                          fallback_to_default_culture: bool = True,
+                          timeout_ms: float = None) -> List[List[ModelResult]]:
+    recognizer = SequenceRecognizer(culture, options)
+    model = recognizer.get_email_model(culture, fallback_to_default_culture)
+    return model.parse_batch(queries, timeout_ms=timeout_ms)
+
+
+def recognize_ip_address_batch(queries: Iterable[str], culture: str, options: SequenceOptions = SequenceOptions.NONE,
+                               fallback_to_default_culture: bool = True,
+                               timeout_ms: float = None) -> List[List[ModelResult]]:
+    recognizer = SequenceRecognizer(culture, options)
+    model = recognizer.get_ip_address_model(culture, fallback_to_default_culture)
+    return model.parse_batch(queries, timeout_ms=timeout_ms)
+
+
+def recognize_mention_batch(queries: Iterable[str], culture: str, options: SequenceOptions = SequenceOptions.NONE,
+                            fallback_to_default_culture: bool = True,
+                            timeout_ms: float = None) -> List[List[ModelResult]]:
+    recognizer = SequenceRecognizer(culture, options)
+    model = recognizer.get_mention_model(culture, fallback_to_default_culture)
+    return model.parse_batch(queries, timeout_ms=timeout_ms)
+
+
+def recognize_hashtag_batch(queries: Iterable[str], culture: str, options: SequenceOptions = SequenceOptions.NONE,
+                            fallback_to_default_culture: bool = True,
+                            timeout_ms: float = None) -> List[List[ModelResult]]:
+    recognizer = SequenceRecognizer(culture, options)
+    model = recognizer.get_hashtag_model(culture, fallback_to_default_culture)
+    return model.parse_batch(queries, timeout_ms=timeout_ms)
+
+
+def recognize_url_batch(queries: Iterable[str], culture: str, options: SequenceOptions = SequenceOptions.NONE,
+                        fallback_to_default_culture: bool = True,
+                        timeout_ms: float = None) -> List[List[ModelResult]]:
+    recognizer = SequenceRecognizer(culture, options)
+    model = recognizer.get_url_model(culture, fallback_to_default_culture)
+    return model.parse_batch(queries, timeout_ms=timeout_ms)
+
+
+def recognize_guid_batch(queries: Iterable[str], culture: str, options: SequenceOptions = SequenceOptions.NONE,
+                         fallback_to_default_culture: bool = True,
+                         timeout_ms: float = None) -> List[List[ModelResult]]:
     recognizer = SequenceRecognizer(culture, options)
     model = recognizer.get_guid_model(culture, fallback_to_default_culture)
-    return model.parse(query)
+    return model.parse_batch(queries, timeout_ms=timeout_ms)
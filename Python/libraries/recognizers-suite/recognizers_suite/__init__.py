@@ -3,8 +3,13 @@
 
 from recognizers_text.model import ModelResult
 from recognizers_text.culture import Culture
-from recognizers_number.number.number_recognizer import recognize_number, recognize_ordinal, recognize_percentage, NumberOptions
-from recognizers_number_with_unit.number_with_unit.number_with_unit_recognizer import recognize_age, recognize_currency, recognize_dimension, recognize_temperature, NumberWithUnitOptions
-from recognizers_date_time.date_time.date_time_recognizer import recognize_datetime, DateTimeOptions
-from recognizers_sequence.sequence.sequence_recognizer import recognize_phone_number, recognize_email, recognize_url, recognize_ip_address, SequenceOptions
+from recognizers_number.number.number_recognizer import recognize_number, recognize_ordinal, recognize_percentage, NumberOptions, \
+    recognize_number_batch, recognize_ordinal_batch, recognize_percentage_batch
+from recognizers_number_with_unit.number_with_unit.number_with_unit_recognizer import recognize_age, recognize_currency, recognize_dimension, recognize_temperature, NumberWithUnitOptions, \
+    recognize_age_batch, recognize_currency_batch, recognize_dimension_batch, recognize_temperature_batch
+from recognizers_date_time.date_time.date_time_recognizer import recognize_datetime, DateTimeOptions, recognize_datetime_batch
+from recognizers_sequence.sequence.sequence_recognizer import recognize_phone_number, recognize_email, recognize_url, recognize_ip_address, SequenceOptions, \
+    recognize_phone_number_batch, recognize_email_batch, recognize_url_batch, recognize_ip_address_batch
 from recognizers_choice.choice.recognizers_choice import *
+from recognizers_suite.snapshot import save_snapshot, load_snapshot
+from recognizers_suite.pipeline import recognize_all
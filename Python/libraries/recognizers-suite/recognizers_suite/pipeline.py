@@ -0,0 +1,79 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import inspect
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple, Type
+
+from recognizers_text import Recognizer
+from recognizers_text.extractor import ExtractionContext
+from recognizers_text.model import ModelResult
+from recognizers_text.utilities import PreprocessedQuery
+from recognizers_number.number.number_recognizer import NumberRecognizer
+from recognizers_number_with_unit.number_with_unit.number_with_unit_recognizer import NumberWithUnitRecognizer
+from recognizers_date_time.date_time.date_time_recognizer import DateTimeRecognizer, DateTimeOptions
+from recognizers_sequence.sequence.sequence_recognizer import SequenceRecognizer
+from recognizers_choice.choice.recognizers_choice import ChoiceRecognizer
+
+# The models recognize_all runs, by name, with the recognizer and the method that build them
+MODELS: Dict[str, Tuple[Type[Recognizer], str]] = {
+    'number': (NumberRecognizer, 'get_number_model'),
+    'ordinal': (NumberRecognizer, 'get_ordinal_model'),
+    'percentage': (NumberRecognizer, 'get_percentage_model'),
+    'age': (NumberWithUnitRecognizer, 'get_age_model'),
+    'currency': (NumberWithUnitRecognizer, 'get_currency_model'),
+    'dimension': (NumberWithUnitRecognizer, 'get_dimension_model'),
+    'temperature': (NumberWithUnitRecognizer, 'get_temperature_model'),
+    'datetime': (DateTimeRecognizer, 'get_datetime_model'),
+    'phone_number': (SequenceRecognizer, 'get_phone_number_model'),
+    'email': (SequenceRecognizer, 'get_email_model'),
+    'url': (SequenceRecognizer, 'get_url_model'),
+    'ip_address': (SequenceRecognizer, 'get_ip_address_model'),
+    'mention': (SequenceRecognizer, 'get_mention_model'),
+    'hashtag': (SequenceRecognizer, 'get_hashtag_model'),
+    'guid': (SequenceRecognizer, 'get_guid_model'),
+    'boolean': (ChoiceRecognizer, 'get_boolean_model'),
+}
+
+
+def recognize_all(query: str, culture: str, models: Iterable[str] = None, reference: datetime = None,
+                  datetime_options: DateTimeOptions = DateTimeOptions.NONE, fallback_to_default_culture: bool = True,
+                  timeout_ms: float = None) -> List[ModelResult]:
+    """
+    Runs the given models (every model of MODELS if None) on query and returns all their results in a single
+    list, ordered by position, each one typed by its type_name. Results at the same position keep the order
+    of models.
+
+    The models share one normalized query, and parse it in one ExtractionContext: the extractors they have
+    in common, like the number extractors the number, number-with-unit and datetime models of a culture share,
+    run once for all of them. The reference is passed to the datetime model and the timeout to every model.
+    """
+    names = list(MODELS) if models is None else list(models)
+    unknown = [name for name in names if name not in MODELS]
+    if unknown:
+        raise ValueError(f'Unknown models: {", ".join(unknown)}. Expected any of: {", ".join(MODELS)}')
+
+    query = PreprocessedQuery(query)
+    recognizers: Dict[Type[Recognizer], Recognizer] = dict()
+    results: List[ModelResult] = []
+
+    with ExtractionContext():
+        for name in names:
+            recognizer_type, get_model = MODELS[name]
+            recognizer = recognizers.get(recognizer_type)
+            if recognizer is None:
+                # Models are built as they are asked for, rather than every model of the culture
+                if recognizer_type is DateTimeRecognizer:
+                    recognizer = DateTimeRecognizer(culture, datetime_options, lazy_initialization=False)
+                else:
+                    recognizer = recognizer_type(culture, lazy_initialization=False)
+                recognizers[recognizer_type] = recognizer
+
+            model = getattr(recognizer, get_model)(culture, fallback_to_default_culture)
+            kwargs = {} if timeout_ms is None else {'timeout_ms': timeout_ms}
+            if 'reference' in inspect.signature(model.parse).parameters:
+                kwargs['reference'] = reference
+            results += model.parse(query, **kwargs)
+
+    results.sort(key=lambda result: (result.start, result.end))
+    return results
@@ -0,0 +1,34 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from typing import Iterable
+
+from recognizers_text.model import ModelFactory
+from recognizers_number.number.number_recognizer import NumberRecognizer
+from recognizers_number_with_unit.number_with_unit.number_with_unit_recognizer import NumberWithUnitRecognizer
+from recognizers_date_time.date_time.date_time_recognizer import DateTimeRecognizer
+from recognizers_sequence.sequence.sequence_recognizer import SequenceRecognizer
+from recognizers_choice.choice.recognizers_choice import ChoiceRecognizer
+
+RECOGNIZERS = [NumberRecognizer, NumberWithUnitRecognizer, DateTimeRecognizer, SequenceRecognizer, ChoiceRecognizer]
+
+
+def save_snapshot(path: str, cultures: Iterable[str]) -> int:
+    """
+    Builds the number, number-with-unit, datetime, sequence and choice models of the given cultures
+    with their default options and saves them to path. Returns the number of models saved.
+    """
+    cultures = list(cultures)
+    for culture in cultures:
+        for recognizer in RECOGNIZERS:
+            recognizer(culture)
+
+    return ModelFactory.save_snapshot(path, cultures)
+
+
+def load_snapshot(path: str, cultures: Iterable[str] = None, compile_patterns: bool = False) -> int:
+    """
+    Restores the models saved by save_snapshot. The snapshot is unpickled, which can run arbitrary code:
+    only load snapshots from a trusted source.
+    """
+    return ModelFactory.load_snapshot(path, cultures, compile_patterns)
@@ -7,3 +7,11 @@ from .model import *
 from .extractor import *
 from .parser import *
 from .utilities import *
+from .pool import *
+from .component_registry import *
+from .profiling import *
+from .prefilter import *
+from .result_cache import *
+from .lazy_imports import *
+from .streaming import *
+from .incremental import *
@@ -0,0 +1,77 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from inspect import signature
+from threading import Lock
+from typing import Any, Callable, Dict, Tuple
+from weakref import WeakValueDictionary
+
+
+class ComponentRegistry:
+    """
+    Process-wide store of the extractors, parsers and configurations shared between models.
+
+    A component is identified by its constructor and the arguments it was built with, defaults
+    included, so the culture is part of the key through the culture specific class, and leaving out
+    an argument shares the component built with its default value. Components built from other
+    shared components are shared in turn, which lets the datetime, number and number-with-unit
+    models of a culture reuse a single copy of each sub-graph. Only components that are not
+    mutated after construction should be registered.
+
+    Components are held weakly: they are shared for as long as a model uses them, and dropped
+    with the last one, such as the models evicted from the ModelFactory cache.
+    """
+    __components: Dict[Tuple, Any] = WeakValueDictionary()
+    __lock = Lock()
+    __build_locks: Dict[Tuple, Lock] = dict()
+    __signatures: Dict[Callable, Any] = dict()
+
+    @staticmethod
+    def get_or_create(constructor: Callable, *args) -> Any:
+        key = ComponentRegistry.__key(constructor, args)
+        component = ComponentRegistry.__components.get(key)
+        if component is not None:
+            return component
+
+        with ComponentRegistry.__lock:
+            build_lock = ComponentRegistry.__build_locks.setdefault(key, Lock())
+
+        # Single flight per component: the shared dependencies it builds take their own locks,
+        # so components of other models and cultures are built concurrently
+        with build_lock:
+            component = ComponentRegistry.__components.get(key)
+            if component is None:
+                component = constructor(*args)
+                ComponentRegistry.__components[key] = component
+
+        with ComponentRegistry.__lock:
+            if ComponentRegistry.__build_locks.get(key) is build_lock:
+                del ComponentRegistry.__build_locks[key]
+
+        return component
+
+    @staticmethod
+    def __key(constructor: Callable, args: Tuple) -> Tuple:
+        constructor_signature = ComponentRegistry.__signatures.get(constructor)
+        if constructor_signature is None:
+            try:
+                constructor_signature = signature(constructor)
+            except (TypeError, ValueError):
+                constructor_signature = False
+            ComponentRegistry.__signatures[constructor] = constructor_signature
+
+        if not constructor_signature:
+            return (constructor,) + args
+
+        arguments = constructor_signature.bind(*args)
+        arguments.apply_defaults()
+        return (constructor,) + arguments.args + tuple(sorted(arguments.kwargs.items()))
+
+    @staticmethod
+    def size() -> int:
+        return len(ComponentRegistry.__components)
+
+    @staticmethod
+    def clear():
+        with ComponentRegistry.__lock:
+            ComponentRegistry.__components.clear()
@@ -2,11 +2,35 @@
 #  Licensed under the MIT License.
 
 from abc import ABC, abstractmethod
-from typing import List
+from contextvars import ContextVar
+from copy import deepcopy
+from functools import wraps
+from typing import List, Dict, Optional
 from .meta_data import MetaData
 
 
+def _copy_value(value):
+    """
+    Copies the values stored in results as deepcopy would, without its memo and dispatch overhead
+    for the types results are made of: nested results, metadata, lists, dicts and immutable values.
+    """
+    if value is None or type(value) in _IMMUTABLE_TYPES:
+        return value
+    if isinstance(value, _COPYABLE_TYPES):
+        return value.copy()
+    if type(value) is list:
+        return [_copy_value(item) for item in value]
+    if type(value) is tuple:
+        return tuple(_copy_value(item) for item in value)
+    if type(value) is dict:
+        return {key: _copy_value(item) for key, item in value.items()}
+    return deepcopy(value)
+
+
 class ExtractResult:
+    # metadata is only set by the holiday extractors, which mark their results with it
+    __slots__ = ('start', 'length', 'text', 'type', 'data', 'meta_data', 'metadata')
+
     def __init__(self):
         self.start: int = 0
         self.length: int = 0
@@ -26,6 +50,24 @@ class ExtractResult:
         return (((other.start < self.start) and (other.end >= self.end))
                 or ((other.start <= self.start) and (other.end > self.end)))
 
+    def copy(self):
+        """
+        Returns a copy as independent as deepcopy's, but much cheaper to make.
+        """
+        result = object.__new__(type(self))
+        self._copy_to(result)
+        return result
+
+    def _copy_to(self, result):
+        result.start = self.start
+        result.length = self.length
+        result.text = self.text
+        result.type = self.type
+        result.data = _copy_value(self.data)
+        result.meta_data = _copy_value(self.meta_data)
+        if hasattr(self, 'metadata'):
+            result.metadata = _copy_value(self.metadata)
+
     @staticmethod
     def get_from_text(source: str):
         result = ExtractResult()
@@ -43,6 +85,8 @@ class Extractor(ABC):
 
 
 class Metadata:
+    __slots__ = ('_possibly_included_period_end', '_is_duration_with_before_and_after', '_is_holiday', '_has_mod',
+                 '_is_ordinal_relative', '_offset', '_relative_to', '_is_mealtime')
 
     def __init__(self):
         self._possibly_included_period_end = False
@@ -117,3 +161,72 @@ class Metadata:
     @is_mealtime.setter
     def is_mealtime(self, value):
         self._is_mealtime = value
+
+    def copy(self):
+        result = object.__new__(Metadata)
+        for name in Metadata.__slots__:
+            setattr(result, name, getattr(self, name))
+        return result
+
+
+_IMMUTABLE_TYPES = frozenset([str, int, float, bool])
+_COPYABLE_TYPES = (ExtractResult, Metadata, MetaData)
+
+
+class ExtractionContext:
+    """
+    Memoizes extractor results for the lifetime of one request (e.g. one model parse call).
+
+    Inside the context, every extract method decorated with memoize_extraction runs at most once
+    per (extractor, source, arguments); repeated calls get a copy of the first results.
+    Nested contexts reuse the memo of the outermost one.
+    """
+    __current: ContextVar[Optional['ExtractionContext']] = ContextVar('extraction_context', default=None)
+
+    def __init__(self):
+        self.memo: Dict[tuple, List[ExtractResult]] = dict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.__token = None
+
+    @staticmethod
+    def current() -> Optional['ExtractionContext']:
+        return ExtractionContext.__current.get()
+
+    def __enter__(self) -> 'ExtractionContext':
+        outer = ExtractionContext.current()
+        if outer is not None:
+            return outer
+        self.__token = ExtractionContext.__current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.__token is not None:
+            ExtractionContext.__current.reset(self.__token)
+            self.__token = None
+            self.memo.clear()
+
+
+def memoize_extraction(extract):
+    """
+    Decorates an extract method so its results are shared inside the current ExtractionContext.
+    Callers always receive their own copy, since results are usually modified after extraction.
+    """
+    @wraps(extract)
+    def wrapper(self, source, *args, **kwargs):
+        context = ExtractionContext.current()
+        if context is None:
+            return extract(self, source, *args, **kwargs)
+
+        key = (extract, self, source, args, tuple(kwargs.items()))
+        results = context.memo.get(key)
+        if results is None:
+            context.misses += 1
+            results = extract(self, source, *args, **kwargs)
+            context.memo[key] = _copy_value(results)
+            return results
+
+        context.hits += 1
+        return _copy_value(results)
+
+    return wrapper
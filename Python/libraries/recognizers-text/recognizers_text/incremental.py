@@ -0,0 +1,124 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from typing import Any, Dict, List
+
+from .model import Model, ModelResult
+from .streaming import default_max_entity_length
+
+
+class IncrementalSession:
+    """
+    Keeps the entities of a model in a text being edited, e.g. in an editor, up to date.
+
+    After an edit only its neighborhood is parsed again: the edited range, widened by max_entity_length
+    characters on each side and to the entities it overlaps, together with as much context around it.
+    The entities found there replace the ones of the neighborhood, and those after it are shifted by
+    the change in length, so the cost of an edit depends on its size rather than on the text's.
+    Other arguments, e.g. the reference of the datetime model, are passed to the model.
+    """
+
+    def __init__(self, model: Model, text: str = '', max_entity_length: int = None, **kwargs):
+        if max_entity_length is None:
+            max_entity_length = default_max_entity_length(model)
+        if max_entity_length < 1:
+            raise ValueError('max_entity_length must be greater than zero')
+
+        self.model = model
+        self.max_entity_length = max_entity_length
+        self.kwargs = kwargs
+        self.__text = text
+        self.__stats = {'edits': 0, 'parsed_characters': 0}
+        self.__results: List[ModelResult] = self.__parse(text, 0, len(text))
+
+    @property
+    def text(self) -> str:
+        return self.__text
+
+    @property
+    def results(self) -> List[ModelResult]:
+        """
+        The entities of the current text, ordered by start. They are copies: later edits don't change them.
+        """
+        return [result.copy() for result in self.__results]
+
+    def edit(self, start: int, end: int, replacement: str) -> List[ModelResult]:
+        """
+        Replaces text[start:end] with replacement and returns the entities of the new text.
+        """
+        text = self.__text
+        if not 0 <= start <= end <= len(text):
+            raise ValueError(f'Invalid range [{start}, {end}) for a text of length {len(text)}')
+
+        delta = len(replacement) - (end - start)
+        new_text = text[:start] + replacement + text[end:]
+
+        # The neighborhood, in the old text, whose entities are decided again
+        low = max(start - self.max_entity_length, 0)
+        high = min(end + self.max_entity_length, len(text))
+        results = self.__results
+        first = 0
+        while first < len(results) and results[first].end < low:
+            first += 1
+        last = first
+        while last < len(results) and results[last].start < high:
+            low = min(low, results[last].start)
+            high = max(high, results[last].end + 1)
+            last += 1
+
+        found = self.__parse(new_text, low, high + delta)
+        self.__results = results[:first] + found + [self.__shift(result, delta) for result in results[last:]]
+        self.__text = new_text
+        self.__stats['edits'] += 1
+        return self.results
+
+    def set_text(self, text: str) -> List[ModelResult]:
+        """
+        Replaces the text with a new version, e.g. an editor's buffer after a change, and returns its entities.
+        Only the range between the common prefix and suffix of both versions is treated as edited.
+        """
+        old = self.__text
+        prefix = 0
+        limit = min(len(old), len(text))
+        while prefix < limit and old[prefix] == text[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old[-suffix - 1] == text[-suffix - 1]:
+            suffix += 1
+
+        return self.edit(prefix, len(old) - suffix, text[prefix:len(text) - suffix])
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the number of edits, and the characters parsed since the session started.
+        """
+        return dict(self.__stats, text_length=len(self.__text))
+
+    def __parse(self, text: str, low: int, high: int) -> List[ModelResult]:
+        # Entities starting in [low, high) are parsed with up to max_entity_length characters of context around
+        window_start = self.__snap(text, max(low - self.max_entity_length, 0), -1)
+        window_end = self.__snap(text, min(high + self.max_entity_length, len(text)), 1)
+        self.__stats['parsed_characters'] += window_end - window_start
+
+        found = []
+        for result in self.model.parse(text[window_start:window_end], **self.kwargs):
+            result.start += window_start
+            result.end += window_start
+            if low <= result.start < high:
+                found.append(result)
+
+        found.sort(key=lambda result: result.start)
+        return found
+
+    def __snap(self, text: str, position: int, direction: int) -> int:
+        # Windows end on word boundaries when one is close, so no word at their edges is cut
+        limit = position + direction * self.max_entity_length
+        while 0 < position < len(text) and position != limit and not text[position - 1].isspace():
+            position += direction
+        return position
+
+    @staticmethod
+    def __shift(result: ModelResult, delta: int) -> ModelResult:
+        result.start += delta
+        result.end += delta
+        return result
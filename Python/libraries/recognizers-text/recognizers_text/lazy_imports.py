@@ -0,0 +1,53 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import sys
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_package(package: str, submodules: Iterable[str] = (),
+                 attributes: Dict[str, str] = None) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Returns the module __getattr__ and __dir__ (PEP 562) of a package whose submodules, usually
+    the culture specific ones, are only imported when one of their names is first accessed.
+
+    attributes maps names to the submodule they come from, as `from .submodule import name` would.
+    Any other public name is looked up in submodules, in order, as `from .submodule import *` would,
+    and any submodule can also be accessed by its own name. Found values are stored in the package,
+    so each name is only resolved once.
+
+    Star imports only see the names already in the package, so it lists the names they should
+    resolve in __all__.
+    """
+    submodules = list(submodules)
+    attributes = dict(attributes or {})
+
+    def __getattr__(name: str):
+        module = sys.modules[package]
+        if name in attributes:
+            value = getattr(import_module('.' + attributes[name], package), name)
+        elif name in submodules:
+            value = import_module('.' + name, package)
+        elif name.startswith('_'):
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+        else:
+            for submodule in submodules:
+                candidate = import_module('.' + submodule, package)
+                if hasattr(candidate, name):
+                    value = getattr(candidate, name)
+                    break
+            else:
+                if find_spec('.' + name, package) is None:
+                    raise AttributeError(f'module {package!r} has no attribute {name!r}')
+                value = import_module('.' + name, package)
+
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        module = vars(sys.modules[package])
+        return sorted(set(module) | set(module.get('__all__', ())) | set(attributes) | set(submodules))
+
+    return __getattr__, __dir__
@@ -6,26 +6,17 @@ from .node import Node
 
 class AaNode(Node):
 
-    def __init__(self, c: [] = [], depth: int = 0, parent=[]):
-        self.__word = c,
-        self.__depth = depth,
-        self.__parent = parent,
-        self.__fail = 0
-
-    def __getitem__(self, item):
-        if self.children is not None and item in self.children:
-            return self.children[item]
-        else:
-            return None
-
-    def __setitem__(self, key, value):
-        if self.children is None:
-            self.children = {}
-
-        self.children[key] = value
+    def __init__(self, word: str = None, depth: int = 0, parent=None):
+        super().__init__()
+        self.__word = word
+        # Number of tokens from the root
+        self.__depth = depth
+        self.__parent = parent
+        self.__fail = None
+        self.__output = None
 
     @property
-    def word(self) -> []:
+    def word(self) -> str:
         return self.__word
 
     @word.setter
@@ -33,7 +24,7 @@ class AaNode(Node):
         self.__word = word
 
     @property
-    def depth(self):
+    def depth(self) -> int:
         return self.__depth
 
     @depth.setter
@@ -50,11 +41,21 @@ class AaNode(Node):
 
     @property
     def fail(self):
+        # Node of the longest proper suffix of this node's path that is in the tree
         return self.__fail
 
     @fail.setter
     def fail(self, fail):
         self.__fail = fail
 
+    @property
+    def output(self):
+        # Nearest node along the failure links that ends a value, if any
+        return self.__output
+
+    @output.setter
+    def output(self, output):
+        self.__output = output
+
     def to_string(self):
         return str(self.__word)
@@ -0,0 +1,257 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from threading import Lock
+from typing import Callable, Dict, List, Optional
+from weakref import WeakValueDictionary
+
+from .abstract_matcher import AbstractMatcher
+from .match_result import MatchResult
+
+# Magic, format version, byte order mark, node, edge and value counts, token and value text sizes
+HEADER = struct.Struct('=4sIIIIIII')
+MAGIC = b'RTAT'
+FORMAT_VERSION = 1
+BYTE_ORDER_MARK = 0x01020304
+SEPARATOR = '\x00'
+
+
+class ArrayTrie(AbstractMatcher):
+    """
+    Trie stored in flat integer arrays rather than in a Node object per token.
+
+    Tokens are interned to integer ids. The children of node n are the (label, target) pairs in
+    labels[offsets[n]:offsets[n + 1]], sorted by token id (a CSR layout), and its values are
+    values[value_offsets[n]:value_offsets[n + 1]]. It finds the same matches as TrieTree, in the same order,
+    in a fraction of its memory. The arrays hold no Python objects, so forked processes share their pages,
+    and equal dictionaries share one instance through ArrayTrie.shared.
+
+    to_bytes writes the arrays as they are in memory, after a header, and load maps such a file read only:
+    the arrays are views on the file, which every process loading it shares.
+    """
+    __shared: Dict[str, 'ArrayTrie'] = WeakValueDictionary()
+    __shared_lock = Lock()
+    __prebuilt_paths: List[str] = []
+
+    def __init__(self):
+        self.key: Optional[str] = None
+        self.token_ids: Dict[str, int] = dict()
+        self.offsets = array('i', [0, 0])
+        self.labels = array('i')
+        self.targets = array('i')
+        self.value_offsets = array('i', [0, 0])
+        self.values: List[str] = []
+        self.__pending = []
+
+    @property
+    def size(self) -> int:
+        return len(self.values)
+
+    @staticmethod
+    def dictionary_key(tokenizer: str, values: [], ids: []) -> str:
+        """
+        Identifies a dictionary by its values and ids before they are tokenized, and the name of the tokenizer.
+        """
+        digest = hashlib.sha1(f'{FORMAT_VERSION}\x1d{tokenizer}\x1d'.encode('utf-8'))
+        for value, _id in zip(values, ids):
+            digest.update(f'{value}\x1e{_id}\x1d'.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def add_prebuilt_path(path: str) -> None:
+        """
+        Adds a directory where ArrayTrie.shared looks for a prebuilt <key>.bin before building a dictionary.
+        """
+        with ArrayTrie.__shared_lock:
+            if path not in ArrayTrie.__prebuilt_paths:
+                ArrayTrie.__prebuilt_paths.append(path)
+
+    @staticmethod
+    def shared(key: str, values: Callable[[], list], ids: []) -> 'ArrayTrie':
+        """
+        Returns the trie of the dictionary identified by key: the one already in use, else the prebuilt one,
+        else a trie built of the tokenized values returned by values. It is shared, so it must not be
+        changed: copy() it first.
+        """
+        def build() -> 'ArrayTrie':
+            trie = ArrayTrie()
+            trie.init(values(), ids)
+            return trie
+
+        return ArrayTrie.__share(key, build)
+
+    @staticmethod
+    def __share(key: str, build: Callable[[], 'ArrayTrie']) -> 'ArrayTrie':
+        with ArrayTrie.__shared_lock:
+            trie = ArrayTrie.__shared.get(key)
+            if trie is None:
+                trie = ArrayTrie.__load_prebuilt(key)
+                if trie is None:
+                    trie = build()
+                trie.key = key
+                ArrayTrie.__shared[key] = trie
+        return trie
+
+    @staticmethod
+    def shared_tries() -> Dict[str, 'ArrayTrie']:
+        with ArrayTrie.__shared_lock:
+            return dict(ArrayTrie.__shared)
+
+    @staticmethod
+    def __load_prebuilt(key: str) -> Optional['ArrayTrie']:
+        for path in ArrayTrie.__prebuilt_paths:
+            file_path = os.path.join(path, key + '.bin')
+            if os.path.isfile(file_path):
+                try:
+                    return ArrayTrie.load(file_path)
+                except (OSError, ValueError):
+                    # Written on a platform of another byte order or by another version, built again
+                    return None
+        return None
+
+    @staticmethod
+    def load(path: str) -> 'ArrayTrie':
+        with open(path, 'rb') as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return ArrayTrie.from_buffer(buffer)
+
+    @staticmethod
+    def from_buffer(buffer) -> 'ArrayTrie':
+        """
+        Reads the trie written by to_bytes without copying its arrays, which stay views on buffer.
+        """
+        view = memoryview(buffer)
+        if len(view) < HEADER.size:
+            raise ValueError('Not an ArrayTrie')
+        magic, version, byte_order, nodes, edges, values, tokens_size, values_size = HEADER.unpack_from(view)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError('Unsupported ArrayTrie format')
+        if byte_order != BYTE_ORDER_MARK:
+            raise ValueError('ArrayTrie written with another byte order')
+
+        def take(count: int):
+            nonlocal position
+            start, position = position, position + count * 4
+            return view[start:position].cast('i')
+
+        position = HEADER.size
+        result = ArrayTrie()
+        result.offsets = take(nodes + 1)
+        result.labels = take(edges)
+        result.targets = take(edges)
+        result.value_offsets = take(nodes + 1)
+
+        tokens = bytes(view[position:position + tokens_size]).decode('utf-8', 'surrogatepass')
+        position += tokens_size
+        result.token_ids = {token: i for i, token in enumerate(tokens.split(SEPARATOR))} if tokens_size else dict()
+        text = bytes(view[position:position + values_size]).decode('utf-8', 'surrogatepass')
+        result.values = text.split(SEPARATOR) if values else []
+        return result
+
+    def to_bytes(self) -> bytes:
+        tokens = sorted(self.token_ids, key=self.token_ids.get)
+        if any(SEPARATOR in text for text in tokens + self.values):
+            raise ValueError('ArrayTrie tokens and values can\'t be written with a NUL character')
+        tokens = SEPARATOR.join(tokens).encode('utf-8', 'surrogatepass')
+        values = SEPARATOR.join(self.values).encode('utf-8', 'surrogatepass')
+
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, BYTE_ORDER_MARK, len(self.offsets) - 1, len(self.labels),
+                             len(self.values), len(tokens), len(values))
+        arrays = (self.offsets, self.labels, self.targets, self.value_offsets)
+        return b''.join([header] + [bytes(items) for items in arrays] + [tokens, values])
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+    def __reduce__(self):
+        # Views on a mapped file can't be pickled, the arrays are written as bytes instead
+        return ArrayTrie._restore, (self.key, self.to_bytes())
+
+    @staticmethod
+    def _restore(key: Optional[str], data: bytes) -> 'ArrayTrie':
+        if key is None:
+            return ArrayTrie.from_buffer(data)
+        return ArrayTrie.__share(key, lambda: ArrayTrie.from_buffer(data))
+
+    def copy(self) -> 'ArrayTrie':
+        result = ArrayTrie()
+        result.token_ids = dict(self.token_ids)
+        result.offsets = array('i', self.offsets)
+        result.labels = array('i', self.labels)
+        result.targets = array('i', self.targets)
+        result.value_offsets = array('i', self.value_offsets)
+        result.values = list(self.values)
+        return result
+
+    def insert(self, value: [], _id: str) -> None:
+        token_ids = self.token_ids
+        self.__pending.append(([token_ids.setdefault(token, len(token_ids)) for token in value], _id))
+
+    def init(self, values: [], ids: []) -> None:
+        self.batch_insert(values, ids)
+        self.__build()
+
+    def __build(self):
+        # Nested [children, values] lists, rebuilt from the arrays and then extended with the pending values
+        root = self.__unpack(0)
+        for tokens, _id in self.__pending:
+            node = root
+            for token in tokens:
+                child = node[0].get(token)
+                if child is None:
+                    child = node[0][token] = [dict(), []]
+                node = child
+            node[1].append(_id)
+        self.__pending = []
+
+        offsets, labels, targets = array('i', [0]), array('i'), array('i')
+        value_offsets, values = array('i', [0]), []
+        # Breadth first, so every node's children are numbered consecutively
+        queue = [root]
+        for node in queue:
+            for token in sorted(node[0]):
+                labels.append(token)
+                targets.append(len(queue))
+                queue.append(node[0][token])
+            offsets.append(len(labels))
+            # Like Node.end, a node without any non empty value isn't a match
+            if any(node[1]):
+                values += node[1]
+            value_offsets.append(len(values))
+
+        self.offsets, self.labels, self.targets = offsets, labels, targets
+        self.value_offsets, self.values = value_offsets, values
+
+    def __unpack(self, node: int) -> list:
+        children = {self.labels[k]: self.__unpack(self.targets[k]) for k in range(self.offsets[node], self.offsets[node + 1])}
+        return [children, self.values[self.value_offsets[node]:self.value_offsets[node + 1]]]
+
+    def find(self, query_text: []) -> []:
+        token_ids = self.token_ids
+        query = [token_ids.get(token, -1) for token in query_text]
+        offsets, labels, targets = self.offsets, self.labels, self.targets
+        value_offsets, values = self.value_offsets, self.values
+        length = len(query)
+
+        for i in range(length):
+            node = 0
+            for j in range(i, length + 1):
+                if value_offsets[node] != value_offsets[node + 1]:
+                    yield MatchResult(i, j - i, values[value_offsets[node]:value_offsets[node + 1]])
+
+                if j == length or query[j] < 0:
+                    break
+
+                low, high = offsets[node], offsets[node + 1]
+                k = bisect_left(labels, query[j], low, high)
+                if k == high or labels[k] != query[j]:
+                    break
+
+                node = targets[k]
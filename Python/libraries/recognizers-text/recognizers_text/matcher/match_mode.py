@@ -0,0 +1,16 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from enum import Enum
+
+
+class MatchMode(Enum):
+
+    # Every match, by start and then length
+    All = 0
+
+    # The matches which aren't inside a longer one, overlapping ones are kept
+    Maximal = 1
+
+    # From left to right, the longest match starting first, then the same after its end: no two overlap
+    LeftmostLongest = 2
@@ -2,6 +2,7 @@
 #  Licensed under the MIT License.
 
 class MatchResult:
+    __slots__ = ('__length', '__start', '__canonical_values', '__text')
 
     def __init__(self, start: int = 0, length: int = 0, ids: [] = []):
         self.__length = length
@@ -44,3 +45,9 @@ class MatchResult:
     @canonical_values.setter
     def canonical_values(self, canonical_values: []) -> []:
         self.__canonical_values: [] = canonical_values
+
+    def copy(self):
+        canonical_values = self.__canonical_values
+        result = MatchResult(self.__start, self.__length, canonical_values.copy() if canonical_values is not None else None)
+        result.text = self.__text
+        return result
@@ -9,3 +9,5 @@ class MatchStrategy(Enum):
     AcAutomaton = 0
 
     TrieTree = 1
+
+    ArrayTrie = 2
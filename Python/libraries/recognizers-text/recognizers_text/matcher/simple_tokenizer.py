@@ -1,70 +1,72 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
+import re
+from typing import Callable, Dict, Pattern
+
 from .tokenizer import Tokenizer
 from .token import Token
 
 
-class SimpleTokenizer(Tokenizer):
-
-    def tokenize(self, input: str) -> []:
-        tokens = []
-
-        if not input:
-            return tokens
-
-        in_token = False
-        token_start = 0
-        chars = list(input)
-        for i in range(0, len(chars)):
+class CharacterClasses(dict):
+    """
+    str.translate table mapping each character to the letter of its class, which classify computes
+    the first time the character is seen.
+    """
 
-            c = chars[i]
-            if str.isspace(c):
-                if in_token:
-                    tokens.append(Token(token_start, i - token_start,
-                                        input[token_start: token_start + (i - token_start)]))
-                    in_token = False
-            elif not (str.isdigit(c) or str.isalpha(c)) or self.is_cjk(c):
+    def __init__(self, classify: Callable[[str], str]):
+        super().__init__()
+        self.__classify = classify
 
-                # Non-splittable currency units (as "$") are treated as regular letters. For instance, 'us$' should be
-                # a single token
-                if in_token:
+    def __missing__(self, code: int) -> str:
+        result = self[code] = self.__classify(chr(code))
+        return result
 
-                    tokens.append(Token(token_start, i - token_start,
-                                        input[token_start: token_start + (i - token_start)]))
-                    in_token = False
 
-                tokens.append(Token(i, 1, input[i: token_start + (i - token_start) + 1]))
-
-            else:
-
-                if not in_token:
-                    token_start = i
-                    in_token = True
+class SimpleTokenizer(Tokenizer):
+    # Letters and digits (w) are grouped into tokens, spaces (s) separate them and any other character (o) is a token
+    token_regex: Pattern = re.compile('w+|o')
 
-        if in_token:
-            tokens.append(Token(token_start, len(chars) - token_start,
-                                input[token_start: token_start + (len(chars) - token_start)]))
+    __tables: Dict[tuple, CharacterClasses] = dict()
 
-        return tokens
+    def tokenize(self, input: str) -> []:
+        if not input:
+            return []
+
+        # One translate maps the input to the classes of its characters, in which one scan finds the tokens
+        classes = input.translate(self.character_classes)
+        return [Token(start, end - start, input[start:end])
+                for start, end in (match.span() for match in self.token_regex.finditer(classes))]
+
+    @property
+    def character_classes(self) -> CharacterClasses:
+        key = self.character_classes_key()
+        table = SimpleTokenizer.__tables.get(key)
+        if table is None:
+            table = SimpleTokenizer.__tables.setdefault(key, CharacterClasses(self.classify))
+        return table
+
+    def character_classes_key(self) -> tuple:
+        return type(self),
+
+    def classify(self, c: chr) -> str:
+        if str.isspace(c):
+            return 's'
+        if not (str.isdigit(c) or str.isalpha(c)) or self.is_cjk(c):
+            return 'o'
+        return 'w'
 
     def is_chinese(self, c: chr):
         uc = ord(c)
-        hexa_list = [0x4E00, 0x9FBF, 0x3400, 0x4DBF]
-
-        return (hexa_list[0] <= uc <= hexa_list[1]) or (hexa_list[2] <= uc <= hexa_list[3])
+        return 0x4E00 <= uc <= 0x9FBF or 0x3400 <= uc <= 0x4DBF
 
     def is_japanese(self, c: chr):
         uc = ord(c)
-        hexa_list = [0x3040, 0x309F, 0x30A0, 0x30FF, 0xFF66, 0xFF9D]
-        return (hexa_list[0] <= uc <= hexa_list[1]) or (hexa_list[2] <= uc <= hexa_list[3]) or \
-               (hexa_list[4] <= uc <= hexa_list[5])
+        return 0x3040 <= uc <= 0x309F or 0x30A0 <= uc <= 0x30FF or 0xFF66 <= uc <= 0xFF9D
 
     def is_korean(self, c: chr):
         uc = ord(c)
-        hexa_list = [0xAC00, 0xD7AF, 0x1100, 0x11FF, 0x3130, 0x318F, 0xFFB0, 0xFFDC]
-        return (hexa_list[0] <= uc <= hexa_list[1]) or (hexa_list[2] <= uc <= hexa_list[3]) or \
-               (hexa_list[4] <= uc <= hexa_list[5]) or (hexa_list[6] <= uc <= hexa_list[7])
+        return 0xAC00 <= uc <= 0xD7AF or 0x1100 <= uc <= 0x11FF or 0x3130 <= uc <= 0x318F or 0xFFB0 <= uc <= 0xFFDC
 
     def is_cjk(self, c: chr):
         return self.is_chinese(c) or self.is_japanese(c) or self.is_korean(c)
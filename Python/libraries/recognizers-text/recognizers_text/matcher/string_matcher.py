@@ -3,10 +3,12 @@
 
 from .tokenizer import Tokenizer
 from .match_strategy import MatchStrategy
+from .match_mode import MatchMode
 from .simple_tokenizer import SimpleTokenizer
 from .matcher import Matcher
 from .trie_tree import TrieTree
 from .ac_automaton import AcAutomaton
+from .array_trie import ArrayTrie
 from multipledispatch import dispatch
 from .match_result import MatchResult
 
@@ -25,6 +27,9 @@ class StringMatcher:
         elif match_strategy == MatchStrategy.TrieTree:
             return TrieTree()
 
+        elif match_strategy == MatchStrategy.ArrayTrie:
+            return ArrayTrie()
+
         else:
             raise ValueError('Unsupported match strategy: {}'.format(match_strategy))
 
@@ -57,18 +62,36 @@ class StringMatcher:
         elif isinstance(values, list) and ids is None:
             self.init(values, list(map(lambda v: str(v), values)))
         elif isinstance(values, list) and isinstance(ids, list):
-            tokenized_values = self.get_tokenized_text(values)
-            self.matcher.init(tokenized_values, ids)
+            if isinstance(self.matcher, ArrayTrie) and not self.matcher.size:
+                # Matchers of the same dictionary share one trie, prebuilt ones are only tokenized if no file is found
+                key = ArrayTrie.dictionary_key(type(self.tokenizer).__qualname__, values, ids)
+                self.matcher = ArrayTrie.shared(key, lambda: self.get_tokenized_text(values), ids)
+            elif isinstance(self.matcher, ArrayTrie):
+                # The trie may be shared, so values are added to a copy
+                self.matcher = self.matcher.copy()
+                self.matcher.init(self.get_tokenized_text(values), ids)
+            else:
+                self.matcher.init(self.get_tokenized_text(values), ids)
         else:
             raise NotImplementedError
 
-    def find(self, tokenized_query) -> []:
-        if isinstance(tokenized_query, list):
+    def find(self, tokenized_query, mode: MatchMode = MatchMode.All) -> []:
+        if isinstance(tokenized_query, list) and mode == MatchMode.All:
             return self.matcher.find(tokenized_query)
+        return list(self.find_iter(tokenized_query, mode))
+
+    def find_iter(self, tokenized_query, mode: MatchMode = MatchMode.All):
+        """
+        Yields the matches by start and then length as the matcher finds them, so callers can stop early.
+        Tokens are matched, so the matches kept by mode are the same whether they are measured in tokens or characters.
+        """
+        if isinstance(tokenized_query, list):
+            yield from self.select(self.matcher.find(tokenized_query), mode)
+            return
+
         query_tokens = self.__tokenizer.tokenize(tokenized_query)
-        tokenized_query_text = list(map(lambda t: t.text, query_tokens))
-        result = []
-        for r in self.find(tokenized_query_text):
+        tokenized_query_text = [t.text for t in query_tokens]
+        for r in self.select(self.matcher.find(tokenized_query_text), mode):
             start_token = query_tokens[r.start]
             end_token = query_tokens[r.start + r.length - 1]
             start = start_token.start
@@ -80,8 +103,35 @@ class StringMatcher:
             match_result.length = length
             match_result.text = r_text
             match_result.canonical_values = r.canonical_values
-            result.append(match_result)
-        return result
+            yield match_result
+
+    @staticmethod
+    def select(matches, mode: MatchMode):
+        """
+        Keeps the matches of mode among matches ordered by start and then length, which every matcher yields.
+        Only the longest match of each start can be kept, and it is yielded once a later start is seen.
+        """
+        if mode == MatchMode.All:
+            yield from matches
+            return
+
+        if mode not in (MatchMode.Maximal, MatchMode.LeftmostLongest):
+            raise ValueError('Unsupported match mode: {}'.format(mode))
+
+        # End of the matches kept so far for LeftmostLongest, of all those seen before the current start for Maximal
+        end = -1
+        longest = None
+        for match in matches:
+            if longest is not None and match.start != longest.start:
+                if longest.end > end and (mode == MatchMode.Maximal or longest.start >= end):
+                    yield longest
+                    end = longest.end
+                elif mode == MatchMode.Maximal:
+                    end = max(end, longest.end)
+            longest = match
+
+        if longest is not None and longest.end > end and (mode == MatchMode.Maximal or longest.start >= end):
+            yield longest
 
     def get_tokenized_text(self, values: []) -> []:
         return list(map(lambda t: list(map(lambda i: i.text, self.tokenizer.tokenize(t))), values))
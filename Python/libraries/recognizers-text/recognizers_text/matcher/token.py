@@ -2,6 +2,8 @@
 #  Licensed under the MIT License.
 
 class Token(object):
+    __slots__ = ('__length', '__start', '__text')
+
     def __init__(self, start: int, length: int, text: str):
         self.__length = length
         self.__start = start
@@ -34,3 +36,6 @@ class Token(object):
     @property
     def end(self) -> int:
         return self.start + self.length
+
+    def copy(self):
+        return Token(self.__start, self.__length, self.__text)
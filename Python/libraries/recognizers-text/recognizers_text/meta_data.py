@@ -2,7 +2,16 @@
 #  Licensed under the MIT License.
 
 class MetaData:
+    __slots__ = ('has_mod', 'is_duration_with_ago_and_later', 'is_mealtime')
+
     def __init__(self):
         self.has_mod: bool = False
         self.is_duration_with_ago_and_later = False
         self.is_mealtime = False
+
+    def copy(self):
+        result = object.__new__(MetaData)
+        result.has_mod = self.has_mod
+        result.is_duration_with_ago_and_later = self.is_duration_with_ago_and_later
+        result.is_mealtime = self.is_mealtime
+        return result
@@ -1,17 +1,24 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
+import pickle
+import sys
+import time
 from abc import ABC, abstractmethod
 from enum import Flag
-from typing import List, Dict, Generic, TypeVar, Callable, Optional, Union, Any
-from collections import namedtuple
+from threading import Lock, RLock
+from typing import List, Dict, Generic, TypeVar, Callable, Optional, Union, Any, Iterable
+from collections import namedtuple, OrderedDict
 
 from .culture import Culture
+from .extractor import _copy_value
+from .utilities import PatternRegistry
 
 T_MODEL_OPTIONS = TypeVar('T_MODEL_OPTIONS', bound=Flag)
 
 
 class ModelResult(object):
+    __slots__ = ('text', 'start', 'end', 'type_name', 'resolution')
 
     # Raw text extracted (lowered)
     text: str
@@ -37,6 +44,21 @@ class ModelResult(object):
             self.type_name, self.text, self.start, self.end
         )
 
+    def copy(self):
+        """
+        Returns a copy with its own resolution, as deepcopy would, but much cheaper to make.
+        """
+        result = object.__new__(type(self))
+        self._copy_to(result)
+        return result
+
+    def _copy_to(self, result):
+        result.text = self.text
+        result.start = self.start
+        result.end = self.end
+        result.type_name = self.type_name
+        result.resolution = _copy_value(self.resolution)
+
     def get_dict(self) -> Dict[str, Any]:
         """
         Note: Key value naming follows .NET version
@@ -58,21 +80,59 @@ class Model(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def parse(self, query: str) -> List[ModelResult]:
+    def parse(self, query: str, timeout_ms: float = None) -> List[ModelResult]:
+        """
+        Recognizes the entities of query. With a timeout, the pattern matching of the extraction is
+        bounded by a TimeBudget and only the entities found before it runs out are returned; parsing
+        the entities found isn't bounded.
+        """
         raise NotImplementedError
 
+    def parse_batch(self, queries: Iterable[str], reference=None, timeout_ms: float = None) -> List[List[ModelResult]]:
+        """
+        Parses every query with this model instance and returns the results in input order.
+        The reference is only used by models that resolve relative values (e.g. datetime),
+        and the timeout bounds each query on its own.
+        """
+        kwargs = {} if timeout_ms is None else {'timeout_ms': timeout_ms}
+        return [self.parse(query, **kwargs) for query in queries]
+
 
 CacheKey = namedtuple('CacheKey', ['model_type', 'culture', 'options'])
 ModelCtorKey = namedtuple('ModelCtorKey', ['model_type', 'culture'])
 
+SNAPSHOT_FORMAT_VERSION = 2
+
+
+def _package_versions() -> Dict[str, str]:
+    """
+    Returns the versions of the installed recognizers-text distributions, whose classes snapshots pickle.
+    """
+    try:
+        from importlib.metadata import distributions
+        installed = [(dist.metadata['Name'], dist.version) for dist in distributions()]
+    except ImportError:
+        from pkg_resources import working_set
+        installed = [(dist.project_name, dist.version) for dist in working_set]
+
+    names = ((str(name).lower().replace('_', '-'), version) for name, version in installed if name)
+    return {name: version for name, version in names if name.startswith('recognizers-text')}
+
 
 class ModelFactory(Generic[T_MODEL_OPTIONS]):
     __fallback_to_default_culture = Culture.English
-    __cache: Dict[CacheKey, Model] = dict()
+    # Shared by every recognizer, ordered from least to most recently used
+    __cache: Dict[CacheKey, Model] = OrderedDict()
+    __cache_lock = RLock()
+    __build_locks: Dict[CacheKey, Lock] = dict()
+    __max_cache_size: Optional[int] = None
+    __stats = {'hits': 0, 'misses': 0, 'builds': 0, 'build_time': 0.0, 'evictions': 0}
 
     def __init__(self):
         self.model_factories: Dict[ModelCtorKey,
                                    Callable[[T_MODEL_OPTIONS], Model]] = dict()
+        self.culture_registrars: Dict[str, Callable[[], None]] = dict()
+        self.__registration_lock = RLock()
 
     def get_model(self, model_type_name: str, culture: str, fallback_to_default_culture: bool, options: T_MODEL_OPTIONS) -> Model:
         result = self.try_get_model(model_type_name, culture, options)
@@ -90,31 +150,183 @@ class ModelFactory(Generic[T_MODEL_OPTIONS]):
             raise ValueError
         self.model_factories[key] = model_ctor
 
+    def register_culture(self, culture: str, registrar: Callable[[], None]):
+        """
+        Defers the registration of the models of a culture to the first time one of them is requested,
+        so the registrar can import the culture specific modules only then.
+        """
+        self.culture_registrars[culture] = registrar
+
+    def __register_culture(self, culture: Optional[str]):
+        if culture is None or culture in self.culture_registrars:
+            with self.__registration_lock:
+                for key in [culture] if culture is not None else list(self.culture_registrars):
+                    registrar = self.culture_registrars.get(key)
+                    if registrar is not None:
+                        registrar()
+                        # Removed once done, so concurrent callers wait for the registration above
+                        del self.culture_registrars[key]
+
     def try_get_model(self, model_type_name: str, culture: str, options: T_MODEL_OPTIONS) -> Optional[Model]:
         cache_result = self.get_model_from_cache(
             model_type_name, culture, options)
         if cache_result is not None:
             return cache_result
+        self.__register_culture(culture)
         key = ModelCtorKey(model_type=model_type_name, culture=culture)
         model_ctor = self.model_factories.get(key, None)
         if model_ctor is not None:
-            model = model_ctor(options)
-            self.register_model_in_cache(
-                model_type_name, culture, options, model)
-            return model
+            return self.__build_model(model_type_name, culture, options, model_ctor)
         return None
 
+    def __build_model(self, model_type_name: str, culture: str, options: T_MODEL_OPTIONS,
+                      model_ctor: Callable[[T_MODEL_OPTIONS], Model]) -> Model:
+        key = CacheKey(model_type=model_type_name,
+                       culture=culture, options=options)
+
+        with ModelFactory.__cache_lock:
+            ModelFactory.__stats['misses'] += 1
+            build_lock = ModelFactory.__build_locks.setdefault(key, Lock())
+
+        # Single flight: concurrent callers asking for the same cold model wait for one build
+        with build_lock:
+            with ModelFactory.__cache_lock:
+                model = ModelFactory.__cache.get(key, None)
+
+            if model is None:
+                start = time.perf_counter()
+                model = model_ctor(options)
+                with ModelFactory.__cache_lock:
+                    ModelFactory.__stats['builds'] += 1
+                    ModelFactory.__stats['build_time'] += time.perf_counter() - start
+                self.register_model_in_cache(
+                    model_type_name, culture, options, model)
+
+        with ModelFactory.__cache_lock:
+            if ModelFactory.__build_locks.get(key) is build_lock:
+                del ModelFactory.__build_locks[key]
+
+        return model
+
     def get_model_from_cache(self, model_type_name: str, culture: str, options: T_MODEL_OPTIONS) -> Model:
         key = CacheKey(model_type=model_type_name,
                        culture=culture, options=options)
-        return ModelFactory.__cache.get(key, None)
+        with ModelFactory.__cache_lock:
+            model = ModelFactory.__cache.get(key, None)
+            if model is not None:
+                ModelFactory.__cache.move_to_end(key)
+                ModelFactory.__stats['hits'] += 1
+        return model
 
     def register_model_in_cache(self, model_type_name: str, culture: str, options: T_MODEL_OPTIONS, model: Model):
         key = CacheKey(model_type=model_type_name,
                        culture=culture, options=options)
-        ModelFactory.__cache[key] = model
+        with ModelFactory.__cache_lock:
+            ModelFactory.__cache[key] = model
+            ModelFactory.__cache.move_to_end(key)
+            ModelFactory.__evict()
+
+    @staticmethod
+    def __evict():
+        max_size = ModelFactory.__max_cache_size
+        while max_size is not None and len(ModelFactory.__cache) > max_size:
+            ModelFactory.__cache.popitem(last=False)
+            ModelFactory.__stats['evictions'] += 1
+
+    @staticmethod
+    def set_max_cache_size(max_size: Optional[int]):
+        """
+        Bounds the number of cached models, evicting the least recently used ones beyond it.
+        None (the default) keeps every model built.
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError('max_size must be greater than zero')
+        with ModelFactory.__cache_lock:
+            ModelFactory.__max_cache_size = max_size
+            ModelFactory.__evict()
+
+    @staticmethod
+    def cache_stats() -> Dict[str, Any]:
+        """
+        Returns the cache hits, misses, model builds and their total time in seconds,
+        evictions, and the current and maximum cache size.
+        """
+        with ModelFactory.__cache_lock:
+            return dict(ModelFactory.__stats, size=len(ModelFactory.__cache),
+                        max_size=ModelFactory.__max_cache_size)
+
+    @staticmethod
+    def save_snapshot(path: str, cultures: Iterable[str] = None) -> int:
+        """
+        Pickles the built models of the given cultures (all cached models if None) to path.
+        Patterns are stored as their source, together with the list of those compiled so far,
+        so loading can either compile them again up front or leave them to their first use.
+        The header records the Python and recognizers-text package versions, which loading requires.
+        Returns the number of models saved.
+        """
+        cultures = None if cultures is None else set(cultures)
+        with ModelFactory.__cache_lock:
+            models = {key: model for key, model in ModelFactory.__cache.items()
+                      if cultures is None or key.culture in cultures}
+        header = {
+            'format': SNAPSHOT_FORMAT_VERSION,
+            'python': list(sys.version_info[:2]),
+            'packages': _package_versions(),
+            'cultures': sorted({key.culture for key in models})
+        }
+
+        with open(path, 'wb') as file:
+            pickle.dump(header, file, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(models, file, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(PatternRegistry.export_manifest(), file, pickle.HIGHEST_PROTOCOL)
+
+        return len(models)
+
+    @staticmethod
+    def load_snapshot(path: str, cultures: Iterable[str] = None, compile_patterns: bool = False) -> int:
+        """
+        Restores the models saved by save_snapshot into the cache, so recognizers skip building them.
+        With compile_patterns, the patterns that were compiled when the snapshot was saved are compiled right away.
+        Raises ValueError if the snapshot was written by another format, Python or package version, or lacks
+        one of the requested cultures. Returns the number of models restored, which excludes those already cached.
+
+        Snapshots are unpickled, which can run arbitrary code: only load those from a trusted source.
+        """
+        cultures = None if cultures is None else set(cultures)
+
+        with open(path, 'rb') as file:
+            header = pickle.load(file)
+
+            if not isinstance(header, dict) or header.get('format') != SNAPSHOT_FORMAT_VERSION:
+                raise ValueError(f'Unsupported model snapshot format in {path}')
+            if header['python'] != list(sys.version_info[:2]):
+                raise ValueError(f'Model snapshot {path} was written by Python '
+                                 f'{".".join(map(str, header["python"]))}')
+            if header['packages'] != _package_versions():
+                versions = ', '.join(f'{name} {version}' for name, version in sorted(header['packages'].items()))
+                raise ValueError(f'Model snapshot {path} was written by other package versions: {versions}')
+            missing = set(cultures or ()) - set(header['cultures'])
+            if missing:
+                raise ValueError(f'Model snapshot {path} has no models for: {", ".join(sorted(missing))}')
+
+            models: Dict[CacheKey, Model] = pickle.load(file)
+            patterns = pickle.load(file)
+
+        restored = 0
+        with ModelFactory.__cache_lock:
+            for key, model in models.items():
+                if (cultures is None or key.culture in cultures) and key not in ModelFactory.__cache:
+                    ModelFactory.__cache[key] = model
+                    restored += 1
+            ModelFactory.__evict()
+
+        if compile_patterns:
+            PatternRegistry.preload(patterns)
+
+        return restored
 
     def initialize_models(self, target_culture: str, options: T_MODEL_OPTIONS):
+        self.__register_culture(target_culture)
         for key in self.model_factories:
-            if target_culture is None or target_culture is key.culture:
+            if target_culture is None or target_culture == key.culture:
                 self.try_get_model(key.model_type, key.culture, options)
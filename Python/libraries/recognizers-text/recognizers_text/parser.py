@@ -3,10 +3,12 @@
 
 from abc import ABC, abstractmethod
 from typing import Optional
-from .extractor import ExtractResult
+from .extractor import ExtractResult, _copy_value
 
 
 class ParseResult(ExtractResult):
+    __slots__ = ('value', 'resolution_str')
+
     def __init__(self, source: ExtractResult = None):
         super().__init__()
         self.value: object = None
@@ -18,6 +20,11 @@ class ParseResult(ExtractResult):
             self.type = source.type
             self.data = source.data
 
+    def _copy_to(self, result):
+        super()._copy_to(result)
+        result.value = _copy_value(self.value)
+        result.resolution_str = self.resolution_str
+
 
 class Parser(ABC):
     @abstractmethod
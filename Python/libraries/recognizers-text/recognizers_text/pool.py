@@ -0,0 +1,98 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import multiprocessing
+import os
+from collections import deque
+from itertools import count, islice
+from typing import List, Iterable, Iterator, Dict
+
+from .model import Model, ModelResult
+from .recognizer import Recognizer
+
+# Models are published here before the workers are forked, so every worker
+# inherits the already built graph (copy-on-write) instead of rebuilding it.
+_pool_models: Dict[int, Model] = dict()
+_pool_ids = count()
+
+
+def _parse_chunk(pool_id: int, queries: List[str], reference, timeout_ms: float) -> List[List[ModelResult]]:
+    return _pool_models[pool_id].parse_batch(queries, reference, timeout_ms)
+
+
+class RecognizerPool:
+    """
+    Distributes recognition of many texts over a pool of forked worker processes.
+
+    The requested model is built (and all models of the recognizer's target culture warmed)
+    and parses the warmup queries in the parent process before forking, so the workers share
+    the model and the patterns it compiled instead of paying the construction cost again.
+    Results are returned in input order.
+    """
+    # Digits, separators and symbols most cultures use, so the warm-up gets past the prefilters
+    default_warmup = ('1 2.5 3,000 10:30 01/02/2018 $20 50% 4-5',)
+
+    def __init__(self, recognizer: Recognizer, model_type_name: str, culture: str = None,
+                 processes: int = None, chunk_size: int = 64, max_pending_chunks: int = None,
+                 fallback_to_default_culture: bool = True, warmup: Iterable[str] = None):
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be greater than zero')
+
+        recognizer.initialize_models()
+        self.model: Model = recognizer.get_model(model_type_name, culture, fallback_to_default_culture)
+        self.processes: int = (os.cpu_count() or 1) if processes is None else processes
+        self.chunk_size: int = chunk_size
+        self.max_pending_chunks: int = max_pending_chunks or self.processes * 2
+        self.__pool_id = next(_pool_ids)
+        self.__pool = None
+
+        # Without fork the workers would have to rebuild the models, so recognize in-process instead
+        if self.processes > 0 and 'fork' in multiprocessing.get_all_start_methods():
+            _pool_models[self.__pool_id] = self.model
+            # Patterns are compiled on their first use, which would otherwise happen in every worker
+            self.model.parse_batch(RecognizerPool.default_warmup if warmup is None else warmup)
+            self.__pool = multiprocessing.get_context('fork').Pool(self.processes)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def imap(self, queries: Iterable[str], reference=None, timeout_ms: float = None) -> Iterator[List[ModelResult]]:
+        """
+        Lazily yields the results of every query in input order, each query bounded by timeout_ms if given.
+        At most max_pending_chunks chunks are in flight at a time, so the input is consumed as results are read.
+        """
+        chunks = self.__chunks(queries)
+
+        if self.__pool is None:
+            for chunk in chunks:
+                yield from self.model.parse_batch(chunk, reference, timeout_ms)
+            return
+
+        pending = deque()
+        for chunk in chunks:
+            pending.append(self.__pool.apply_async(_parse_chunk, (self.__pool_id, chunk, reference, timeout_ms)))
+            if len(pending) >= self.max_pending_chunks:
+                yield from pending.popleft().get()
+
+        while pending:
+            yield from pending.popleft().get()
+
+    def map(self, queries: Iterable[str], reference=None, timeout_ms: float = None) -> List[List[ModelResult]]:
+        return list(self.imap(queries, reference, timeout_ms))
+
+    def close(self):
+        if self.__pool is not None:
+            self.__pool.close()
+            self.__pool.join()
+            self.__pool = None
+        _pool_models.pop(self.__pool_id, None)
+
+    def __chunks(self, queries: Iterable[str]) -> Iterator[List[str]]:
+        iterator = iter(queries)
+        chunk = list(islice(iterator, self.chunk_size))
+        while chunk:
+            yield chunk
+            chunk = list(islice(iterator, self.chunk_size))
@@ -0,0 +1,179 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, FrozenSet, Iterable, Optional, Pattern, Union
+import regex
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+DIGIT = '\\d'
+
+# The parser only knows the re syntax: named groups are written (?P<name>...) there
+_NAMED_GROUP = regex.compile(r'(?<!\\)((?:\\\\)*)\(\?<(?![=!])')
+# Unicode properties, read as word characters: like them, they never make a requirement
+_PROPERTY = regex.compile(r'(?<!\\)((?:\\\\)*)\\[pP]\{[^{}]*\}')
+# POSIX classes and fuzzy constraints, which the parser would read as literal characters
+_REGEX_ONLY_SYNTAX = regex.compile(r'\[:\w+:\]|\{[^{}]*[eids]\s*[<=}]')
+_PARSER_FLAGS = regex.I | regex.M | regex.S | regex.X | regex.U | regex.A
+_REPEATS = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, getattr(sre_constants, 'POSSESSIVE_REPEAT', None)}
+_MAX_RANGE = 64
+# Longer patterns are mostly lists of words, which only require letters: they aren't worth parsing
+_MAX_SOURCE_LENGTH = 2000
+
+
+def _weight(atom: str) -> int:
+    # Spaces and letters show up in almost every text, so they make poor requirements
+    if atom.isspace():
+        return 100
+    if atom == DIGIT or atom.isalpha():
+        return 10
+    return 1
+
+
+def _score(requirement: FrozenSet[str]) -> int:
+    return sum(_weight(atom) for atom in requirement)
+
+
+def _required_in(items) -> Optional[FrozenSet[str]]:
+    atoms = set()
+    for op, av in items:
+        if op == sre_constants.LITERAL:
+            atoms.add(chr(av))
+        elif op == sre_constants.RANGE and av[1] - av[0] < _MAX_RANGE:
+            atoms.update(chr(c) for c in range(av[0], av[1] + 1))
+        elif op == sre_constants.CATEGORY and av == sre_constants.CATEGORY_DIGIT:
+            atoms.add(DIGIT)
+        else:
+            return None
+    return frozenset(atoms) or None
+
+
+def _required(subpattern) -> Optional[FrozenSet[str]]:
+    """
+    Returns a set of characters one of which is in every match of subpattern, or None if there isn't a usable one.
+    Of the elements of a sequence, the one requiring the rarest characters is kept.
+    """
+    best = None
+    for op, av in subpattern:
+        requirement = None
+        if op == sre_constants.LITERAL:
+            requirement = frozenset([chr(av)])
+        elif op == sre_constants.IN:
+            requirement = _required_in(av)
+        elif op in _REPEATS:
+            if av[0] >= 1:
+                requirement = _required(av[2])
+        elif op == sre_constants.SUBPATTERN:
+            group, add_flags, del_flags, sub = av
+            # A local case change would make the requirement case sensitive where the pattern isn't, or the reverse
+            if not (add_flags | del_flags) & regex.I:
+                requirement = _required(sub)
+        elif op == getattr(sre_constants, 'ATOMIC_GROUP', None):
+            requirement = _required(av)
+        elif op == sre_constants.BRANCH:
+            branches = [_required(branch) for branch in av[1]]
+            if all(branches):
+                requirement = frozenset().union(*branches)
+
+        if requirement is not None and (best is None or _score(requirement) < _score(best)):
+            best = requirement
+
+    return best
+
+
+@lru_cache(maxsize=1024)
+def _required_characters(source: str, flags: int) -> Optional[FrozenSet[str]]:
+    if len(source) > _MAX_SOURCE_LENGTH:
+        return None
+
+    source = _PROPERTY.sub(r'\1\\w', _NAMED_GROUP.sub(r'\1(?P<', source))
+
+    # Full case folding matches some characters with sequences of others
+    if flags & (regex.FULLCASE | regex.VERSION1) or _REGEX_ONLY_SYNTAX.search(source):
+        return None
+
+    try:
+        parsed = sre_parse.parse(source, flags & _PARSER_FLAGS)
+    except Exception:
+        # Other regex only syntax, e.g. inline flags in the middle of the pattern
+        return None
+
+    if (parsed.state.flags ^ flags) & regex.I:
+        return None
+
+    return _required(parsed)
+
+
+def _character_class(requirement: FrozenSet[str]) -> str:
+    return '[' + ''.join(atom if atom == DIGIT else regex.escape(atom, special_only=False) for atom in sorted(requirement)) + ']'
+
+
+class Prefilter:
+    """
+    Tells whether a text may match any pattern of a set, with a single pass over the text.
+
+    For every pattern, a class of characters is derived such that each of its matches contains one of them,
+    e.g. a digit for phone numbers or '@' for emails. A text containing none of the characters of any pattern
+    can't match, so an extractor whose results all come from its patterns may skip it. When a pattern doesn't
+    require such characters, or uses syntax the derivation doesn't understand, the filter lets every text through.
+    """
+    __lock = Lock()
+    __stats: Dict[str, Dict[str, int]] = dict()
+
+    def __init__(self, patterns: Iterable[Union[str, Pattern]], name: str):
+        self.name = name
+        self.requirement: Optional[Pattern] = Prefilter.__build(patterns)
+
+        with Prefilter.__lock:
+            stats = Prefilter.__stats.setdefault(name, {'filters': 0, 'enabled': 0, 'checks': 0, 'skips': 0})
+            stats['filters'] += 1
+            stats['enabled'] += self.requirement is not None
+
+    @staticmethod
+    def __build(patterns: Iterable[Union[str, Pattern]]) -> Optional[Pattern]:
+        requirement: FrozenSet[str] = frozenset()
+        ignore_case = False
+
+        for pattern in patterns:
+            source, flags = (pattern, 0) if isinstance(pattern, str) else (pattern.pattern, pattern.flags)
+            characters = _required_characters(source, flags)
+            if characters is None:
+                return None
+            requirement |= characters
+            ignore_case |= bool(flags & regex.I)
+
+        if not requirement:
+            return None
+
+        return regex.compile(_character_class(requirement), regex.I if ignore_case else 0)
+
+    @property
+    def enabled(self) -> bool:
+        return self.requirement is not None
+
+    def may_match(self, source: str) -> bool:
+        if self.requirement is None:
+            return True
+
+        skip = self.requirement.search(source) is None
+        with Prefilter.__lock:
+            stats = Prefilter.__stats[self.name]
+            stats['checks'] += 1
+            stats['skips'] += skip
+
+        return not skip
+
+    @staticmethod
+    def stats() -> Dict[str, Dict[str, int]]:
+        """
+        Returns, per filter name, how many filters were built and could be derived, and how many texts they
+        checked and skipped.
+        """
+        with Prefilter.__lock:
+            return {name: dict(stats) for name, stats in Prefilter.__stats.items()}
@@ -0,0 +1,155 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import json
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple
+
+from .extractor import Extractor
+from .parser import Parser
+from .utilities import LazyPattern, PatternRegistry
+
+
+class ComponentStats:
+    def __init__(self):
+        self.calls: int = 0
+        self.total_time: float = 0.0
+        self.max_time: float = 0.0
+        self.total_length: int = 0
+        # Calls bucketed by duration: bucket b counts calls that took less than 2^b microseconds
+        self.histogram: Dict[int, int] = dict()
+
+    def add(self, elapsed: float, length: int):
+        self.calls += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.total_length += length
+        bucket = int(elapsed * 1e6).bit_length()
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def to_dict(self) -> Dict:
+        return {
+            'calls': self.calls,
+            'total_ms': self.total_time * 1000,
+            'mean_ms': self.total_time * 1000 / self.calls if self.calls else 0.0,
+            'max_ms': self.max_time * 1000,
+            'mean_length': self.total_length / self.calls if self.calls else 0.0,
+            'histogram_us': {f'<{2 ** bucket}': count for bucket, count in sorted(self.histogram.items())}
+        }
+
+
+def _input_length(value) -> int:
+    if isinstance(value, str):
+        return len(value)
+    text = getattr(value, 'text', None)
+    return len(text) if isinstance(text, str) else 0
+
+
+def _all_subclasses(cls) -> List[type]:
+    result = []
+    for subclass in cls.__subclasses__():
+        result.append(subclass)
+        result.extend(_all_subclasses(subclass))
+    return result
+
+
+class Profiler:
+    """
+    Records wall time, call counts and input length of every Extractor.extract and Parser.parse call,
+    and of every search/match/finditer... call on the patterns built through RegExpUtility, while active.
+
+    The methods are only wrapped inside the with block (or between enable and disable), so there is no
+    cost when profiling is off. Times are inclusive: a date period extraction includes the date extractions
+    it makes. Only the classes imported and the patterns created before enabling are instrumented.
+    A callback, if given, receives the component name, elapsed seconds and input length of every call.
+    """
+    __active_lock = Lock()
+    __active = None
+
+    def __init__(self, regexes: bool = True, callback: Callable[[str, float, int], None] = None):
+        self.regexes = regexes
+        self.callback = callback
+        self.stats: Dict[str, ComponentStats] = dict()
+        self.__lock = Lock()
+        self.__patched_methods: List[Tuple[type, str, Callable]] = list()
+        self.__patched_patterns: List[Tuple[LazyPattern, str]] = list()
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disable()
+
+    def enable(self):
+        with Profiler.__active_lock:
+            if Profiler.__active is not None:
+                raise RuntimeError('Another Profiler is already active')
+            Profiler.__active = self
+
+        for base, method_name in [(Extractor, 'extract'), (Parser, 'parse')]:
+            for cls in _all_subclasses(base):
+                method = cls.__dict__.get(method_name)
+                if callable(method) and not getattr(method, '__isabstractmethod__', False):
+                    setattr(cls, method_name, self.__wrap(method, f'{cls.__qualname__}.{method_name}', 1))
+                    self.__patched_methods.append((cls, method_name, method))
+
+        if self.regexes:
+            for pattern in PatternRegistry.patterns():
+                for name in LazyPattern._delegated_methods:
+                    method = getattr(LazyPattern, name).__get__(pattern)
+                    setattr(pattern, name, self.__wrap(method, f'regex {pattern.pattern}', 0))
+                    self.__patched_patterns.append((pattern, name))
+
+    def disable(self):
+        for cls, method_name, method in reversed(self.__patched_methods):
+            setattr(cls, method_name, method)
+        for pattern, name in self.__patched_patterns:
+            del pattern.__dict__[name]
+        self.__patched_methods.clear()
+        self.__patched_patterns.clear()
+
+        with Profiler.__active_lock:
+            if Profiler.__active is self:
+                Profiler.__active = None
+
+    def report(self, top: int = 20) -> str:
+        """
+        Returns a table of the components with the most total time.
+        """
+        rows = sorted(self.stats.items(), key=lambda item: item[1].total_time, reverse=True)[:top]
+        lines = [f'{"total ms":>10} {"calls":>8} {"mean ms":>9} {"max ms":>9}  component']
+        for name, stats in rows:
+            lines.append(f'{stats.total_time * 1000:>10.2f} {stats.calls:>8} '
+                         f'{stats.total_time * 1000 / stats.calls:>9.3f} {stats.max_time * 1000:>9.3f}  {name[:100]}')
+        return '\n'.join(lines)
+
+    def to_dict(self) -> Dict[str, Dict]:
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
+
+    def dump(self, path: str):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def __record(self, name: str, elapsed: float, length: int):
+        with self.__lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = ComponentStats()
+            stats.add(elapsed, length)
+
+        if self.callback is not None:
+            self.callback(name, elapsed, length)
+
+    def __wrap(self, function: Callable, name: str, input_index: int) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                length = _input_length(args[input_index]) if len(args) > input_index else 0
+                self.__record(name, perf_counter() - start, length)
+        return wrapper
@@ -31,5 +31,8 @@ class Recognizer(Generic[T_MODEL_OPTIONS], ABC):
     def register_model(self, model_type_name: str, culture: str, model_ctor: Callable[[T_MODEL_OPTIONS], Model]):
         self.model_factory.register_model(model_type_name, culture, model_ctor)
 
+    def register_culture(self, culture: str, registrar: Callable[[], None]):
+        self.model_factory.register_culture(culture, registrar)
+
     def initialize_models(self):
         self.model_factory.initialize_models(self.target_culture, self.options)
@@ -0,0 +1,237 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import inspect
+import os
+import pickle
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .model import Model, ModelResult
+from .utilities import QueryProcessor, TimeBudget
+
+
+class CacheBackend(ABC):
+    """
+    Stores model results by key. Backends may return the stored objects themselves:
+    CachedModel copies results on their way in and out.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[List[ModelResult]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, results: List[ModelResult]):
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self):
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        return dict()
+
+
+class LruCacheBackend(CacheBackend):
+    """
+    Keeps up to max_size entries in memory, evicting the least recently used ones.
+    With a ttl in seconds, entries older than it are dropped when looked up.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = None):
+        if max_size < 1:
+            raise ValueError('max_size must be greater than zero')
+        self.max_size = max_size
+        self.ttl = ttl
+        self.__entries: Dict[str, Tuple[float, List[ModelResult]]] = OrderedDict()
+        self.__lock = Lock()
+        self.__evictions = 0
+        self.__expirations = 0
+
+    def get(self, key: str) -> Optional[List[ModelResult]]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            if self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                del self.__entries[key]
+                self.__expirations += 1
+                return None
+            self.__entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, results: List[ModelResult]):
+        with self.__lock:
+            self.__entries[key] = (time.monotonic(), results)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+                self.__evictions += 1
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self.__lock:
+            return {'size': len(self.__entries), 'max_size': self.max_size,
+                    'evictions': self.__evictions, 'expirations': self.__expirations}
+
+
+class SqliteCacheBackend(CacheBackend):
+    """
+    Keeps up to max_size pickled entries in a SQLite file, so processes on the same machine
+    share their results. Least recently used entries are evicted, and with a ttl in seconds,
+    entries older than it are dropped when looked up.
+    """
+
+    def __init__(self, path: str, max_size: int = 100000, ttl: float = None):
+        if max_size < 1:
+            raise ValueError('max_size must be greater than zero')
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self.__lock = Lock()
+        self.__connection = None
+        self.__pid = None
+        self.__evictions = 0
+        self.__expirations = 0
+
+    def __connect(self) -> sqlite3.Connection:
+        # A connection can't be used by a forked child, which opens its own
+        if self.__connection is None or self.__pid != os.getpid():
+            self.__connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            self.__connection.execute('CREATE TABLE IF NOT EXISTS results '
+                                      '(key TEXT PRIMARY KEY, value BLOB, created REAL, used REAL)')
+            self.__connection.execute('CREATE INDEX IF NOT EXISTS results_used ON results (used)')
+            self.__pid = os.getpid()
+        return self.__connection
+
+    def get(self, key: str) -> Optional[List[ModelResult]]:
+        now = time.time()
+        with self.__lock:
+            connection = self.__connect()
+            row = connection.execute('SELECT value, created FROM results WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            if self.ttl is not None and now - row[1] > self.ttl:
+                connection.execute('DELETE FROM results WHERE key = ?', (key,))
+                self.__expirations += 1
+                return None
+            connection.execute('UPDATE results SET used = ? WHERE key = ?', (now, key))
+        return pickle.loads(row[0])
+
+    def set(self, key: str, results: List[ModelResult]):
+        value = pickle.dumps(results, pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self.__lock:
+            connection = self.__connect()
+            connection.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)', (key, value, now, now))
+            excess = connection.execute('SELECT COUNT(*) FROM results').fetchone()[0] - self.max_size
+            if excess > 0:
+                connection.execute('DELETE FROM results WHERE key IN '
+                                   '(SELECT key FROM results ORDER BY used LIMIT ?)', (excess,))
+                self.__evictions += excess
+
+    def clear(self):
+        with self.__lock:
+            self.__connect().execute('DELETE FROM results')
+
+    def stats(self) -> Dict[str, Any]:
+        with self.__lock:
+            size = self.__connect().execute('SELECT COUNT(*) FROM results').fetchone()[0]
+            return {'size': size, 'max_size': self.max_size,
+                    'evictions': self.__evictions, 'expirations': self.__expirations}
+
+
+def fold_case(query: str) -> str:
+    """
+    Normalizes a query the way the models do before matching, so queries differing only in case share
+    a cache entry. The results then keep the text of the query that was parsed first.
+    """
+    return QueryProcessor.preprocess(query, True)
+
+
+class CachedModel(Model):
+    """
+    Returns the results of a model from a cache when it has parsed an equivalent query before.
+
+    Queries are keyed on their text, the model type, culture and options. normalize=fold_case keys them
+    on their lower cased text instead, so queries differing only in case share the results, and their
+    text, of the first one parsed. Models taking a reference date (the date time models) are only cached
+    with a reference_granularity: the reference, or the current time if none is given, is truncated to it
+    and the model parses with the truncated reference, so every query within the same e.g. hour or day
+    resolves the same way. Results are copied in and out of the cache, so callers may change them freely.
+    Calls whose time budget ran out aren't stored, as their results may be incomplete.
+    """
+
+    def __init__(self, model: Model, culture: str, options=None, backend: CacheBackend = None,
+                 reference_granularity: timedelta = None, normalize: Callable[[str], str] = str):
+        if reference_granularity is not None and reference_granularity <= timedelta(0):
+            raise ValueError('reference_granularity must be positive')
+        self.model = model
+        self.culture = culture
+        self.options = options
+        self.backend = backend if backend is not None else LruCacheBackend()
+        self.reference_granularity = reference_granularity
+        self.normalize = normalize
+        self.__takes_reference = 'reference' in inspect.signature(model.parse).parameters
+        self.__lock = Lock()
+        self.__stats = {'hits': 0, 'misses': 0, 'bypasses': 0, 'stores': 0}
+
+    @property
+    def model_type_name(self) -> str:
+        return self.model.model_type_name
+
+    def parse(self, query: str, reference: datetime = None, timeout_ms: float = None) -> List[ModelResult]:  # pylint: disable=W0221
+        kwargs, bucket = {}, ''
+        if self.__takes_reference:
+            if self.reference_granularity is None:
+                self.__count('bypasses')
+                return self.model.parse(query, reference, timeout_ms=timeout_ms)
+            reference = self.__truncate(reference or datetime.now())
+            bucket = reference.isoformat()
+            kwargs['reference'] = reference
+
+        key = repr((type(self.model).__qualname__, self.culture, str(self.options), bucket, self.normalize(query)))
+        cached = self.backend.get(key)
+        if cached is not None:
+            self.__count('hits')
+            return [result.copy() for result in cached]
+
+        self.__count('misses')
+        # The model parses within this call's budget, or the caller's, rather than opening its own,
+        # so only a timeout of this call skips the store
+        with TimeBudget(timeout_ms):
+            budget = TimeBudget.current()
+            results = self.model.parse(query, **kwargs)
+        if budget is None or not budget.timed_out:
+            self.backend.set(key, [result.copy() for result in results])
+            self.__count('stores')
+        return results
+
+    def __truncate(self, reference: datetime) -> datetime:
+        origin = datetime.min.replace(tzinfo=reference.tzinfo)
+        return reference - (reference - origin) % self.reference_granularity
+
+    def __count(self, name: str):
+        with self.__lock:
+            self.__stats[name] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the cache hits and misses, the hit rate, the calls that bypassed the cache,
+        the results stored, and the statistics of the backend.
+        """
+        with self.__lock:
+            stats = dict(self.__stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        stats.update(self.backend.stats())
+        return stats
@@ -0,0 +1,113 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from typing import Iterable, Iterator, TextIO, Union
+
+from .model import Model, ModelResult
+
+DEFAULT_MAX_ENTITY_LENGTH = 256
+# Models whose entities are shorter than the default, by model class. Spelled out numbers, and so
+# every model built on them, go up to about 170 characters in the Specs.
+MAX_ENTITY_LENGTHS = {
+    'DateTimeModel': 128,
+    'PhoneNumberModel': 64,
+    'IpAddressModel': 64,
+    'GUIDModel': 64,
+    'MentionModel': 64,
+    'HashtagModel': 64,
+}
+
+
+def default_max_entity_length(model: Model) -> int:
+    return MAX_ENTITY_LENGTHS.get(type(model).__name__, DEFAULT_MAX_ENTITY_LENGTH)
+
+
+class StreamingRecognizer:
+    """
+    Recognizes the entities of a model in a text read as a stream, e.g. a transcript or a log file.
+
+    The text is parsed in windows of window_size characters. Each window overlaps the previous one by
+    max_entity_length characters of left context, and leaves as much past the point where the next one
+    takes over, so an entity cut by a window end is found whole by one of them. Every entity is yielded
+    once, as soon as its window is parsed, with start and end in the whole text. Memory stays within a
+    window and a chunk of input, whatever the length of the text.
+    Entities longer than max_entity_length (by default the longest the model's Specs have) may be cut.
+    """
+
+    def __init__(self, model: Model, max_entity_length: int = None, window_size: int = None,
+                 chunk_size: int = 65536):
+        if max_entity_length is None:
+            max_entity_length = default_max_entity_length(model)
+        if max_entity_length < 1:
+            raise ValueError('max_entity_length must be greater than zero')
+        if window_size is None:
+            window_size = 16 * max_entity_length
+        # Leaves room for the left context, the right margin and the snapping to whitespace
+        if window_size < 4 * max_entity_length:
+            raise ValueError('window_size must be at least four times max_entity_length')
+
+        self.model = model
+        self.max_entity_length = max_entity_length
+        self.window_size = window_size
+        self.chunk_size = chunk_size
+
+    def parse_stream(self, stream: Union[TextIO, Iterable[str], str], **kwargs) -> Iterator[ModelResult]:
+        """
+        Lazily yields the entities of a file-like object, an iterable of text chunks or a string, ordered
+        by the window that found them. Other arguments, e.g. the reference of the datetime model, are
+        passed to the model.
+        """
+        chunks = self.__read(stream)
+        buffer = ''
+        # Offset in the whole text of buffer[0]
+        offset = 0
+        # Entities starting before it were decided by an earlier window
+        committed = 0
+        # End of the last entity yielded by an earlier window
+        previous_end = -1
+        exhausted = False
+
+        while True:
+            while not exhausted and len(buffer) < self.window_size:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                else:
+                    buffer += chunk
+
+            window = buffer[:self.window_size]
+            last = exhausted and len(buffer) <= self.window_size
+            cut = offset + (len(window) if last else len(window) - self.max_entity_length)
+            window_end = previous_end
+
+            for result in self.model.parse(window, **kwargs):
+                start = result.start + offset
+                # Found again from the left context, or to be found with more right context by the next window
+                if start < committed or start >= cut or start <= previous_end:
+                    continue
+                result.start = start
+                result.end += offset
+                window_end = max(window_end, result.end)
+                yield result
+
+            if last:
+                return
+
+            committed, previous_end = cut, window_end
+            start = self.__window_start(buffer, cut - offset - self.max_entity_length)
+            buffer = buffer[start:]
+            offset += start
+
+    def __window_start(self, buffer: str, position: int) -> int:
+        # Starting on a word boundary keeps the first word of the window whole
+        limit = max(position - self.max_entity_length, 0)
+        while position > limit and not buffer[position - 1].isspace():
+            position -= 1
+        return position
+
+    def __read(self, stream: Union[TextIO, Iterable[str], str]) -> Iterator[str]:
+        if isinstance(stream, str):
+            return iter([stream])
+        if hasattr(stream, 'read'):
+            return iter(lambda: stream.read(self.chunk_size), '')
+        return iter(stream)
@@ -1,9 +1,13 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
+import json
 import re
 import unicodedata
-from typing import Pattern, Union, List, Match, Dict
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter
+from typing import Pattern, Union, List, Match, Dict, Tuple, Iterable, Callable, Optional
 import regex
 from emoji import demojize
 from multipledispatch import dispatch
@@ -84,10 +88,361 @@ class ConditionalMatch:
         return self.match[0].groupdict().get(group, default_val) or default_val
 
 
+# Deadline (perf_counter seconds) of the extraction running in the current context, if it is time bounded
+_deadline: ContextVar = ContextVar('recognizers_text_deadline', default=None)
+# Whether the pattern calls of the current context release the GIL while they match
+_concurrent: ContextVar = ContextVar('recognizers_text_concurrent', default=None)
+
+
+def _timeout(timeout: Optional[float]) -> Optional[float]:
+    deadline = _deadline.get()
+    if deadline is None:
+        return timeout
+
+    remaining = deadline - perf_counter()
+    if remaining <= 0:
+        raise TimeoutError('regex timed out')
+
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+class TimeBudget:
+    """
+    Bounds the time a model call spends matching patterns.
+
+    Models open a budget around a call with `with TimeBudget(timeout_ms):`. Extractions run through
+    TimeBudget.run within it pass the time left as the timeout of every pattern call; when it runs out,
+    the extraction is abandoned and run returns its fallback, so the results found before it are kept.
+    Work outside TimeBudget.run, like merging and parsing the extracted spans, isn't bounded, and
+    neither are patterns compiled with regex directly rather than through RegExpUtility.get_safe_reg_exp.
+    A budget of None leaves the call unbounded. Budgets only apply to the context that opened them.
+    """
+    __current: ContextVar = ContextVar('recognizers_text_time_budget', default=None)
+    __lock = Lock()
+    __stats = {'budgets': 0, 'timeouts': 0}
+
+    def __init__(self, timeout_ms: Optional[float]):
+        self.timeout_ms = timeout_ms
+        self.deadline: Optional[float] = None
+        self.timed_out = False
+        self.__token = None
+
+    def __enter__(self):
+        if self.timeout_ms is not None:
+            self.deadline = perf_counter() + self.timeout_ms / 1000
+            self.__token = TimeBudget.__current.set(self)
+            with TimeBudget.__lock:
+                TimeBudget.__stats['budgets'] += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.__token is not None:
+            TimeBudget.__current.reset(self.__token)
+            self.__token = None
+
+    @staticmethod
+    def current() -> Optional['TimeBudget']:
+        return TimeBudget.__current.get()
+
+    @staticmethod
+    def run(function: Callable, *args, fallback=None):
+        """
+        Calls function with the deadline of the current budget, if any. Returns fallback if it times out.
+        """
+        budget = TimeBudget.__current.get()
+        if budget is None:
+            return function(*args)
+
+        token = _deadline.set(budget.deadline)
+        try:
+            return function(*args)
+        except TimeoutError:
+            budget.timed_out = True
+            with TimeBudget.__lock:
+                TimeBudget.__stats['timeouts'] += 1
+            return fallback
+        finally:
+            _deadline.reset(token)
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        """
+        Returns the number of budgets opened and of extractions abandoned when their budget ran out.
+        """
+        with TimeBudget.__lock:
+            return dict(TimeBudget.__stats)
+
+
+class ConcurrentMatching:
+    """
+    Makes the pattern calls within it, made through RegExpUtility.get_safe_reg_exp patterns, match with
+    `concurrent=True`, so the regex module releases the GIL and extractions on other threads run meanwhile.
+    Only the current context is affected: extractions submitted to threads need a copy of it.
+    """
+
+    def __init__(self):
+        self.__token = None
+
+    def __enter__(self):
+        self.__token = _concurrent.set(True)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _concurrent.reset(self.__token)
+        self.__token = None
+
+
+class LazyPattern:
+    """
+    Stands in for a compiled regex pattern and compiles it the first time it is used.
+
+    The proxy reports the regex Pattern type as its class, so it can be passed both to its own
+    methods and to the module level functions (regex.search(pattern, text) and the like).
+    Inside TimeBudget.run, every matching call is given the time left in the budget as its timeout,
+    and within ConcurrentMatching, it matches concurrently unless told otherwise.
+    """
+    _delegated_methods = ('search', 'match', 'fullmatch', 'finditer', 'findall', 'sub', 'subf',
+                          'subn', 'subfn', 'split', 'splititer', 'scanner')
+    __lock = Lock()
+
+    def __init__(self, source: str, flags: int):
+        self.pattern = source
+        self.__flags = flags
+        self.__compiled = None
+
+    @property
+    def __class__(self):
+        return regex.Pattern
+
+    @property
+    def compiled(self) -> Pattern:
+        compiled = self.__compiled
+        return self.compile() if compiled is None else compiled
+
+    def compile(self) -> Pattern:
+        """
+        Compiles the pattern unless it already is, and returns the compiled pattern.
+        """
+        with LazyPattern.__lock:
+            compiled = self.__compiled
+            if compiled is None:
+                compiled = regex.compile(self.pattern, flags=self.__flags)
+                self.__compiled = compiled
+
+        return compiled
+
+    @property
+    def is_compiled(self) -> bool:
+        return self.__compiled is not None
+
+    @property
+    def flags(self) -> int:
+        # The flags given at creation, known without compiling
+        return self.__flags
+
+    def search(self, string, pos=None, endpos=None, concurrent=None, partial=False, timeout=None):
+        timeout = _timeout(timeout)
+        if concurrent is None:
+            concurrent = _concurrent.get()
+        if timeout is None:
+            return self.compiled.search(string, pos, endpos, concurrent, partial)
+        return self.compiled.search(string, pos, endpos, concurrent, partial, timeout=timeout)
+
+    def match(self, string, pos=None, endpos=None, concurrent=None, partial=False, timeout=None):
+        timeout = _timeout(timeout)
+        if concurrent is None:
+            concurrent = _concurrent.get()
+        if timeout is None:
+            return self.compiled.match(string, pos, endpos, concurrent, partial)
+        return self.compiled.match(string, pos, endpos, concurrent, partial, timeout=timeout)
+
+    def fullmatch(self, string, pos=None, endpos=None, concurrent=None, partial=False, timeout=None):
+        timeout = _timeout(timeout)
+        if concurrent is None:
+            concurrent = _concurrent.get()
+        if timeout is None:
+            return self.compiled.fullmatch(string, pos, endpos, concurrent, partial)
+        return self.compiled.fullmatch(string, pos, endpos, concurrent, partial, timeout=timeout)
+
+    def finditer(self, string, pos=None, endpos=None, overlapped=False, concurrent=None, partial=False, timeout=None):
+        timeout = _timeout(timeout)
+        if concurrent is None:
+            concurrent = _concurrent.get()
+        if timeout is None:
+            return self.compiled.finditer(string, pos, endpos, overlapped, concurrent, partial)
+        return self.compiled.finditer(string, pos, endpos, overlapped, concurrent, partial, timeout=timeout)
+
+    def findall(self, string, pos=None, endpos=None, overlapped=False, concurrent=None, timeout=None):
+        timeout = _timeout(timeout)
+        if concurrent is None:
+            concurrent = _concurrent.get()
+        if timeout is None:
+            return self.compiled.findall(string, pos, endpos, overlapped, concurrent)
+        return self.compiled.findall(string, pos, endpos, overlapped, concurrent, timeout=timeout)
+
+    def sub(self, repl, string, count=0, pos=None, endpos=None, concurrent=None, timeout=None):
+        timeout = _timeout(timeout)
+        if concurrent is None:
+            concurrent = _concurrent.get()
+        if timeout is None:
+            return self.compiled.sub(repl, string, count, pos, endpos, concurrent)
+        return self.compiled.sub(repl, string, count, pos, endpos, concurrent, timeout=timeout)
+
+    def subf(self, format, string, count=0, pos=None, endpos=None, concurrent=None, timeout=None):
+        timeout = _timeout(timeout)
+        if concurrent is None:
+            concurrent = _concurrent.get()
+        if timeout is None:
+            return self.compiled.subf(format, string, count, pos, endpos, concurrent)
+        return self.compiled.subf(format, string, count, pos, endpos, concurrent, timeout=timeout)
+
+    def subn(self, repl, string, count=0, pos=None, endpos=None, concurrent=None, timeout=None):
+        timeout = _timeout(timeout)
+        if concurrent is None:
+            concurrent = _concurrent.get()
+        if timeout is None:
+            return self.compiled.subn(repl, string, count, pos, endpos, concurrent)
+        return self.compiled.subn(repl, string, count, pos, endpos, concurrent, timeout=timeout)
+
+    def subfn(self, format, string, count=0, pos=None, endpos=None, concurrent=None, timeout=None):
+        timeout = _timeout(timeout)
+        if concurrent is None:
+            concurrent = _concurrent.get()
+        if timeout is None:
+            return self.compiled.subfn(format, string, count, pos, endpos, concurrent)
+        return self.compiled.subfn(format, string, count, pos, endpos, concurrent, timeout=timeout)
+
+    def split(self, string, maxsplit=0, concurrent=None, timeout=None):
+        timeout = _timeout(timeout)
+        if concurrent is None:
+            concurrent = _concurrent.get()
+        if timeout is None:
+            return self.compiled.split(string, maxsplit, concurrent)
+        return self.compiled.split(string, maxsplit, concurrent, timeout=timeout)
+
+    def splititer(self, string, maxsplit=0, concurrent=None, timeout=None):
+        timeout = _timeout(timeout)
+        if concurrent is None:
+            concurrent = _concurrent.get()
+        if timeout is None:
+            return self.compiled.splititer(string, maxsplit, concurrent)
+        return self.compiled.splititer(string, maxsplit, concurrent, timeout=timeout)
+
+    def scanner(self, string, pos=None, endpos=None, overlapped=False, concurrent=None, partial=False, timeout=None):
+        timeout = _timeout(timeout)
+        if concurrent is None:
+            concurrent = _concurrent.get()
+        if timeout is None:
+            return self.compiled.scanner(string, pos, endpos, overlapped, concurrent, partial)
+        return self.compiled.scanner(string, pos, endpos, overlapped, concurrent, partial, timeout=timeout)
+
+    def __getattr__(self, name):
+        # Only reached for attributes the proxy doesn't hold itself (flags, groupindex, groups...)
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.compiled, name)
+
+    def __reduce__(self):
+        # Pickles as source and flags, so an unpickled pattern is interned and compiled lazily as well
+        return PatternRegistry.get, (self.pattern, self.__flags)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return 'LazyPattern({!r}, flags={!r})'.format(self.pattern, self.__flags)
+
+
+class PatternRegistry:
+    """
+    Process-wide registry of the patterns handed out by RegExpUtility.get_safe_reg_exp.
+
+    Patterns are interned by source and flags, so a definition shared by several extractors,
+    models or cultures is compiled and held in memory only once. A manifest of the patterns
+    compiled so far can be exported and used to preload the registry of another process.
+    """
+    __patterns: Dict[Tuple[str, int], LazyPattern] = dict()
+    __lock = Lock()
+    __hits = 0
+    __misses = 0
+
+    @staticmethod
+    def get(source: str, flags: int) -> LazyPattern:
+        key = (source, flags)
+
+        with PatternRegistry.__lock:
+            pattern = PatternRegistry.__patterns.get(key)
+            if pattern is None:
+                PatternRegistry.__misses += 1
+                pattern = LazyPattern(source, flags)
+                PatternRegistry.__patterns[key] = pattern
+            else:
+                PatternRegistry.__hits += 1
+
+        return pattern
+
+    @staticmethod
+    def patterns() -> List[LazyPattern]:
+        return list(PatternRegistry.__patterns.values())
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        patterns = PatternRegistry.patterns()
+        return {
+            'hits': PatternRegistry.__hits,
+            'misses': PatternRegistry.__misses,
+            'patterns': len(patterns),
+            'compiled': sum(1 for p in patterns if p.is_compiled)
+        }
+
+    @staticmethod
+    def export_manifest(path: str = None) -> List[List[Union[str, int]]]:
+        """
+        Returns the source and flags of every compiled pattern, and writes them as JSON to path if given.
+        """
+        manifest = [[source, flags] for (source, flags), pattern in list(PatternRegistry.__patterns.items())
+                    if pattern.is_compiled]
+
+        if path is not None:
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(manifest, file)
+
+        return manifest
+
+    @staticmethod
+    def preload(manifest: Union[str, Iterable]) -> int:
+        """
+        Compiles the patterns of a manifest, given as a list of (source, flags) pairs or the path
+        of a file written by export_manifest. Returns the number of patterns compiled.
+        """
+        if isinstance(manifest, str):
+            with open(manifest, encoding='utf-8') as file:
+                manifest = json.load(file)
+
+        compiled = 0
+        for source, flags in manifest:
+            pattern = PatternRegistry.get(source, flags)
+            if not pattern.is_compiled:
+                pattern.compile()
+                compiled += 1
+
+        return compiled
+
+    @staticmethod
+    def clear():
+        with PatternRegistry.__lock:
+            PatternRegistry.__patterns.clear()
+            PatternRegistry.__hits = 0
+            PatternRegistry.__misses = 0
+
+
 class RegExpUtility:
     @staticmethod
     def get_safe_reg_exp(source: str, flags: int = regex.I | regex.S) -> Pattern:
-        return regex.compile(source, flags=flags)
+        return PatternRegistry.get(source, flags)
 
     @staticmethod
     def get_group(match, group: str, default_val: str = '') -> str:
@@ -156,36 +511,20 @@ class RegExpUtility:
 
 
 class QueryProcessor:
+    # Full width digits and symbols, and the ideographic comma, recoded to their ASCII counterparts
+    recode_table = str.maketrans('０１２３４５６７８９：－，／ＧＭＴＫｋ．（）％、', '0123456789:-,/GMTKk.()%,')
+    recode_regex = re.compile('[' + ''.join(map(chr, recode_table)) + ']')
+
     @staticmethod
     def preprocess(source: str, case_sensitive: bool = False, recode: bool = True) -> str:
+        if isinstance(source, PreprocessedQuery):
+            return source.normalized(case_sensitive, recode)
 
         result: str = source
 
-        if recode:
-            result = result.replace('０', '0')
-            result = result.replace('１', '1')
-            result = result.replace('２', '2')
-            result = result.replace('３', '3')
-            result = result.replace('４', '4')
-            result = result.replace('５', '5')
-            result = result.replace('６', '6')
-            result = result.replace('７', '7')
-            result = result.replace('８', '8')
-            result = result.replace('９', '9')
-            result = result.replace('：', ':')
-            result = result.replace('－', '-')
-            result = result.replace('，', ',')
-            result = result.replace('／', '/')
-            result = result.replace('Ｇ', 'G')
-            result = result.replace('Ｍ', 'M')
-            result = result.replace('Ｔ', 'T')
-            result = result.replace('Ｋ', 'K')
-            result = result.replace('ｋ', 'k')
-            result = result.replace('．', '.')
-            result = result.replace('（', '(')
-            result = result.replace('）', ')')
-            result = result.replace('％', '%')
-            result = result.replace('、', ',')
+        # None of the recoded characters is ASCII, and translating is only worth it when one of them is found
+        if recode and not result.isascii() and QueryProcessor.recode_regex.search(result):
+            result = result.translate(QueryProcessor.recode_table)
 
         if not case_sensitive:
             result = result.lower()
@@ -201,14 +540,17 @@ class QueryProcessor:
     @staticmethod
     def to_lower_term_sensitive(input_str: str) -> str:
 
-        str_chars = list(input_str.lower())
+        result = input_str.lower()
+
+        # Every special token has one of these capitals
+        if 'B' not in input_str and 'K' not in input_str and 'M' not in input_str and 'G' not in input_str:
+            return result
 
-        matches = QueryProcessor.special_tokens_regex.finditer(input_str)
-        for match in matches:
-            QueryProcessor.apply_reverse(
-                match.start(), str_chars, match.group())
+        # Put the special tokens back in their original case
+        for match in QueryProcessor.special_tokens_regex.finditer(input_str):
+            result = result[:match.start()] + match.group() + result[match.end():]
 
-        return ''.join(str_chars)
+        return result
 
     @staticmethod
     def apply_reverse(idx: int, string_chars, value: str):
@@ -232,6 +574,45 @@ class QueryProcessor:
         return str(unicodedata.normalize('NFC', chars)).lower()
 
 
+class PreprocessedQuery(str):
+    """
+    A query that keeps its normalized forms, so the models parsing the same query normalize it only once.
+
+    It is the original query as a string, and QueryProcessor.preprocess returns its normalized forms
+    from a cache. to_original maps an index in a normalized form back to the original query: they differ
+    when lowercasing expands a character (e.g. 'İ').
+    """
+
+    def __new__(cls, query: str):
+        result = super().__new__(cls, query)
+        result.__normalized = dict()
+        result.__offsets = dict()
+        return result
+
+    def normalized(self, case_sensitive: bool = False, recode: bool = True) -> str:
+        key = (case_sensitive, recode)
+        result = self.__normalized.get(key)
+        if result is None:
+            result = self.__normalized.setdefault(key, QueryProcessor.preprocess(str(self), case_sensitive, recode))
+        return result
+
+    def to_original(self, index: int, case_sensitive: bool = False, recode: bool = True) -> int:
+        if len(self.normalized(case_sensitive, recode)) == len(self):
+            return index
+
+        key = (case_sensitive, recode)
+        offsets = self.__offsets.get(key)
+        if offsets is None:
+            # Recoding maps single characters, only lowercasing can change the length
+            offsets = [i for i, char in enumerate(self) for _ in char.lower()] + [len(self)]
+            self.__offsets[key] = offsets
+
+        return offsets[min(index, len(offsets) - 1)]
+
+    def __reduce__(self):
+        return PreprocessedQuery, (str(self),)
+
+
 class DefinitionLoader:
 
     @staticmethod
@@ -0,0 +1,66 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+"""
+Prebuilds the unit and time zone dictionaries matched with MatchStrategy.ArrayTrie into the resources/matchers
+directory of their package, where they are mapped at load time rather than tokenized and built again.
+
+    python matchers.py
+
+Run it once the resources are generated and the packages installed; the build and packaging scripts do. The files are
+not committed. A prebuilt file is named after the values of its dictionary, so it is left unused, not wrongly used,
+when they change until this script is run again.
+"""
+
+import glob
+import os
+import sys
+
+from recognizers_text import Culture
+from recognizers_text.matcher.array_trie import ArrayTrie
+from recognizers_number_with_unit import NumberWithUnitRecognizer
+from recognizers_date_time import DateTimeRecognizer
+import recognizers_number_with_unit.resources
+import recognizers_date_time.resources
+
+PACKAGES = [
+    (NumberWithUnitRecognizer, recognizers_number_with_unit.resources),
+    (DateTimeRecognizer, recognizers_date_time.resources),
+]
+
+
+class Startup:
+
+    def main(self, argv) -> int:
+        outputs = [os.path.join(os.path.dirname(resources.__file__), 'matchers') for _, resources in PACKAGES]
+
+        # Removed before anything is built, so no dictionary is read back from a previous run
+        for output in outputs:
+            os.makedirs(output, exist_ok=True)
+            for path in glob.glob(os.path.join(output, '*.bin')):
+                os.remove(path)
+
+        recognizers = []
+        saved = set()
+        for (recognizer_type, _), output in zip(PACKAGES, outputs):
+            for culture in Culture._get_supported_culture_codes():
+                try:
+                    # Kept, so the tries of their dictionaries stay shared until saved
+                    recognizers.append(recognizer_type(culture))
+                except Exception as ex:
+                    print(f'Error while building the { culture } models of { recognizer_type.__name__ }:', ex)
+
+            count = 0
+            for key, trie in ArrayTrie.shared_tries().items():
+                if key not in saved:
+                    trie.save(os.path.join(output, key + '.bin'))
+                    saved.add(key)
+                    count += 1
+            print(f'{ recognizer_type.__name__ } => { count } matchers in { os.path.relpath(output) }')
+
+        return 0
+
+
+if __name__ == '__main__':
+    app = Startup()
+    sys.exit(app.main(sys.argv))
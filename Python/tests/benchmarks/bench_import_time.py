@@ -0,0 +1,76 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+"""
+Measures the time to import each package, and to build the first model of a culture, in fresh interpreters.
+
+    python tests/benchmarks/bench_import_time.py --repeat 5
+    python tests/benchmarks/bench_import_time.py --package recognizers_suite --culture en-us zh-cn
+
+Every measure runs in its own process, so nothing is imported beforehand, and the median of the runs is
+reported together with the number of culture specific modules the import loaded.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+PACKAGES = ['recognizers_text', 'recognizers_number', 'recognizers_number_with_unit', 'recognizers_date_time',
+            'recognizers_sequence', 'recognizers_choice', 'recognizers_suite']
+
+CULTURE_MODULES = ['english', 'chinese', 'spanish', 'french', 'portuguese', 'german', 'italian', 'dutch', 'japanese']
+
+IMPORT_SCRIPT = '''
+import json, sys, time, warnings
+warnings.simplefilter('ignore')
+start = time.perf_counter()
+import {package}
+elapsed = time.perf_counter() - start
+cultures = [name for name in sys.modules if any(part.split('_')[0] in {cultures!r} for part in name.split('.'))]
+print(json.dumps({{'seconds': elapsed, 'culture_modules': len(cultures)}}))
+'''
+
+MODEL_SCRIPT = '''
+import json, time, warnings
+warnings.simplefilter('ignore')
+import recognizers_suite
+start = time.perf_counter()
+recognizers_suite.recognize_number('twelve', {culture!r})
+print(json.dumps({{'seconds': time.perf_counter() - start}}))
+'''
+
+
+def run(script: str) -> dict:
+    output = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure(script: str, repeat: int) -> dict:
+    runs = [run(script) for _ in range(repeat)]
+    result = dict(runs[0])
+    result['seconds'] = statistics.median(r['seconds'] for r in runs)
+    result['ms'] = result.pop('seconds') * 1000
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--package', nargs='+', default=PACKAGES, choices=PACKAGES)
+    parser.add_argument('--culture', nargs='*', default=['en-us'],
+                        help='cultures whose first number model build is timed after importing recognizers_suite')
+    parser.add_argument('--repeat', type=int, default=3, help='fresh interpreters per measure, the median is reported')
+    args = parser.parse_args()
+
+    report = {'python': sys.version.split()[0], 'repeat': args.repeat, 'imports': {}, 'first_number_model': {}}
+    for package in args.package:
+        report['imports'][package] = measure(IMPORT_SCRIPT.format(package=package, cultures=CULTURE_MODULES), args.repeat)
+    for culture in args.culture:
+        report['first_number_model'][culture] = measure(MODEL_SCRIPT.format(culture=culture), args.repeat)
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+"""
+Measures how RecognizerPool throughput scales with the number of worker processes.
+
+Run from the Python folder so the Specs corpus can be found:
+    python tests/benchmarks/bench_pool_scaling.py --model DateTimeModel --language English --processes 1 2 4
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from runner import SPECS, CULTURES  # noqa: E402
+from recognizers_text import RecognizerPool  # noqa: E402
+from recognizers_number import NumberRecognizer  # noqa: E402
+from recognizers_number_with_unit import NumberWithUnitRecognizer  # noqa: E402
+from recognizers_date_time import DateTimeRecognizer  # noqa: E402
+from recognizers_sequence import SequenceRecognizer  # noqa: E402
+
+RECOGNIZERS = {
+    'NumberModel': ('Number', NumberRecognizer),
+    'CurrencyModel': ('NumberWithUnit', NumberWithUnitRecognizer),
+    'DimensionModel': ('NumberWithUnit', NumberWithUnitRecognizer),
+    'DateTimeModel': ('DateTime', DateTimeRecognizer),
+    'PhoneNumberModel': ('Sequence', SequenceRecognizer),
+}
+
+
+def get_inputs(recognizer: str, language: str):
+    return [spec['Input'] for suite in SPECS
+            if suite['config']['recognizer'] == recognizer and suite['config']['language'] == language
+            for spec in suite['specs']]
+
+
+def measure(recognizer, model_type_name: str, queries, processes: int, chunk_size: int) -> float:
+    with RecognizerPool(recognizer, model_type_name, processes=processes, chunk_size=chunk_size) as pool:
+        start = time.perf_counter()
+        pool.map(queries)
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--model', default='DateTimeModel', choices=sorted(RECOGNIZERS))
+    parser.add_argument('--language', default='English', choices=sorted(CULTURES))
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--chunk-size', type=int, default=32)
+    parser.add_argument('--repeat', type=int, default=1, help='replay the corpus this many times')
+    args = parser.parse_args()
+
+    recognizer_name, recognizer_type = RECOGNIZERS[args.model]
+    queries = get_inputs(recognizer_name, args.language) * args.repeat
+    recognizer = recognizer_type(CULTURES[args.language])
+
+    baseline = measure(recognizer, args.model, queries, 0, args.chunk_size)
+    report = {'model': args.model, 'language': args.language, 'inputs': len(queries),
+              'cpu_count': os.cpu_count(), 'in_process_seconds': baseline, 'runs': []}
+
+    for processes in args.processes:
+        elapsed = measure(recognizer, args.model, queries, processes, args.chunk_size)
+        report['runs'].append({'processes': processes, 'seconds': elapsed,
+                               'throughput': len(queries) / elapsed, 'speedup': baseline / elapsed})
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
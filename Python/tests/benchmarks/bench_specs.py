@@ -0,0 +1,174 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+"""
+Replays the Specs corpus through every model and reports throughput, latency percentiles,
+cold start time and peak memory per recognizer, model and culture as JSON.
+
+Run from the Python folder so the Specs corpus can be found:
+    python tests/benchmarks/bench_specs.py --recognizer DateTime --language English --save-baseline baseline.json
+    python tests/benchmarks/bench_specs.py --recognizer DateTime --language English --baseline baseline.json
+
+When a baseline is given, the run fails with exit code 1 if a group's throughput drops or its p95
+latency grows by more than the tolerance. Groups run one after the other in the same process, so the
+cold start of a group doesn't include the components it shares with the groups measured before it.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from runner import get_specs, CULTURES  # noqa: E402
+import test_runner_choice  # noqa: E402
+import test_runner_datetime  # noqa: E402
+import test_runner_number  # noqa: E402
+import test_runner_number_with_unit  # noqa: E402
+import test_runner_sequence  # noqa: E402
+
+
+def recognize_datetime(culture, model, options, context, source):
+    return test_runner_datetime.get_results(culture, model, source, test_runner_datetime.get_option(options),
+                                            test_runner_datetime.get_reference_date(context))
+
+
+RECOGNIZERS = OrderedDict([
+    ('Number', lambda culture, model, options, context, source: test_runner_number.get_results(culture, model, source)),
+    ('NumberWithUnit', lambda culture, model, options, context, source:
+        test_runner_number_with_unit.get_results(culture, model, source)),
+    ('DateTime', recognize_datetime),
+    ('Sequence', lambda culture, model, options, context, source: test_runner_sequence.get_results(culture, model, source)),
+    ('Choice', lambda culture, model, options, context, source: test_runner_choice.get_results(culture, model, source)),
+])
+
+LANGUAGES = {culture: language for language, culture in CULTURES.items()}
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def collect_groups(recognizers, languages, models):
+    """
+    Groups the supported spec inputs by recognizer, model and culture, keeping their options and context.
+    """
+    groups = OrderedDict()
+    for recognizer in recognizers:
+        for param in get_specs(recognizer=recognizer, entity='Model'):
+            if any(mark.args and mark.args[0] for mark in param.marks):
+                continue
+            culture, model, options, context, source, _ = param.values
+            if (languages and LANGUAGES[culture] not in languages) or (models and model not in models):
+                continue
+            key = (recognizer, model, LANGUAGES[culture])
+            groups.setdefault(key, []).append((culture, model, options, context, source))
+    return groups
+
+
+def replay(recognize, inputs, latencies: list = None) -> int:
+    errors = 0
+    for spec_input in inputs:
+        start = time.perf_counter()
+        try:
+            recognize(*spec_input)
+        except Exception:
+            errors += 1
+        if latencies is not None:
+            latencies.append(time.perf_counter() - start)
+    return errors
+
+
+def measure_group(recognize, inputs, repeat: int, trace_memory: bool) -> dict:
+    if trace_memory:
+        tracemalloc.start()
+
+    # The first call builds the model and compiles the patterns it reaches
+    start = time.perf_counter()
+    errors = replay(recognize, inputs[:1])
+    cold_start = time.perf_counter() - start
+
+    result = {}
+    if trace_memory:
+        # Peak memory is taken over an untimed pass, as tracing slows every allocation down
+        replay(recognize, inputs)
+        result['peak_memory_mb'] = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+
+    latencies = []
+    for _ in range(repeat):
+        errors += replay(recognize, inputs, latencies)
+
+    total = sum(latencies)
+    latencies.sort()
+    result.update({
+        'inputs': len(inputs),
+        'calls': len(latencies),
+        'errors': errors,
+        'cold_start_ms': cold_start * 1000,
+        'throughput': len(latencies) / total if total else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+    })
+    return result
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    for name, result in report['groups'].items():
+        expected = baseline['groups'].get(name)
+        if expected is None:
+            continue
+        if result['throughput'] < expected['throughput'] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {result['throughput']:.1f}/s < baseline {expected['throughput']:.1f}/s")
+        if result['p95_ms'] > expected['p95_ms'] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {result['p95_ms']:.2f}ms > baseline {expected['p95_ms']:.2f}ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--recognizer', nargs='+', default=list(RECOGNIZERS), choices=list(RECOGNIZERS))
+    parser.add_argument('--language', nargs='+', choices=sorted(CULTURES))
+    parser.add_argument('--model', nargs='+', help='spec model names, e.g. Number, Currency, DateTime')
+    parser.add_argument('--repeat', type=int, default=3, help='replay every input this many times')
+    parser.add_argument('--no-memory', action='store_true', help='skip the traced pass measuring peak memory')
+    parser.add_argument('--save-baseline', metavar='PATH', help='write the report to PATH')
+    parser.add_argument('--baseline', metavar='PATH', help='compare against the report stored at PATH')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed relative regression (default 0.2)')
+    parser.add_argument('--output', metavar='PATH', help='write the report to PATH instead of stdout')
+    args = parser.parse_args()
+
+    groups = collect_groups(args.recognizer, args.language, args.model)
+    report = {'python': sys.version.split()[0], 'repeat': args.repeat, 'groups': OrderedDict()}
+
+    for (recognizer, model, language), inputs in groups.items():
+        result = measure_group(RECOGNIZERS[recognizer], inputs, args.repeat, not args.no_memory)
+        report['groups'][f'{recognizer}/{model}/{language}'] = result
+
+    output = json.dumps(report, indent=2)
+    for path in filter(None, [args.save_baseline, args.output]):
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(output)
+    if not args.output:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            regressions = compare(report, json.load(file), args.tolerance)
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+"""
+Compares the StringMatcher strategies on the English currency, dimension and time zone location dictionaries.
+
+    python tests/benchmarks/bench_string_matcher.py
+    python tests/benchmarks/bench_string_matcher.py --words 100 10000 --repeat 10
+
+Queries are made of random dictionary terms and filler words. Each strategy is timed on the tokens of the query
+(the search itself) and through StringMatcher.find (tokenizing included), and their matches are checked to be equal.
+The memory allocated to build each matcher is reported under the dictionary name.
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+import tracemalloc
+import warnings
+
+from recognizers_text.matcher.match_strategy import MatchStrategy
+from recognizers_text.matcher.number_with_unit_tokenizer import NumberWithUnitTokenizer
+from recognizers_text.matcher.string_matcher import StringMatcher
+from recognizers_text.utilities import QueryProcessor
+from recognizers_date_time.resources.english_time_zone import TimeZoneDefinitions
+from recognizers_number_with_unit.resources.english_numeric_with_unit import EnglishNumericWithUnit
+
+FILLER = 'the meeting is at five and we paid twenty for it in the morning so please call back later'.split()
+
+
+def dictionaries() -> dict:
+    def terms(definitions: dict) -> list:
+        return list(dict.fromkeys(term for value in definitions.values() for term in value.split('|') if term.strip()))
+
+    return {
+        'currency': terms(EnglishNumericWithUnit.CurrencySuffixList),
+        'dimension': terms({**EnglishNumericWithUnit.AreaSuffixList, **EnglishNumericWithUnit.InformationSuffixList,
+                            **EnglishNumericWithUnit.LengthSuffixList, **EnglishNumericWithUnit.SpeedSuffixList,
+                            **EnglishNumericWithUnit.VolumeSuffixList, **EnglishNumericWithUnit.WeightSuffixList,
+                            **EnglishNumericWithUnit.AngleSuffixList}),
+        'location': [QueryProcessor.remove_diacritics(location.lower()) for location in TimeZoneDefinitions.MajorLocations],
+    }
+
+
+def timed(function, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--words', nargs='+', type=int, default=[20, 200, 2000, 20000], help='query lengths in words')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per measure, the median is reported')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    report = {}
+    for name, terms in dictionaries().items():
+        matchers, memory = dict(), {'terms': len(terms)}
+        for strategy in MatchStrategy:
+            tracemalloc.start()
+            matchers[strategy] = StringMatcher(strategy, NumberWithUnitTokenizer())
+            matchers[strategy].init(list(terms))
+            memory[f'{strategy.name}_kb'] = tracemalloc.get_traced_memory()[0] / 1024
+            tracemalloc.stop()
+        report[name] = memory
+
+        words = FILLER + rng.sample(terms, min(len(terms), 50))
+        for count in args.words:
+            query = ' '.join(rng.choice(words) for _ in range(count))
+            tokens = [token.text for token in NumberWithUnitTokenizer().tokenize(query)]
+            row = {'terms': len(terms), 'tokens': len(tokens)}
+            matches = []
+            for strategy, matcher in matchers.items():
+                row[f'{strategy.name}_search_ms'] = timed(lambda: list(matcher.matcher.find(tokens)), args.repeat)
+                row[f'{strategy.name}_find_ms'] = timed(lambda: matcher.find(query), args.repeat)
+                matches.append([(m.start, m.length, m.canonical_values) for m in matcher.find(query)])
+            row['same_matches'] = all(result == matches[0] for result in matches)
+            row['search_speedup'] = row['TrieTree_search_ms'] / row['AcAutomaton_search_ms']
+            report[f'{name}/{count}'] = row
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    warnings.simplefilter('ignore')
+    main()
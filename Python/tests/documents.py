@@ -0,0 +1,13 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+SENTENCES = ['I bought {} apples for twenty five dollars.', 'The meeting moved to next friday at {}pm.',
+             'We sold one hundred and twelve thousand units.', 'Nothing happened on day {}.']
+
+
+def document(count: int) -> str:
+    return ' '.join(SENTENCES[i % len(SENTENCES)].format(i) for i in range(count))
+
+
+def summary(results):
+    return [(result.start, result.end, result.text, result.resolution) for result in results]
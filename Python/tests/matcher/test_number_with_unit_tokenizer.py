@@ -0,0 +1,32 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from recognizers_text.matcher.number_with_unit_tokenizer import NumberWithUnitTokenizer
+
+
+class TestNumberWithUnitTokenizer:
+
+    @staticmethod
+    def test_digits_are_split_from_units():
+        tokenizer = NumberWithUnitTokenizer()
+        text = 'paid us$5, 10km and 2.5m²'
+        tokenized_text = tokenizer.tokenize(text)
+
+        assert [t.text for t in tokenized_text] == ['paid', 'us$', '5', ',', '10', 'km', 'and', '2', '.', '5', 'm', '²']
+        assert [t.start for t in tokenized_text] == [0, 5, 8, 9, 11, 13, 16, 20, 21, 22, 23, 24]
+
+    @staticmethod
+    def test_non_splittable_units_stay_with_letters():
+        tokenizer = NumberWithUnitTokenizer()
+        text = '$$ 5$ c$d'
+        tokenized_text = tokenizer.tokenize(text)
+
+        assert [t.text for t in tokenized_text] == ['$$', '5', '$', 'c$d']
+
+    @staticmethod
+    def test_chinese_characters_are_tokens():
+        tokenizer = NumberWithUnitTokenizer()
+        text = '5美元'
+        tokenized_text = tokenizer.tokenize(text)
+
+        assert [t.text for t in tokenized_text] == ['5', '美', '元']
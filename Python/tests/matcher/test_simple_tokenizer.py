@@ -32,3 +32,12 @@ class TestSimpleTokenizer:
 
         assert 'Hello' == tokenized_text[0].text
         assert 11 == len(tokenized_text)
+
+    @staticmethod
+    def test_offsets_and_separators():
+        tokenizer = SimpleTokenizer()
+        text = 'a\u3000bc-12\t한국 😀'
+        tokenized_text = tokenizer.tokenize(text)
+
+        assert [(t.start, t.length, t.text) for t in tokenized_text] == \
+            [(0, 1, 'a'), (2, 2, 'bc'), (4, 1, '-'), (5, 2, '12'), (8, 1, '한'), (9, 1, '국'), (11, 1, '😀')]
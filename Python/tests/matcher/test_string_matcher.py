@@ -3,6 +3,9 @@
 
 from recognizers_text.matcher.string_matcher import StringMatcher
 from recognizers_text.matcher.match_result import MatchResult
+from recognizers_text.matcher.match_mode import MatchMode
+from recognizers_text.matcher.match_strategy import MatchStrategy
+import pytest
 
 
 class TestStringMatcher:
@@ -53,3 +56,31 @@ class TestStringMatcher:
             assert value == matches[0].text
             assert str(utc_2_value) == matches[0].canonical_values[0]
             assert 14 == matches[0].start
+
+    @staticmethod
+    @pytest.mark.parametrize('match_strategy', list(MatchStrategy))
+    def test_match_modes(match_strategy):
+        string_matcher = StringMatcher(match_strategy)
+        string_matcher.init(['new', 'new york', 'york city', 'york', 'city hall', 'hall'])
+        sentence = 'from new york city hall'
+
+        assert [m.text for m in string_matcher.find(sentence)] == \
+            ['new', 'new york', 'york', 'york city', 'city hall', 'hall']
+        assert [m.text for m in string_matcher.find(sentence, MatchMode.Maximal)] == ['new york', 'york city', 'city hall']
+        assert [m.text for m in string_matcher.find(sentence, MatchMode.LeftmostLongest)] == ['new york', 'city hall']
+
+    @staticmethod
+    def test_automaton_yields_matches_before_reading_the_whole_query():
+        string_matcher = StringMatcher(MatchStrategy.AcAutomaton)
+        string_matcher.init(['new york', 'city'])
+        read = []
+
+        def tokens():
+            for token in ['in', 'new', 'york', 'city', 'today', 'and', 'tomorrow']:
+                read.append(token)
+                yield token
+
+        first = next(iter(string_matcher.matcher.find(tokens())))
+
+        assert (first.start, first.length) == (1, 2)
+        assert len(read) < 7
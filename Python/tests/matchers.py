@@ -0,0 +1,25 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import json
+import os
+
+SPECS = os.path.join(os.path.dirname(__file__), '..', '..', 'Specs')
+
+
+def build(matcher_type, values):
+    matcher = matcher_type()
+    matcher.init(values, [''.join(value) for value in values])
+    return matcher
+
+
+def found(matcher, query):
+    return [(match.start, match.length, match.canonical_values) for match in matcher.find(query)]
+
+
+def specs_inputs(*paths):
+    inputs = []
+    for path in paths:
+        with open(os.path.join(SPECS, *path), encoding='utf-8-sig') as file:
+            inputs += [case['Input'] for case in json.load(file)]
+    return inputs
@@ -0,0 +1,52 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import random
+import pytest
+from recognizers_text.matcher.ac_automaton import AcAutomaton
+from recognizers_text.matcher.trie_tree import TrieTree
+from recognizers_text.matcher.match_strategy import MatchStrategy
+from recognizers_number_with_unit.number_with_unit.extractors import NumberWithUnitExtractor
+from recognizers_number_with_unit.number_with_unit.english.extractors import EnglishCurrencyExtractorConfiguration, \
+    EnglishDimensionExtractorConfiguration
+from recognizers_date_time.date_time.english.timezone_extractor_config import EnglishTimeZoneExtractorConfiguration
+from matchers import build, found, specs_inputs
+
+
+class TestAcAutomaton:
+    def test_overlapping_values_are_all_found(self):
+        values = [list('he'), list('she'), list('his'), list('hers')]
+
+        matches = found(build(AcAutomaton, values), list('ushers'))
+
+        assert matches == [(1, 3, ['she']), (2, 2, ['he']), (2, 4, ['hers'])]
+
+    def test_random_dictionaries_match_the_trie(self):
+        rng = random.Random(11)
+        for _ in range(200):
+            values = [[rng.choice('abc') for _ in range(rng.randint(1, 4))] for _ in range(rng.randint(1, 12))]
+            query = [rng.choice('abcd') for _ in range(rng.randint(0, 30))]
+
+            assert found(build(AcAutomaton, values), query) == found(build(TrieTree, values), query)
+
+    @pytest.mark.parametrize('config_type', [EnglishCurrencyExtractorConfiguration, EnglishDimensionExtractorConfiguration])
+    def test_unit_dictionaries_match_the_trie(self, config_type):
+        config = config_type()
+        automaton = NumberWithUnitExtractor(config, MatchStrategy.AcAutomaton)
+        trie = NumberWithUnitExtractor(config, MatchStrategy.TrieTree)
+
+        for query in specs_inputs(('NumberWithUnit', 'English', 'CurrencyModel.json'),
+                                  ('NumberWithUnit', 'English', 'DimensionModel.json')):
+            query = query.lower()
+            assert found(automaton.suffix_matcher, query) == found(trie.suffix_matcher, query)
+            assert found(automaton.prefix_matcher, query) == found(trie.prefix_matcher, query)
+
+    def test_time_zone_dictionaries_match_the_trie(self):
+        automaton = EnglishTimeZoneExtractorConfiguration(MatchStrategy.AcAutomaton)
+        trie = EnglishTimeZoneExtractorConfiguration(MatchStrategy.TrieTree)
+
+        for query in specs_inputs(('DateTime', 'English', 'TimeZoneExtractor.json'),
+                                  ('DateTime', 'English', 'DateTimeModel.json')):
+            query = query.lower()
+            assert found(automaton.timezone_matcher, query) == found(trie.timezone_matcher, query)
+            assert found(automaton.location_matcher, query) == found(trie.location_matcher, query)
@@ -0,0 +1,118 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import glob
+import os
+import pickle
+import random
+import pytest
+from recognizers_text import Culture
+from recognizers_text.matcher.array_trie import ArrayTrie
+from recognizers_text.matcher.trie_tree import TrieTree
+from recognizers_text.matcher.match_strategy import MatchStrategy
+from recognizers_text.matcher.string_matcher import StringMatcher
+from recognizers_number_with_unit.number_with_unit.extractors import NumberWithUnitExtractor
+from recognizers_number_with_unit.number_with_unit.english.extractors import EnglishCurrencyExtractorConfiguration
+from recognizers_date_time.date_time.english.timezone_extractor_config import EnglishTimeZoneExtractorConfiguration
+from recognizers_number_with_unit import NumberWithUnitRecognizer
+from recognizers_date_time import DateTimeRecognizer
+import recognizers_number_with_unit.resources
+import recognizers_date_time.resources
+from matchers import build, found, specs_inputs
+
+
+def prebuilt_keys():
+    directories = [os.path.join(os.path.dirname(resources.__file__), 'matchers')
+                   for resources in (recognizers_number_with_unit.resources, recognizers_date_time.resources)]
+    return {os.path.basename(path)[:-len('.bin')]
+            for directory in directories for path in glob.glob(os.path.join(directory, '*.bin'))}
+
+
+requires_prebuilt = pytest.mark.skipif(not prebuilt_keys(), reason='run libraries/resource-generator/matchers.py first')
+
+
+class TestArrayTrie:
+    def test_random_dictionaries_match_the_trie(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            values = [[rng.choice('abc') for _ in range(rng.randint(1, 4))] for _ in range(rng.randint(1, 12))]
+            query = [rng.choice('abcd') for _ in range(rng.randint(0, 30))]
+
+            assert found(build(ArrayTrie, values), query) == found(build(TrieTree, values), query)
+
+    def test_values_can_be_added_after_init(self):
+        trie = build(ArrayTrie, [['new', 'york']])
+        trie.init([['new'], ['new', 'york', 'city']], ['new', 'nyc'])
+
+        assert found(trie, ['new', 'york', 'city']) == [(0, 1, ['new']), (0, 2, ['newyork']), (0, 3, ['nyc'])]
+
+    def test_equal_dictionaries_share_one_trie(self):
+        first = StringMatcher(MatchStrategy.ArrayTrie)
+        first.init(['cape town', 'new york'])
+        second = StringMatcher(MatchStrategy.ArrayTrie)
+        second.init(['cape town', 'new york'])
+
+        assert first.matcher is second.matcher
+
+        second.init(['los angeles'])
+
+        assert first.matcher is not second.matcher
+        assert [m.text for m in first.find('los angeles to new york')] == ['new york']
+        assert [m.text for m in second.find('los angeles to new york')] == ['los angeles', 'new york']
+
+    def test_pickled_trie_finds_the_same_matches(self):
+        trie = build(ArrayTrie, [['new', 'york'], ['york']])
+
+        assert found(pickle.loads(pickle.dumps(trie)), ['new', 'york']) == found(trie, ['new', 'york'])
+
+    def test_saved_trie_is_mapped_with_the_same_matches(self, tmp_path):
+        trie = build(ArrayTrie, [['new', 'york'], ['york'], ['são', 'paulo']])
+        trie.save(str(tmp_path / 'trie.bin'))
+
+        loaded = ArrayTrie.load(str(tmp_path / 'trie.bin'))
+
+        assert isinstance(loaded.labels, memoryview)
+        assert found(loaded, ['new', 'york', 'são', 'paulo']) == found(trie, ['new', 'york', 'são', 'paulo'])
+        assert found(pickle.loads(pickle.dumps(loaded)), ['york']) == [(0, 1, ['york'])]
+
+    def test_other_formats_are_rejected(self):
+        data = bytearray(build(ArrayTrie, [['york']]).to_bytes())
+        data[4] += 1
+
+        with pytest.raises(ValueError):
+            ArrayTrie.from_buffer(bytes(data))
+
+    @requires_prebuilt
+    def test_unit_dictionaries_are_prebuilt(self):
+        extractor = NumberWithUnitExtractor(EnglishCurrencyExtractorConfiguration())
+
+        assert isinstance(extractor.suffix_matcher.matcher.labels, memoryview)
+        assert isinstance(extractor.prefix_matcher.matcher.labels, memoryview)
+
+    @requires_prebuilt
+    def test_prebuilt_dictionaries_are_current(self):
+        # Kept, so the tries of their dictionaries stay shared
+        recognizers = [recognizer_type(culture) for recognizer_type in (NumberWithUnitRecognizer, DateTimeRecognizer)
+                       for culture in Culture._get_supported_culture_codes()]
+
+        assert recognizers
+        assert prebuilt_keys() <= set(ArrayTrie.shared_tries()), 'run libraries/resource-generator/matchers.py again'
+
+    def test_currency_dictionary_matches_the_trie(self):
+        config = EnglishCurrencyExtractorConfiguration()
+        array_trie = NumberWithUnitExtractor(config, MatchStrategy.ArrayTrie)
+        trie = NumberWithUnitExtractor(config, MatchStrategy.TrieTree)
+
+        for query in specs_inputs(('NumberWithUnit', 'English', 'CurrencyModel.json')):
+            query = query.lower()
+            assert found(array_trie.suffix_matcher, query) == found(trie.suffix_matcher, query)
+            assert found(array_trie.prefix_matcher, query) == found(trie.prefix_matcher, query)
+
+    def test_time_zone_dictionaries_match_the_trie(self):
+        array_trie = EnglishTimeZoneExtractorConfiguration(MatchStrategy.ArrayTrie)
+        trie = EnglishTimeZoneExtractorConfiguration(MatchStrategy.TrieTree)
+
+        for query in specs_inputs(('DateTime', 'English', 'TimeZoneExtractor.json')):
+            query = query.lower()
+            assert found(array_trie.timezone_matcher, query) == found(trie.timezone_matcher, query)
+            assert found(array_trie.location_matcher, query) == found(trie.location_matcher, query)
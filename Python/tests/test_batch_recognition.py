@@ -0,0 +1,38 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from datetime import datetime
+import pytest
+from recognizers_suite import Culture, recognize_number, recognize_number_batch, recognize_currency, \
+    recognize_currency_batch, recognize_email, recognize_email_batch, recognize_datetime, recognize_datetime_batch
+
+
+class TestBatchRecognition:
+    queries = ['I will go back tomorrow at 5pm',
+               'it costs two hundred dollars',
+               'there is nothing to find here',
+               'send it to someone@example.com',
+               '']
+
+    @staticmethod
+    def to_dicts(results):
+        return [[r.get_dict() for r in result] for result in results]
+
+    @pytest.mark.parametrize('single, batch', [
+        (recognize_number, recognize_number_batch),
+        (recognize_currency, recognize_currency_batch),
+        (recognize_email, recognize_email_batch)])
+    def test_batch_results_match_single_calls(self, single, batch):
+        expected = [single(query, Culture.English) for query in self.queries]
+        actual = batch(self.queries, Culture.English)
+        assert self.to_dicts(actual) == self.to_dicts(expected)
+
+    def test_datetime_batch_uses_reference(self):
+        reference = datetime(2018, 1, 1)
+        expected = [recognize_datetime(query, Culture.English, reference=reference) for query in self.queries]
+        actual = recognize_datetime_batch(self.queries, Culture.English, reference=reference)
+        assert self.to_dicts(actual) == self.to_dicts(expected)
+
+    def test_batch_accepts_generators(self):
+        actual = recognize_number_batch((q for q in self.queries), Culture.English)
+        assert len(actual) == len(self.queries)
@@ -0,0 +1,74 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import gc
+import weakref
+from threading import Event, Thread
+from recognizers_text import Culture, ComponentRegistry
+from recognizers_number import EnglishIntegerExtractor, NumberMode
+from recognizers_number.number.english.extractors import EnglishNumberExtractor
+from recognizers_date_time import DateTimeRecognizer
+from recognizers_date_time.date_time.english.date_extractor_config import EnglishDateExtractorConfiguration
+from recognizers_number_with_unit import NumberWithUnitRecognizer
+
+
+class Component:
+    def __init__(self, *args):
+        self.args = args
+
+
+class TestComponentRegistry:
+    def test_same_arguments_return_same_instance(self):
+        assert ComponentRegistry.get_or_create(EnglishIntegerExtractor) is \
+            ComponentRegistry.get_or_create(EnglishIntegerExtractor)
+
+    def test_different_arguments_return_different_instances(self):
+        assert ComponentRegistry.get_or_create(EnglishNumberExtractor, NumberMode.DEFAULT) is not \
+            ComponentRegistry.get_or_create(EnglishNumberExtractor, NumberMode.Unit)
+
+    def test_default_arguments_are_part_of_the_key(self):
+        assert ComponentRegistry.get_or_create(EnglishDateExtractorConfiguration) is \
+            ComponentRegistry.get_or_create(EnglishDateExtractorConfiguration, False)
+        assert ComponentRegistry.get_or_create(EnglishDateExtractorConfiguration) is not \
+            ComponentRegistry.get_or_create(EnglishDateExtractorConfiguration, True)
+
+    def test_models_share_sub_extractors(self):
+        datetime_config = DateTimeRecognizer(Culture.English).get_datetime_model().extractor.config
+        age_config = NumberWithUnitRecognizer(Culture.English).get_age_model() \
+            .extractor_parser[0].parser.config
+
+        assert datetime_config.duration_extractor is datetime_config.date_period_extractor.config.duration_extractor
+        assert datetime_config.integer_extractor is ComponentRegistry.get_or_create(EnglishIntegerExtractor)
+        assert age_config.internal_number_extractor is \
+            ComponentRegistry.get_or_create(EnglishNumberExtractor, NumberMode.DEFAULT)
+
+    def test_clear_drops_components(self):
+        extractor = ComponentRegistry.get_or_create(EnglishIntegerExtractor)
+        ComponentRegistry.clear()
+        assert ComponentRegistry.get_or_create(EnglishIntegerExtractor) is not extractor
+
+    def test_unused_components_are_dropped(self):
+        component = weakref.ref(ComponentRegistry.get_or_create(Component, 'unused'))
+        gc.collect()
+
+        assert component() is None
+
+    def test_other_components_are_built_during_a_build(self):
+        started, release = Event(), Event()
+
+        def slow_component():
+            started.set()
+            release.wait(5)
+            return Component()
+
+        holder = []
+        thread = Thread(target=lambda: holder.append(ComponentRegistry.get_or_create(slow_component)))
+        thread.start()
+        started.wait(5)
+        try:
+            assert ComponentRegistry.get_or_create(Component, 'other').args == ('other',)
+            assert not holder
+        finally:
+            release.set()
+            thread.join()
+        assert holder
@@ -0,0 +1,31 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from datetime import datetime
+import pytest
+from recognizers_date_time import DateTimeOptions, BaseMergedExtractor, EnglishMergedExtractorConfiguration, \
+    SpanishMergedExtractorConfiguration
+from recognizers_date_time.date_time.chinese.merged_extractor import ChineseMergedExtractor
+
+REFERENCE = datetime(2016, 11, 7)
+
+
+def to_tuples(results):
+    return [(r.start, r.length, r.text, r.type) for r in results]
+
+
+@pytest.mark.parametrize('sequential, concurrent, source', [
+    (BaseMergedExtractor(EnglishMergedExtractorConfiguration(), DateTimeOptions.NONE),
+     BaseMergedExtractor(EnglishMergedExtractorConfiguration(), DateTimeOptions.NONE, True),
+     'I will leave from 4pm to 5pm tomorrow and come back every monday for two weeks on christmas'),
+    (BaseMergedExtractor(SpanishMergedExtractorConfiguration(), DateTimeOptions.NONE),
+     BaseMergedExtractor(SpanishMergedExtractorConfiguration(), DateTimeOptions.NONE, True),
+     'Volveré mañana a las 5 de la tarde durante dos horas'),
+    (ChineseMergedExtractor(DateTimeOptions.NONE),
+     ChineseMergedExtractor(DateTimeOptions.NONE, True),
+     '我明天下午三点到五点开会')])
+def test_concurrent_extraction_matches_sequential(sequential, concurrent, source):
+    expected = to_tuples(sequential.extract(source, REFERENCE))
+    assert expected
+    for _ in range(5):
+        assert to_tuples(concurrent.extract(source, REFERENCE)) == expected
@@ -0,0 +1,42 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from datetime import datetime
+from recognizers_text import Culture
+from recognizers_text.extractor import ExtractionContext
+from recognizers_date_time import DateTimeRecognizer
+
+
+class TestExtractionContext:
+    model = DateTimeRecognizer(Culture.English).get_datetime_model()
+    reference = datetime(2016, 11, 7)
+
+    def extract(self, source):
+        return [(r.start, r.length, r.text, r.type) for r in self.model.extractor.extract(source, self.reference)]
+
+    def test_memoized_results_match(self):
+        source = 'I will be out from next monday to friday for two weeks at 5pm every day'
+        expected = self.extract(source)
+
+        with ExtractionContext() as context:
+            assert self.extract(source) == expected
+            assert context.misses > 0
+            assert context.hits > 0
+
+    def test_callers_get_independent_copies(self):
+        source = 'see you tomorrow'
+        extractor = self.model.extractor.config.date_extractor
+
+        with ExtractionContext():
+            first = extractor.extract(source, self.reference)
+            first[0].text = 'modified'
+            second = extractor.extract(source, self.reference)
+
+        assert second[0].text == 'tomorrow'
+
+    def test_nested_context_reuses_outer_memo(self):
+        with ExtractionContext() as outer:
+            with ExtractionContext() as inner:
+                assert inner is outer
+            assert ExtractionContext.current() is outer
+        assert ExtractionContext.current() is None
@@ -0,0 +1,71 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import random
+from datetime import datetime
+import pytest
+from recognizers_text import Culture, IncrementalSession
+from recognizers_number import NumberRecognizer
+from recognizers_date_time import DateTimeRecognizer
+from documents import document, summary
+
+INSERTIONS = [' seven', ' and three', '5', ' tomorrow', 'x', ' hundred', ', ', ' on monday', '']
+
+
+class TestIncrementalSession:
+    @pytest.mark.parametrize('model, kwargs', [
+        (NumberRecognizer(Culture.English).get_number_model(), {}),
+        (DateTimeRecognizer(Culture.English).get_datetime_model(), {'reference': datetime(2016, 11, 7)}),
+    ])
+    def test_edits_match_parsing_the_whole_text(self, model, kwargs):
+        rng = random.Random(7)
+        text = document(24)
+        session = IncrementalSession(model, text, **kwargs)
+
+        for _ in range(12):
+            start = rng.randrange(len(text))
+            end = min(len(text), start + rng.choice([0, 1, 4]))
+            replacement = rng.choice(INSERTIONS)
+            text = text[:start] + replacement + text[end:]
+
+            results = session.edit(start, end, replacement)
+
+            assert session.text == text
+            assert summary(results) == summary(sorted(model.parse(text, **kwargs), key=lambda result: result.start))
+
+    def test_set_text_finds_the_edited_range(self):
+        model = NumberRecognizer(Culture.English).get_number_model()
+        session = IncrementalSession(model, 'I have two apples and three pears')
+
+        results = session.set_text('I have twenty two apples and three pears')
+
+        assert [result.text for result in results] == ['twenty two', 'three']
+        assert (results[1].start, results[1].end) == (29, 33)
+
+    def test_edit_cost_does_not_depend_on_the_text_length(self):
+        model = NumberRecognizer(Culture.English).get_number_model()
+        parsed = []
+
+        for count in (40, 400):
+            session = IncrementalSession(model, document(count), max_entity_length=64)
+            before = session.stats()['parsed_characters']
+            session.edit(100, 100, ' twelve ')
+            parsed.append(session.stats()['parsed_characters'] - before)
+
+        assert parsed[0] == parsed[1] < 500
+
+    def test_results_are_not_changed_by_later_edits(self):
+        model = NumberRecognizer(Culture.English).get_number_model()
+        session = IncrementalSession(model, 'one two three')
+        results = session.results
+
+        session.edit(0, 0, 'so ')
+
+        assert [result.start for result in results] == [0, 4, 8]
+        assert [result.start for result in session.results] == [3, 7, 11]
+
+    def test_invalid_range_raises(self):
+        session = IncrementalSession(NumberRecognizer(Culture.English).get_number_model(), 'one')
+
+        with pytest.raises(ValueError):
+            session.edit(2, 5, 'x')
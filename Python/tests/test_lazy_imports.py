@@ -0,0 +1,96 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import json
+import subprocess
+import sys
+from importlib import import_module
+import pytest
+from recognizers_text import Culture
+from recognizers_text.model import ModelFactory
+from recognizers_number import NumberOptions
+
+LOADED_CULTURES = '''
+import json, sys, warnings
+warnings.simplefilter('ignore')
+import recognizers_suite
+{statement}
+print(json.dumps(sorted({{part for name in sys.modules if name.startswith('recognizers_')
+                        for part in name.split('.') if part in ('spanish', 'chinese', 'french', 'german')}})))
+'''
+
+STAR_IMPORT = '''
+import json, warnings
+warnings.simplefilter('ignore')
+names = {{}}
+exec('from {package} import *', names)
+names.pop('__builtins__')
+print(json.dumps(sorted(names)))
+'''
+
+# Number of the names defined by the recognizers packages that were star-imported from each package
+# when it imported every culture eagerly
+EAGER_STAR_IMPORTS = {
+    'recognizers_number': 158, 'recognizers_number.number': 145, 'recognizers_number.resources': 20,
+    'recognizers_number_with_unit': 143, 'recognizers_number_with_unit.number_with_unit': 123,
+    'recognizers_number_with_unit.resources': 20, 'recognizers_date_time': 382, 'recognizers_date_time.date_time': 367,
+    'recognizers_date_time.resources': 20, 'recognizers_sequence': 117, 'recognizers_sequence.sequence': 116,
+    'recognizers_sequence.resources': 25
+}
+
+
+def loaded_cultures(statement: str = '') -> list:
+    output = subprocess.run([sys.executable, '-c', LOADED_CULTURES.format(statement=statement)],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestLazyImports:
+    def test_importing_the_suite_loads_no_other_culture(self):
+        assert loaded_cultures() == []
+
+    def test_first_model_loads_its_culture_only(self):
+        assert loaded_cultures("recognizers_suite.recognize_number('doce', recognizers_suite.Culture.Spanish)") == ['spanish']
+
+    def test_culture_names_are_still_exported(self):
+        from recognizers_number import ChineseNumberExtractor, SpanishNumeric
+        from recognizers_date_time import FrenchMergedExtractorConfiguration
+
+        assert ChineseNumberExtractor.__module__ == 'recognizers_number.number.chinese.extractors'
+        assert SpanishNumeric.__module__ == 'recognizers_number.resources.spanish_numeric'
+        assert FrenchMergedExtractorConfiguration.__name__ == 'FrenchMergedExtractorConfiguration'
+
+    @pytest.mark.parametrize('package, size', EAGER_STAR_IMPORTS.items())
+    def test_star_imports_keep_the_names_of_eager_imports(self, package, size):
+        # In a fresh interpreter, so no other import has loaded a module a name resolves to
+        output = subprocess.run([sys.executable, '-c', STAR_IMPORT.format(package=package)],
+                                check=True, capture_output=True, text=True).stdout
+        names = json.loads(output.strip().splitlines()[-1])
+
+        assert names == sorted(import_module(package).__all__)
+        assert len(names) >= size
+
+    def test_star_imports_resolve_culture_names(self):
+        names = {}
+        exec('from recognizers_number import *; from recognizers_number_with_unit import *; '
+             'from recognizers_date_time import *; from recognizers_sequence import *', names)
+
+        assert names['JapaneseNumberExtractor'].__module__ == 'recognizers_number.number.japanese.extractors'
+        assert names['DutchNumericWithUnit'].__module__ == 'recognizers_number_with_unit.resources.dutch_numeric_with_unit'
+        assert names['PortugueseMergedParserConfiguration'].__name__ == 'PortugueseMergedParserConfiguration'
+        assert names['ChineseIp'].__module__ == 'recognizers_sequence.resources.chinese_ip'
+
+    def test_culture_registration_is_deferred_to_the_first_request(self):
+        factory = ModelFactory()
+        registered = []
+
+        def register_culture():
+            registered.append(Culture.French)
+            factory.register_model('DeferredModel', Culture.French, lambda options: object())
+
+        factory.register_culture(Culture.French, register_culture)
+        assert registered == []
+
+        factory.get_model('DeferredModel', Culture.French, False, NumberOptions.NONE)
+        factory.get_model('DeferredModel', Culture.French, False, NumberOptions.NONE)
+        assert registered == [Culture.French]
@@ -0,0 +1,70 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import copy
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+import regex
+from recognizers_text.utilities import RegExpUtility, LazyPattern, ConcurrentMatching
+
+
+class TestLazyPattern:
+    source = r'(?<number>\d+)\s*(?<unit>km|mi)'
+
+    def test_compiles_on_first_use(self):
+        pattern = LazyPattern(self.source, regex.I | regex.S)
+        assert not pattern.is_compiled
+
+        assert pattern.search('drive 12 km').group('number') == '12'
+        assert pattern.is_compiled
+
+    def test_module_functions_accept_proxy(self):
+        pattern = RegExpUtility.get_safe_reg_exp(self.source)
+        expected = regex.compile(self.source, flags=regex.I | regex.S)
+        text = '3 KM then 4 mi'
+
+        assert isinstance(pattern, regex.Pattern)
+        assert regex.search(pattern, text).span() == expected.search(text).span()
+        assert [m.span() for m in regex.finditer(pattern, text)] == [m.span() for m in expected.finditer(text)]
+        assert regex.match(pattern, text, pos=0).group() == expected.match(text).group()
+        assert regex.sub(pattern, 'x', text) == expected.sub('x', text)
+        assert pattern.groupindex == expected.groupindex
+
+    def test_concurrent_first_use(self):
+        pattern = LazyPattern(self.source, regex.I | regex.S)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda text: pattern.search(text).group('unit'), ['1 km', '2 mi'] * 8))
+        assert results == ['km', 'mi'] * 8
+
+    def test_pickles_as_interned_source(self):
+        pattern = LazyPattern(r'(?<number>\d+)\s*pickled', regex.I | regex.S)
+        pattern.search('1 pickled')
+
+        restored = pickle.loads(pickle.dumps(pattern))
+        assert isinstance(restored, LazyPattern)
+        assert not restored.is_compiled
+        assert restored is RegExpUtility.get_safe_reg_exp(pattern.pattern)
+        assert restored.search('1 PICKLED').group('number') == '1'
+
+    def test_copies_share_proxy(self):
+        pattern = RegExpUtility.get_safe_reg_exp(self.source)
+        assert copy.copy(pattern) is pattern
+        assert copy.deepcopy(pattern) is pattern
+
+    def test_matches_concurrently_within_concurrent_matching(self):
+        calls = []
+
+        class RecordingPattern:
+            def search(self, string, pos, endpos, concurrent, partial):
+                calls.append(concurrent)
+
+        pattern = LazyPattern(self.source, regex.I | regex.S)
+        pattern._LazyPattern__compiled = RecordingPattern()
+
+        pattern.search('1 km')
+        with ConcurrentMatching():
+            pattern.search('1 km')
+            pattern.search('1 km', concurrent=False)
+        pattern.search('1 km')
+
+        assert calls == [None, True, False, None]
@@ -0,0 +1,71 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from recognizers_text import Culture
+from recognizers_text.model import ModelFactory
+from recognizers_number import NumberOptions
+
+
+class FakeModel:
+    def __init__(self, name):
+        self.name = name
+
+
+class TestModelFactoryCache:
+    def test_concurrent_cold_requests_build_once(self):
+        factory = ModelFactory()
+        builds = []
+
+        def build(options):
+            builds.append(options)
+            time.sleep(0.1)
+            return FakeModel('single-flight')
+
+        factory.register_model('SingleFlightModel', Culture.English, build)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            models = list(executor.map(
+                lambda _: factory.get_model('SingleFlightModel', Culture.English, False, NumberOptions.NONE), range(4)))
+
+        assert len(builds) == 1
+        assert all(model is models[0] for model in models)
+
+    def test_stats_count_hits_misses_and_builds(self):
+        factory = ModelFactory()
+        factory.register_model('StatsModel', Culture.English, lambda options: FakeModel('stats'))
+        before = ModelFactory.cache_stats()
+
+        factory.get_model('StatsModel', Culture.English, False, NumberOptions.NONE)
+        factory.get_model('StatsModel', Culture.English, False, NumberOptions.NONE)
+
+        after = ModelFactory.cache_stats()
+        assert after['misses'] - before['misses'] == 1
+        assert after['builds'] - before['builds'] == 1
+        assert after['hits'] - before['hits'] == 1
+        assert after['build_time'] >= before['build_time']
+
+    def test_bounded_cache_evicts_least_recently_used(self):
+        factory = ModelFactory()
+        for name in ['LruA', 'LruB', 'LruC']:
+            factory.register_model(name, Culture.English, lambda options, name=name: FakeModel(name))
+
+        try:
+            ModelFactory.set_max_cache_size(2)
+            first = factory.get_model('LruA', Culture.English, False, NumberOptions.NONE)
+            factory.get_model('LruB', Culture.English, False, NumberOptions.NONE)
+            factory.get_model('LruA', Culture.English, False, NumberOptions.NONE)
+            factory.get_model('LruC', Culture.English, False, NumberOptions.NONE)
+
+            assert factory.get_model_from_cache('LruA', Culture.English, NumberOptions.NONE) is first
+            assert factory.get_model_from_cache('LruB', Culture.English, NumberOptions.NONE) is None
+        finally:
+            ModelFactory.set_max_cache_size(None)
+
+    def test_initialize_models_matches_equal_culture_strings(self):
+        factory = ModelFactory()
+        factory.register_model('WarmModel', Culture.English, lambda options: FakeModel('warm'))
+
+        factory.initialize_models(''.join(['en', '-us']), NumberOptions.NONE)
+
+        assert factory.get_model_from_cache('WarmModel', Culture.English, NumberOptions.NONE) is not None
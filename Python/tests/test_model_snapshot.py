@@ -0,0 +1,70 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import pickle
+import pytest
+from recognizers_text import Culture
+from recognizers_text.model import ModelFactory
+from recognizers_number import NumberRecognizer
+
+
+class TestModelSnapshot:
+    query = 'I bought twelve apples and 3.5 kilos of pears'
+
+    @staticmethod
+    def results(model, query):
+        return [(r.start, r.end, r.text, r.type_name, r.resolution) for r in model.parse(query)]
+
+    def test_restored_model_matches_built_model(self, tmp_path):
+        path = str(tmp_path / 'models.snapshot')
+        model = NumberRecognizer(Culture.English).get_number_model()
+
+        assert ModelFactory.save_snapshot(path, [Culture.English]) > 0
+
+        with open(path, 'rb') as file:
+            header = pickle.load(file)
+            restored = pickle.load(file)
+
+        assert header['cultures'] == [Culture.English]
+        restored_model = next(m for key, m in restored.items() if key.model_type == 'NumberModel')
+        assert restored_model is not model
+        assert self.results(restored_model, self.query) == self.results(model, self.query)
+
+    def test_load_keeps_already_built_models(self, tmp_path):
+        path = str(tmp_path / 'models.snapshot')
+        model = NumberRecognizer(Culture.English).get_number_model()
+        ModelFactory.save_snapshot(path, [Culture.English])
+
+        assert ModelFactory.load_snapshot(path, [Culture.English], compile_patterns=True) == 0
+        assert NumberRecognizer(Culture.English).get_number_model() is model
+
+    def test_load_rejects_missing_culture(self, tmp_path):
+        path = str(tmp_path / 'models.snapshot')
+        NumberRecognizer(Culture.English).get_number_model()
+        ModelFactory.save_snapshot(path, [Culture.English])
+
+        with pytest.raises(ValueError):
+            ModelFactory.load_snapshot(path, [Culture.Japanese])
+
+    def test_load_rejects_other_format(self, tmp_path):
+        path = str(tmp_path / 'models.snapshot')
+        with open(path, 'wb') as file:
+            pickle.dump({'format': -1}, file)
+
+        with pytest.raises(ValueError):
+            ModelFactory.load_snapshot(path)
+
+    def test_load_rejects_other_package_versions(self, tmp_path):
+        path = str(tmp_path / 'models.snapshot')
+        NumberRecognizer(Culture.English).get_number_model()
+        ModelFactory.save_snapshot(path, [Culture.English])
+        with open(path, 'rb') as file:
+            header = pickle.load(file)
+            rest = file.read()
+        header['packages'] = dict(header['packages'], **{'recognizers-text': '0.0.1'})
+        with open(path, 'wb') as file:
+            pickle.dump(header, file)
+            file.write(rest)
+
+        with pytest.raises(ValueError):
+            ModelFactory.load_snapshot(path)
@@ -0,0 +1,38 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import regex
+from recognizers_text.utilities import RegExpUtility, PatternRegistry
+
+
+class TestPatternRegistry:
+    def test_same_source_and_flags_are_interned(self):
+        before = PatternRegistry.stats()
+
+        first = RegExpUtility.get_safe_reg_exp(r'\binterned-one\b')
+        second = RegExpUtility.get_safe_reg_exp(r'\binterned-one\b')
+        other_flags = RegExpUtility.get_safe_reg_exp(r'\binterned-one\b', regex.S)
+
+        after = PatternRegistry.stats()
+        assert first is second
+        assert first is not other_flags
+        assert after['misses'] - before['misses'] == 2
+        assert after['hits'] - before['hits'] == 1
+
+    def test_manifest_lists_compiled_patterns_only(self):
+        used = RegExpUtility.get_safe_reg_exp(r'manifest-used')
+        unused = RegExpUtility.get_safe_reg_exp(r'manifest-unused')
+        used.search('manifest-used')
+
+        manifest = PatternRegistry.export_manifest()
+        assert [used.pattern, regex.I | regex.S] in manifest
+        assert [unused.pattern, regex.I | regex.S] not in manifest
+
+    def test_preload_from_file(self, tmp_path):
+        path = str(tmp_path / 'patterns.json')
+        RegExpUtility.get_safe_reg_exp(r'preload-\d+').search('preload-1')
+        PatternRegistry.export_manifest(path)
+
+        assert PatternRegistry.preload([['preload-new-\\d+', regex.I]]) == 1
+        assert RegExpUtility.get_safe_reg_exp('preload-new-\\d+', regex.I).is_compiled
+        assert PatternRegistry.preload(path) == 0
@@ -0,0 +1,41 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import regex
+from recognizers_text import Culture, Prefilter
+from recognizers_text.utilities import RegExpUtility
+from recognizers_sequence.sequence.sequence_recognizer import recognize_email
+
+
+class TestPrefilter:
+    def test_requires_one_character_of_every_pattern(self):
+        prefilter = Prefilter([RegExpUtility.get_safe_reg_exp(r'\w+@\w+'), r'#(?<tag>\w+)'], 'test-characters')
+
+        assert prefilter.enabled
+        assert prefilter.may_match('mail me at a@b')
+        assert prefilter.may_match('#hashtag')
+        assert not prefilter.may_match('nothing to see here')
+
+    def test_picks_rarest_element_and_unites_alternatives(self):
+        prefilter = Prefilter([r'(?<!\p{L})\+\d+|ext\.\s*\d+'], 'test-alternatives')
+
+        assert prefilter.requirement.pattern == r'[\+\.]'
+        assert prefilter.may_match('ext. 12')
+        assert not prefilter.may_match('call me at 12')
+
+    def test_follows_the_case_of_the_patterns(self):
+        assert Prefilter([RegExpUtility.get_safe_reg_exp(r'x')], 'test-case').may_match('X')
+        assert not Prefilter([regex.compile(r'x')], 'test-case').may_match('X')
+
+    def test_lets_everything_through_when_a_pattern_has_no_requirement(self):
+        for patterns in [[r'@', r'\w+'], [r'a?'], [r'(?i)a(?-i:b)'], [r'[[:alpha:]]'], []]:
+            prefilter = Prefilter(patterns, 'test-disabled')
+            assert not prefilter.enabled
+            assert prefilter.may_match('anything')
+
+    def test_extractor_skips_and_counts(self):
+        before = Prefilter.stats().get('EnglishEmailExtractor', {}).get('skips', 0)
+
+        assert recognize_email('no address in here', Culture.English) == []
+        assert len(recognize_email('write to someone@example.com', Culture.English)) == 1
+        assert Prefilter.stats()['EnglishEmailExtractor']['skips'] == before + 1
@@ -0,0 +1,36 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from recognizers_text import Culture
+from recognizers_text.utilities import QueryProcessor, PreprocessedQuery
+from recognizers_number import recognize_number
+from recognizers_number_with_unit import recognize_dimension
+
+
+class TestPreprocessedQuery:
+    def test_recodes_full_width_characters_and_keeps_special_tokens(self):
+        assert QueryProcessor.preprocess('１２，５％ ＫＭ') == '12,5% km'
+        assert QueryProcessor.preprocess('Give me 10 MB', True) == 'give me 10 MB'
+        assert QueryProcessor.preprocess('１２', recode=False) == '１２'
+
+    def test_normalizes_once_per_form(self):
+        query = PreprocessedQuery('Give me 10 MB')
+
+        assert query == 'Give me 10 MB'
+        assert QueryProcessor.preprocess(query) is QueryProcessor.preprocess(query)
+        assert QueryProcessor.preprocess(query, True) == 'give me 10 MB'
+
+    def test_maps_offsets_back_to_original(self):
+        query = PreprocessedQuery('İstanbul 5')
+
+        assert len(query.normalized()) == len(query) + 1
+        assert query.to_original(query.normalized().index('5')) == query.index('5')
+        assert PreprocessedQuery('plain').to_original(3) == 3
+
+    def test_models_accept_shared_query(self):
+        query = PreprocessedQuery('It is 10 MB and twelve meters')
+
+        assert [r.text for r in recognize_number(query, Culture.English)] == \
+            [r.text for r in recognize_number(str(query), Culture.English)]
+        assert [r.text for r in recognize_dimension(query, Culture.English)] == \
+            [r.text for r in recognize_dimension(str(query), Culture.English)]
@@ -0,0 +1,55 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import json
+import pytest
+from recognizers_text import Culture, Profiler
+from recognizers_text.utilities import RegExpUtility
+from recognizers_date_time import recognize_datetime
+from recognizers_date_time.date_time.base_date import BaseDateExtractor
+from recognizers_date_time.date_time.base_dateperiod import BaseDatePeriodExtractor
+
+
+class TestProfiling:
+    def test_records_nested_extractors_and_regexes(self):
+        recognize_datetime('warm up', Culture.English)
+
+        with Profiler() as profiler:
+            recognize_datetime('I will be out from 5th of May to 7th of May 2018', Culture.English)
+
+        assert profiler.stats['BaseDatePeriodExtractor.extract'].calls >= 1
+        assert profiler.stats['BaseDateExtractor.extract'].calls >= 1
+        assert profiler.stats['BaseDateExtractor.extract'].total_length > 0
+        assert any(name.startswith('regex ') for name in profiler.stats)
+
+    def test_restores_methods_on_exit(self):
+        pattern = RegExpUtility.get_safe_reg_exp(r'profiled\s+pattern')
+        extract = BaseDateExtractor.__dict__['extract']
+
+        with Profiler():
+            assert BaseDateExtractor.__dict__['extract'] is not extract
+            assert pattern.search('a profiled  pattern')
+
+        assert BaseDateExtractor.__dict__['extract'] is extract
+        assert BaseDatePeriodExtractor.extract is BaseDatePeriodExtractor.__dict__['extract']
+        assert 'search' not in pattern.__dict__
+
+    def test_callback_and_dump(self, tmp_path):
+        calls = []
+        pattern = RegExpUtility.get_safe_reg_exp(r'callback\s+pattern')
+
+        with Profiler(callback=lambda name, elapsed, length: calls.append((name, length))) as profiler:
+            pattern.match('callback pattern')
+
+        assert (r'regex callback\s+pattern', len('callback pattern')) in calls
+        path = tmp_path / 'profile.json'
+        profiler.dump(str(path))
+        stats = json.loads(path.read_text(encoding='utf-8'))[r'regex callback\s+pattern']
+        assert stats['calls'] == 1
+        assert sum(stats['histogram_us'].values()) == 1
+        assert 'callback' in profiler.report()
+
+    def test_only_one_profiler_is_active(self):
+        with Profiler(regexes=False):
+            with pytest.raises(RuntimeError):
+                Profiler(regexes=False).__enter__()
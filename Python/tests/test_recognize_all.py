@@ -0,0 +1,54 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from datetime import datetime
+import pytest
+from recognizers_suite import Culture, recognize_all, recognize_number, recognize_ordinal, recognize_currency, recognize_datetime
+from recognizers_text.extractor import memoize_extraction
+from recognizers_number.number import extractors
+
+QUERY = 'I paid twenty dollars on the second of March, and 3 more'
+REFERENCE = datetime(2016, 11, 7)
+
+
+def as_dicts(results):
+    return [result.get_dict() for result in results]
+
+
+class TestRecognizeAll:
+    def test_results_match_the_single_model_functions(self):
+        expected = recognize_number(QUERY, Culture.English) + recognize_currency(QUERY, Culture.English) + \
+            recognize_datetime(QUERY, Culture.English, reference=REFERENCE)
+        expected.sort(key=lambda result: (result.start, result.end))
+
+        results = recognize_all(QUERY, Culture.English, ['number', 'currency', 'datetime'], reference=REFERENCE)
+
+        assert as_dicts(results) == as_dicts(expected)
+        assert {result.type_name for result in results} == {'number', 'currency', 'datetimeV2.date'}
+
+    def test_models_share_the_number_extraction(self, monkeypatch):
+        calls = []
+        original = extractors.BaseNumberExtractor.extract.__wrapped__
+
+        def extract(extractor, source):
+            calls.append((id(extractor), source))
+            return original(extractor, source)
+
+        monkeypatch.setattr(extractors.BaseNumberExtractor, 'extract', memoize_extraction(extract))
+
+        recognize_ordinal(QUERY, Culture.English)
+        recognize_datetime(QUERY, Culture.English)
+        assert len(set(calls)) < len(calls)
+
+        calls.clear()
+        recognize_all(QUERY, Culture.English, ['ordinal', 'datetime'])
+        assert len(set(calls)) == len(calls)
+
+    def test_unknown_model_raises(self):
+        with pytest.raises(ValueError):
+            recognize_all(QUERY, Culture.English, ['number', 'colour'])
+
+    def test_every_model_runs_by_default(self):
+        results = recognize_all('Call 555-123-4567 or mail me@contoso.com, yes', Culture.English)
+
+        assert {'phonenumber', 'email', 'boolean'} <= {result.type_name for result in results}
@@ -0,0 +1,62 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from datetime import datetime
+import pytest
+from recognizers_text import Culture, RecognizerPool
+from recognizers_text.utilities import PatternRegistry
+from recognizers_number import NumberRecognizer
+from recognizers_date_time import DateTimeRecognizer
+
+
+class TestRecognizerPool:
+    queries = ['I have two apples', 'no numbers', 'one hundred and twenty three', '3.5 and 7', ''] * 20
+
+    @staticmethod
+    def to_dicts(results):
+        return [[r.get_dict() for r in result] for result in results]
+
+    @pytest.mark.parametrize('processes', [0, 2])
+    def test_results_are_ordered(self, processes):
+        recognizer = NumberRecognizer(Culture.English)
+        expected = recognizer.get_number_model().parse_batch(self.queries)
+
+        with RecognizerPool(recognizer, 'NumberModel', processes=processes, chunk_size=7,
+                            max_pending_chunks=2) as pool:
+            actual = pool.map(self.queries)
+
+        assert self.to_dicts(actual) == self.to_dicts(expected)
+
+    def test_reference_is_forwarded(self):
+        reference = datetime(2018, 1, 1)
+        queries = ['see you tomorrow', 'next monday at 5pm']
+        recognizer = DateTimeRecognizer(Culture.English)
+        expected = recognizer.get_datetime_model().parse_batch(queries, reference)
+
+        with RecognizerPool(recognizer, 'DateTimeModel', processes=2, chunk_size=1) as pool:
+            actual = list(pool.imap(iter(queries), reference))
+
+        assert self.to_dicts(actual) == self.to_dicts(expected)
+
+    def test_model_patterns_are_compiled_before_forking(self):
+        unused = PatternRegistry.get('pattern no model uses', 0)
+        recognizer = NumberRecognizer(Culture.English)
+
+        with RecognizerPool(recognizer, 'NumberModel', processes=1, warmup=['two apples']) as pool:
+            compiled = PatternRegistry.stats()['compiled']
+
+            assert pool.model.parse('two apples')[0].resolution['value'] == '2'
+            assert PatternRegistry.stats()['compiled'] == compiled
+            assert not unused.is_compiled
+
+    @pytest.mark.parametrize('processes', [0, 2])
+    def test_timeout_is_forwarded(self, processes):
+        recognizer = NumberRecognizer(Culture.English)
+
+        with RecognizerPool(recognizer, 'NumberModel', processes=processes) as pool:
+            assert pool.map(['two apples', '3.5 and 7'], timeout_ms=0) == [[], []]
+            assert len(pool.map(['two apples', '3.5 and 7'], timeout_ms=10000)[1]) == 2
+
+    def test_invalid_chunk_size_throw_error(self):
+        with pytest.raises(ValueError):
+            RecognizerPool(NumberRecognizer(Culture.English), 'NumberModel', chunk_size=0)
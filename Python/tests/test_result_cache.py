@@ -0,0 +1,149 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import time
+from datetime import datetime, timedelta
+from threading import Event, Thread
+from recognizers_text import Culture, ModelResult, CachedModel, LruCacheBackend, SqliteCacheBackend, TimeBudget, fold_case
+from recognizers_text.model import Model
+from recognizers_date_time import DateTimeRecognizer
+
+
+class CountingModel(Model):
+    def __init__(self):
+        self.calls = []
+
+    @property
+    def model_type_name(self) -> str:
+        return 'counting'
+
+    def parse(self, query: str, timeout_ms: float = None):
+        self.calls.append(query)
+        result = ModelResult()
+        result.text, result.start, result.end, result.type_name = query, 0, len(query) - 1, 'counting'
+        result.resolution = {'value': str(len(self.calls))}
+        return [result]
+
+
+class TimingOutModel(CountingModel):
+    def __init__(self, timeouts=(), started=None, resume=None):
+        super().__init__()
+        self.timeouts = timeouts
+        self.started, self.resume = started, resume
+
+    def parse(self, query: str, timeout_ms: float = None):
+        with TimeBudget(timeout_ms):
+            if self.started is not None:
+                self.started.set()
+                self.resume.wait(5)
+            if query in self.timeouts:
+                TimeBudget.run(self.__time_out)
+            return super().parse(query)
+
+    @staticmethod
+    def __time_out():
+        raise TimeoutError()
+
+
+class TestResultCache:
+    def test_same_queries_hit_the_cache(self):
+        model = CountingModel()
+        cached = CachedModel(model, Culture.English)
+
+        first = cached.parse('two hundred dollars')
+        second = cached.parse('two hundred dollars')
+        other_case = cached.parse('Two hundred dollars')
+
+        assert len(model.calls) == 2
+        assert second[0].resolution == first[0].resolution
+        assert other_case[0].text == 'Two hundred dollars'
+        stats = cached.stats()
+        assert (stats['hits'], stats['misses'], stats['hit_rate']) == (1, 2, 1 / 3)
+
+    def test_case_folding_is_opt_in(self):
+        model = CountingModel()
+        cached = CachedModel(model, Culture.English, normalize=fold_case)
+
+        first = cached.parse('Two hundred dollars')
+        second = cached.parse('two hundred dollars')
+
+        assert len(model.calls) == 1
+        assert second[0].text == first[0].text == 'Two hundred dollars'
+
+    def test_results_of_timed_out_calls_are_not_stored(self):
+        model = TimingOutModel(timeouts={'slow'})
+        cached = CachedModel(model, Culture.English)
+
+        cached.parse('slow', timeout_ms=1000)
+        cached.parse('slow', timeout_ms=1000)
+        cached.parse('fast', timeout_ms=1000)
+
+        assert model.calls == ['slow', 'slow', 'fast']
+        assert cached.stats()['stores'] == 1
+
+    def test_timeouts_of_other_threads_do_not_skip_stores(self):
+        started, resume = Event(), Event()
+        cached = CachedModel(TimingOutModel(started=started, resume=resume), Culture.English)
+        other = CachedModel(TimingOutModel(timeouts={'slow'}), Culture.English)
+
+        thread = Thread(target=cached.parse, args=('fast',), kwargs={'timeout_ms': 1000})
+        thread.start()
+        started.wait(5)
+        other.parse('slow', timeout_ms=1000)
+        resume.set()
+        thread.join()
+
+        assert cached.stats()['stores'] == 1
+        assert other.stats()['stores'] == 0
+
+    def test_cached_results_are_independent_copies(self):
+        cached = CachedModel(CountingModel(), Culture.English)
+
+        cached.parse('next week')[0].resolution['value'] = 'corrupted'
+
+        assert cached.parse('next week')[0].resolution['value'] == '1'
+
+    def test_lru_backend_evicts_and_expires(self):
+        backend = LruCacheBackend(max_size=2, ttl=0.05)
+        model = CountingModel()
+        cached = CachedModel(model, Culture.English, backend=backend)
+
+        for query in ['one', 'two', 'three', 'three']:
+            cached.parse(query)
+        time.sleep(0.1)
+        cached.parse('three')
+
+        assert model.calls == ['one', 'two', 'three', 'three']
+        assert backend.stats()['evictions'] == 1
+        assert backend.stats()['expirations'] == 1
+
+    def test_sqlite_backend_is_shared_between_caches(self, tmp_path):
+        path = str(tmp_path / 'results.db')
+        first_model, second_model = CountingModel(), CountingModel()
+
+        CachedModel(first_model, Culture.English, backend=SqliteCacheBackend(path)).parse('five')
+        result = CachedModel(second_model, Culture.English, backend=SqliteCacheBackend(path)).parse('five')
+
+        assert second_model.calls == []
+        assert result[0].resolution == {'value': '1'}
+
+    def test_reference_is_truncated_to_the_granularity(self):
+        model = DateTimeRecognizer(Culture.English).get_datetime_model()
+        cached = CachedModel(model, Culture.English, reference_granularity=timedelta(days=1))
+
+        morning = cached.parse('tomorrow', datetime(2016, 11, 7, 9, 30))
+        evening = cached.parse('tomorrow', datetime(2016, 11, 7, 21, 0))
+        next_day = cached.parse('tomorrow', datetime(2016, 11, 8, 9, 30))
+
+        assert morning[0].resolution == evening[0].resolution
+        assert next_day[0].resolution['values'][0]['value'] == '2016-11-09'
+        assert cached.stats()['hits'] == 1
+
+    def test_reference_models_bypass_without_granularity(self):
+        model = DateTimeRecognizer(Culture.English).get_datetime_model()
+        cached = CachedModel(model, Culture.English)
+
+        cached.parse('tomorrow', datetime(2016, 11, 7))
+
+        assert cached.stats()['bypasses'] == 1
+        assert cached.stats()['size'] == 0
@@ -0,0 +1,95 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import pickle
+from recognizers_text import ExtractResult, ParseResult, ModelResult
+from recognizers_text.extractor import Metadata
+from recognizers_text.meta_data import MetaData
+from recognizers_text.matcher.match_result import MatchResult
+from recognizers_date_time.date_time.models import DateTimeModelResult
+from recognizers_date_time.date_time.parsers import DateTimeParseResult
+from recognizers_date_time.date_time.utilities import Token
+
+
+def make_extract_result(start: int, text: str, data=None) -> ExtractResult:
+    result = ExtractResult()
+    result.start = start
+    result.length = len(text)
+    result.text = text
+    result.type = 'number'
+    result.data = data
+    return result
+
+
+class TestResultCopy:
+    def test_extract_result_copy_is_independent(self):
+        inner = make_extract_result(0, 'two')
+        source = make_extract_result(0, 'two apples', {'numbers': [inner], 'unit': 'apple'})
+        source.meta_data = MetaData()
+
+        result = source.copy()
+        result.data['numbers'][0].text = 'three'
+        result.meta_data.has_mod = True
+
+        assert (result.start, result.length, result.text, result.type) == (0, 10, 'two apples', 'number')
+        assert inner.text == 'two'
+        assert source.meta_data.has_mod is False
+
+    def test_parse_result_copy_keeps_subclass_fields(self):
+        source = DateTimeParseResult(make_extract_result(3, 'today'))
+        source.value = {'timex': '2016-11-07'}
+        source.timex_str = '2016-11-07'
+        source.metadata = Metadata()
+
+        result = source.copy()
+
+        assert type(result) is DateTimeParseResult
+        assert result.timex_str == '2016-11-07'
+        assert result.value == source.value and result.value is not source.value
+        assert result.metadata is not source.metadata
+
+    def test_slotted_results_have_no_instance_dict(self):
+        result = ParseResult(make_extract_result(0, 'one'))
+        result.metadata = Metadata()
+
+        restored = pickle.loads(pickle.dumps(result.copy()))
+
+        assert restored.text == 'one'
+        assert isinstance(restored.metadata, Metadata)
+        assert not hasattr(make_extract_result(0, 'one'), 'metadata')
+        assert not hasattr(result, '__dict__') and not hasattr(ModelResult(), '__dict__')
+
+    def test_model_result_copy(self):
+        source = ModelResult()
+        source.text, source.start, source.end, source.type_name = 'two', 0, 2, 'number'
+        source.resolution = {'values': [{'value': '2'}]}
+
+        result = source.copy()
+        result.resolution['values'][0]['value'] = '3'
+
+        assert source.resolution['values'][0]['value'] == '2'
+        assert source.get_dict()['Text'] == result.get_dict()['Text']
+
+    def test_date_time_model_result_copy_keeps_the_timex(self):
+        source = DateTimeModelResult()
+        source.text, source.start, source.end, source.type_name = 'today', 0, 4, 'datetimeV2.date'
+        source.resolution = {'values': [{'timex': '2016-11-07'}]}
+        source.timex_str = '2016-11-07'
+
+        result = source.copy()
+
+        assert type(result) is DateTimeModelResult
+        assert result.timex_str == '2016-11-07'
+
+    def test_token_and_match_result_copy(self):
+        token = Token(2, 7, Metadata())
+        match = MatchResult(1, 2, ['apple'])
+        match.text = 'an apple'
+
+        token_copy = token.copy()
+        match_copy = match.copy()
+        match_copy.canonical_values.append('pear')
+
+        assert (token_copy.start, token_copy.end) == (2, 7) and token_copy.metadata is not token.metadata
+        assert (match_copy.start, match_copy.length, match_copy.text) == (1, 2, 'an apple')
+        assert match.canonical_values == ['apple']
@@ -0,0 +1,57 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import io
+from datetime import datetime
+import pytest
+from recognizers_text import Culture, StreamingRecognizer
+from recognizers_number import NumberRecognizer
+from recognizers_date_time import DateTimeRecognizer
+from documents import document, summary
+
+
+class TestStreamingRecognizer:
+    def test_results_match_parsing_the_whole_text(self):
+        model = NumberRecognizer(Culture.English).get_number_model()
+        text = document(80)
+
+        results = list(StreamingRecognizer(model, max_entity_length=32, window_size=128).parse_stream(io.StringIO(text)))
+
+        assert summary(results) == summary(model.parse(text))
+        assert all(text[result.start:result.end + 1].lower() == result.text for result in results)
+
+    def test_entities_across_window_boundaries_are_found_once(self):
+        model = DateTimeRecognizer(Culture.English).get_datetime_model()
+        reference = datetime(2016, 11, 7)
+        text = document(40)
+
+        # Chunks of every size put the window boundaries at every place in the sentences
+        for size in (7, 50, 113):
+            chunks = [text[i:i + size] for i in range(0, len(text), size)]
+            streaming = StreamingRecognizer(model, max_entity_length=40, window_size=200)
+
+            results = list(streaming.parse_stream(chunks, reference=reference))
+
+            assert summary(results) == summary(model.parse(text, reference))
+
+    def test_input_is_read_as_results_are_consumed(self):
+        model = NumberRecognizer(Culture.English).get_number_model()
+        read = []
+
+        def lines():
+            for i in range(1000):
+                read.append(i)
+                yield f'Line {i} has seven words and twelve letters.\n'
+
+        results = StreamingRecognizer(model).parse_stream(lines())
+        first = next(results)
+
+        assert first.text == '0'
+        assert len(read) < 100
+        assert sum(1 for _ in results) == 2999
+
+    def test_window_must_fit_the_overlaps(self):
+        model = NumberRecognizer(Culture.English).get_number_model()
+
+        with pytest.raises(ValueError):
+            StreamingRecognizer(model, max_entity_length=64, window_size=200)
@@ -0,0 +1,74 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import regex
+from recognizers_text import Culture, TimeBudget
+from recognizers_text.utilities import RegExpUtility
+from recognizers_number import NumberRecognizer, recognize_number
+from recognizers_date_time import DateTimeRecognizer
+
+# Backtracks exponentially on a run of 'a' that isn't followed by the end of the string
+PATHOLOGICAL_PATTERN = RegExpUtility.get_safe_reg_exp(r'^(a|aa)+$')
+PATHOLOGICAL_INPUT = 'a' * 40 + 'b'
+
+
+class TestTimeBudget:
+    def test_run_returns_fallback_when_budget_runs_out(self):
+        before = TimeBudget.stats()
+        start = time.perf_counter()
+
+        with TimeBudget(50) as budget:
+            result = TimeBudget.run(PATHOLOGICAL_PATTERN.search, PATHOLOGICAL_INPUT, fallback=[])
+
+        assert result == []
+        assert budget.timed_out
+        assert time.perf_counter() - start < 1
+        assert TimeBudget.stats()['timeouts'] == before['timeouts'] + 1
+
+    def test_patterns_are_unbounded_outside_run(self):
+        with TimeBudget(0):
+            assert PATHOLOGICAL_PATTERN.search('aaaa')
+            assert TimeBudget.run(PATHOLOGICAL_PATTERN.search, 'aaaa', fallback=[]) == []
+
+        assert TimeBudget.run(PATHOLOGICAL_PATTERN.search, 'aaaa', fallback=[])
+        assert TimeBudget.current() is None
+
+    def test_budgets_only_bound_their_own_context(self):
+        with ThreadPoolExecutor(max_workers=1) as executor, TimeBudget(0):
+            assert TimeBudget.run(PATHOLOGICAL_PATTERN.search, 'aaaa', fallback=[]) == []
+            assert executor.submit(TimeBudget.run, PATHOLOGICAL_PATTERN.search, 'aaaa', fallback=[]).result()
+
+    def test_explicit_timeouts_still_apply(self):
+        with pytest.raises(TimeoutError):
+            PATHOLOGICAL_PATTERN.search(PATHOLOGICAL_INPUT, timeout=0.05)
+
+    def test_module_functions_are_bounded(self):
+        with TimeBudget(50) as budget:
+            result = TimeBudget.run(regex.search, PATHOLOGICAL_PATTERN, PATHOLOGICAL_INPUT, fallback=[])
+
+        assert result == []
+        assert budget.timed_out
+
+    def test_model_returns_no_results_once_budget_is_spent(self):
+        model = NumberRecognizer(Culture.English).get_number_model()
+
+        assert model.parse('I have two apples', timeout_ms=0) == []
+        assert [r.text for r in model.parse('I have two apples', timeout_ms=10000)] == ['two']
+
+    def test_batches_and_helpers_forward_the_budget(self):
+        model = NumberRecognizer(Culture.English).get_number_model()
+
+        assert model.parse_batch(['two apples', 'three pears'], timeout_ms=0) == [[], []]
+        assert recognize_number('I have two apples', Culture.English, timeout_ms=0) == []
+        assert [r.text for r in recognize_number('I have two apples', Culture.English, timeout_ms=10000)] == ['two']
+
+    def test_datetime_model_keeps_results_within_budget(self):
+        model = DateTimeRecognizer(Culture.English).get_datetime_model()
+        query = "I'll go back 8pm today"
+
+        expected = [(r.text, r.resolution) for r in model.parse(query)]
+        assert [(r.text, r.resolution) for r in model.parse(query, timeout_ms=10000)] == expected
+        assert model.parse(query, timeout_ms=0) == []